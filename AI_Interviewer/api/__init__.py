@@ -1,5 +1,6 @@
 from .models import Interview, InterviewFeedback, ChatMessage, DsaQuestionBank, CodeSubmission
 from .database import Database
+from .async_database import AsyncDatabase
 from .openai_service import OpenAIService
 
 __all__ = [
@@ -9,5 +10,6 @@ __all__ = [
     'ChatMessage',
     'CodeSubmission',
     'Database',
+    'AsyncDatabase',
     'OpenAIService'
 ]
@@ -0,0 +1,139 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from .database import Database
+from .chat_buffer import ChatWriteBuffer
+from .conversation_cache import ConversationCache
+from .models import Interview, InterviewFeedback, ChatMessage, DsaQuestionBank
+from config import DB_THREADPOOL_SIZE
+
+
+class AsyncDatabase:
+    """Awaitable facade over Database for the async endpoints.
+
+    mysql-connector and boto3 block, so every call runs on a bounded thread
+    pool instead of the event loop; other interviews keep being served while
+    a query or DynamoDB request is in flight.
+
+    Chat messages are written behind: saving one queues it on a
+    ChatWriteBuffer and returns at once, and chat history reads include the
+    messages still queued. Interviews and chat histories are served from a
+    ConversationCache, which this facade keeps up to date on writes.
+
+    Args:
+        database: Database to wrap. A new one is created if omitted.
+        max_workers: Number of threads running database calls.
+    """
+
+    def __init__(self, database: Optional[Database] = None, max_workers: int = DB_THREADPOOL_SIZE):
+        self.database = database or Database()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db")
+        self.chat_buffer = ChatWriteBuffer(self.database)
+        self.conversations = ConversationCache()
+
+    async def _run(self, method, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, *args, **kwargs))
+
+    async def create_interview(self, interview: Interview) -> Interview:
+        created = await self._run(self.database.create_interview, interview)
+        self.conversations.put_interview(created)
+        return created
+
+    async def get_interview_summaries(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+        return await self._run(self.database.get_interview_summaries, limit, cursor)
+
+    async def get_interview(self, interview_id: str) -> Optional[Interview]:
+        interview = self.conversations.get_interview(interview_id)
+        if interview is None:
+            interview = await self._run(self.database.get_interview, interview_id)
+            if interview is not None:
+                self.conversations.put_interview(interview)
+        return interview
+
+    async def update_interview(self, interview: Interview) -> Interview:
+        updated = await self._run(self.database.update_interview, interview)
+        self.conversations.put_interview(updated)
+        return updated
+
+    async def save_chat_message(self, message: ChatMessage) -> ChatMessage:
+        self.chat_buffer.add(message)
+        self.conversations.append_message(message)
+        return message
+
+    async def get_all_interviews(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[Interview], Optional[str]]:
+        return await self._run(self.database.get_all_interviews, limit, cursor)
+
+    async def get_interviews_by_user(self, username: str, limit: Optional[int] = None,
+                                     cursor: Optional[str] = None) -> Tuple[List[Interview], Optional[str]]:
+        return await self._run(self.database.get_interviews_by_user, username, limit, cursor)
+
+    async def get_chat_history(self, interview_id: str) -> List[ChatMessage]:
+        messages = self.conversations.get_messages(interview_id)
+        if messages is None:
+            messages = await self._load_chat_history(interview_id)
+        return messages
+
+    async def get_recent_chat_history(self, interview_id: str, limit: int) -> List[ChatMessage]:
+        """Get the last `limit` messages of an interview."""
+        messages = self.conversations.get_messages(interview_id, limit)
+        if messages is None:
+            messages = (await self._load_chat_history(interview_id, limit))[-limit:]
+        return messages
+
+    async def iter_chat_history(self, interview_id: str):
+        """Yield the messages of an interview in timestamp order, a query page at a time."""
+        messages = self.conversations.get_messages(interview_id)
+        if messages is not None:
+            yield messages
+            return
+
+        pending = self.chat_buffer.pending_for(interview_id)
+        seen = set()
+        pages = self.database.iter_chat_history(interview_id)
+        while True:
+            page = await self._run(next, pages, None)
+            if page is None:
+                break
+            seen.update(message.message_id for message in page)
+            yield page
+        # Messages not written yet are the newest ones
+        unwritten = [message for message in pending if message.message_id not in seen]
+        if unwritten:
+            yield unwritten
+
+    async def _load_chat_history(self, interview_id: str, last_n: Optional[int] = None) -> List[ChatMessage]:
+        # Taken before the query, so a message flushed meanwhile is still seen
+        pending = self.chat_buffer.pending_for(interview_id)
+        written = await self._run(self.database.get_chat_history, interview_id, last_n)
+        # Fewer messages than asked for means the whole history was read
+        complete = last_n is None or len(written) < last_n
+        return self.conversations.put_messages(interview_id, self.chat_buffer.merge(written, pending), complete)
+
+    async def save_feedback(self, feedback: InterviewFeedback) -> InterviewFeedback:
+        return await self._run(self.database.save_feedback, feedback)
+
+    async def delete_chat_history(self, interview_id: str) -> bool:
+        await self._run(self.chat_buffer.discard, interview_id)
+        self.conversations.invalidate_messages(interview_id)
+        return await self._run(self.database.delete_chat_history, interview_id)
+
+    async def get_question_by_id(self, question_id: str) -> Optional[DsaQuestionBank]:
+        return await self._run(self.database.get_question_by_id, question_id)
+
+    async def reload_question_bank(self) -> int:
+        return await self._run(self.database.reload_question_bank)
+
+    async def get_seen_question_ids(self, candidate_name: str) -> List[str]:
+        return await self._run(self.database.get_seen_question_ids, candidate_name)
+
+    async def get_random_question(self, difficulty: Optional[int] = None,
+                                  exclude_ids: Optional[List[str]] = None) -> Optional[DsaQuestionBank]:
+        return await self._run(self.database.get_random_question, difficulty, exclude_ids)
+
+    def close(self):
+        self.chat_buffer.close()
+        self._executor.shutdown(wait=True)
+        self.database.close()
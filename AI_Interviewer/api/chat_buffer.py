@@ -0,0 +1,277 @@
+import os
+import glob
+import json
+import time
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import List
+
+from botocore.exceptions import BotoCoreError, ClientError, ParamValidationError
+
+from .models import ChatMessage
+from config import CHAT_WRITE_BUFFER
+
+# DynamoDB error codes worth retrying; any other client error will fail again
+RETRYABLE_ERROR_CODES = {
+    'ProvisionedThroughputExceededException', 'ThrottlingException', 'RequestLimitExceeded',
+    'InternalServerError', 'ServiceUnavailable', 'LimitExceededException'
+}
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a failed write may succeed if tried again (throttling, 5xx, network errors)."""
+    if isinstance(error, ClientError):
+        status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode') or 0
+        return error.response.get('Error', {}).get('Code') in RETRYABLE_ERROR_CODES or status >= 500
+    if isinstance(error, ParamValidationError):
+        return False
+    return isinstance(error, (BotoCoreError, ConnectionError, TimeoutError))
+
+
+def _process_path(path: str) -> str:
+    """Add the process ID to a file name, so workers sharing a directory don't share the file."""
+    base, extension = os.path.splitext(path)
+    return f"{base}.{os.getpid()}{extension}"
+
+
+class ChatWriteBuffer:
+    """Write-behind buffer for chat messages.
+
+    Saving a message only records it in memory; a background thread writes
+    pending messages to DynamoDB in batches. Messages stay pending until a
+    batch containing them succeeds, so a failed flush is retried on the next
+    one and nothing is acknowledged as written before it is. Only
+    throttling, 5xx and network errors are retried: when a batch fails
+    otherwise, its messages are written one at a time and those DynamoDB
+    rejects (e.g. items over 400 KB) are moved to a quarantine file, so they
+    cannot hold up every other interview.
+
+    On close, the remaining messages are flushed; any DynamoDB still refuses
+    are written to this process's spill file. Every spill file is replayed
+    the next time a buffer starts. Delivery is at least once: a message may
+    be written twice (also when two workers replay the same spill file),
+    which is harmless since the write is keyed by message_id.
+
+    Args:
+        database: Database whose save_chat_messages performs the writes.
+        flush_interval: Seconds between background flushes.
+        max_batch_size: Pending messages that trigger an early flush; also
+            the most messages written per batch.
+        spill_path: Name of the files holding messages that could not be
+            written on close; each process adds its ID to it.
+        quarantine_path: Name of the files messages DynamoDB rejected are
+            appended to; each process adds its ID to it.
+    """
+
+    def __init__(self, database, flush_interval: float = CHAT_WRITE_BUFFER['flush_interval_seconds'],
+                 max_batch_size: int = CHAT_WRITE_BUFFER['max_batch_size'],
+                 spill_path: str = CHAT_WRITE_BUFFER['spill_path'],
+                 quarantine_path: str = CHAT_WRITE_BUFFER['quarantine_path']):
+        self.database = database
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.spill_path = spill_path
+        self.quarantine_path = quarantine_path
+
+        # message_id -> message, in arrival order
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()
+        # Serialises flushes between the background thread and close()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        # Spill files whose messages are pending again, removed once they are written
+        self._replayed_paths = []
+
+        self._load_spill()
+        self._thread = threading.Thread(target=self._run, name="chat-write-behind", daemon=True)
+        self._thread.start()
+
+    def add(self, message: ChatMessage) -> ChatMessage:
+        """Queue a message for writing and return it immediately."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Chat write buffer is closed")
+            self._pending[message.message_id] = message
+            if len(self._pending) >= self.max_batch_size:
+                self._wake.set()
+        return message
+
+    def pending_for(self, interview_id: str) -> List[ChatMessage]:
+        """Get the messages of an interview that are not written yet."""
+        with self._lock:
+            return [message for message in self._pending.values() if message.interview_id == interview_id]
+
+    def discard(self, interview_id: str) -> int:
+        """Drop the pending messages of an interview (e.g. before deleting its history).
+
+        Blocks until a batch already being written has finished, so none of
+        the interview's messages are written after this returns.
+        """
+        with self._lock:
+            message_ids = [message_id for message_id, message in self._pending.items()
+                           if message.interview_id == interview_id]
+            for message_id in message_ids:
+                del self._pending[message_id]
+        with self._flush_lock:
+            pass
+        return len(message_ids)
+
+    @staticmethod
+    def merge(written: List[ChatMessage], pending: List[ChatMessage]) -> List[ChatMessage]:
+        """Combine written history with pending messages, in timestamp order."""
+        if not pending:
+            return written
+        seen = {message.message_id for message in written}
+        merged = written + [message for message in pending if message.message_id not in seen]
+        merged.sort(key=lambda message: message.timestamp)
+        return merged
+
+    def flush(self) -> int:
+        """Write all pending messages now; returns how many were written or quarantined.
+
+        Raises:
+            Exception: A retryable DynamoDB error; unwritten messages stay pending.
+        """
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = list(self._pending.values())[:self.max_batch_size]
+                if not batch:
+                    if self._replayed_paths:
+                        # Everything replayed from the spill files is written now
+                        self._remove_replayed()
+                    return written
+                try:
+                    self.database.save_chat_messages(batch)
+                except Exception as e:
+                    if is_retryable(e):
+                        raise
+                    self._write_individually(batch, e)
+                self._drop(batch)
+                written += len(batch)
+
+    def _drop(self, messages: List[ChatMessage]):
+        with self._lock:
+            for message in messages:
+                # A message re-added while in flight may have changed; only drop the written version
+                if self._pending.get(message.message_id) is message:
+                    del self._pending[message.message_id]
+
+    def _write_individually(self, batch: List[ChatMessage], batch_error: Exception):
+        """Find the messages of a rejected batch DynamoDB will never accept, and quarantine them."""
+        print(f"Chat message batch rejected, writing its {len(batch)} messages one at a time: {batch_error}")
+        for message in batch:
+            try:
+                self.database.save_chat_messages([message])
+            except Exception as e:
+                if is_retryable(e):
+                    raise
+                self._quarantine(message, e)
+            # Written or quarantined, so a retryable error later in the batch doesn't repeat it
+            self._drop([message])
+
+    def _quarantine(self, message: ChatMessage, error: Exception):
+        path = _process_path(self.quarantine_path)
+        with open(path, 'a') as file:
+            file.write(json.dumps(dict(_to_record(message), error=str(error))) + "\n")
+        print(f"Quarantined chat message {message.message_id} of interview {message.interview_id} "
+              f"to {path}: {error}")
+
+    def _remove_replayed(self):
+        paths, self._replayed_paths = self._replayed_paths, []
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Another worker replayed (and removed) the same file
+                pass
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Error flushing chat messages, will retry: {e}")
+
+    def close(self, retries: int = CHAT_WRITE_BUFFER['shutdown_retries']):
+        """Stop accepting messages and write out the pending ones."""
+        with self._lock:
+            self._closed = True
+        self._wake.set()
+        self._thread.join()
+
+        for attempt in range(retries):
+            try:
+                self.flush()
+                return
+            except Exception as e:
+                print(f"Error flushing chat messages on shutdown (attempt {attempt + 1}/{retries}): {e}")
+                time.sleep(2 ** attempt)
+        self._spill()
+
+    def _spill(self):
+        with self._lock:
+            messages = list(self._pending.values())
+            self._pending.clear()
+        spill_path = _process_path(self.spill_path)
+        if messages:
+            # Replace the spill file atomically
+            temp_path = spill_path + ".tmp"
+            with open(temp_path, 'w') as file:
+                for message in messages:
+                    file.write(json.dumps(_to_record(message)) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, spill_path)
+            print(f"Spilled {len(messages)} unwritten chat messages to {spill_path}")
+        # Replayed messages not written yet are in the new spill file
+        self._replayed_paths = [path for path in self._replayed_paths if path != spill_path]
+        self._remove_replayed()
+
+    def _spill_files(self) -> List[str]:
+        base, extension = os.path.splitext(self.spill_path)
+        paths = sorted(glob.glob(f"{glob.escape(base)}.[0-9]*{extension}"))
+        # A spill file from before spill files were per process
+        if os.path.exists(self.spill_path):
+            paths.append(self.spill_path)
+        return paths
+
+    def _load_spill(self):
+        # Files are kept until the replayed messages are written, in case of another crash
+        for path in self._spill_files():
+            try:
+                with open(path) as file:
+                    for line in file:
+                        if line.strip():
+                            message = _from_record(json.loads(line))
+                            self._pending[message.message_id] = message
+            except FileNotFoundError:
+                continue
+            self._replayed_paths.append(path)
+        if self._replayed_paths:
+            print(f"Replaying {len(self._pending)} spilled chat messages from {len(self._replayed_paths)} files")
+
+
+def _to_record(message: ChatMessage) -> dict:
+    return {
+        'message_id': message.message_id,
+        'interview_id': message.interview_id,
+        'role': message.role,
+        'content': message.content,
+        'timestamp': message.timestamp.isoformat()
+    }
+
+
+def _from_record(record: dict) -> ChatMessage:
+    return ChatMessage(
+        message_id=record['message_id'],
+        interview_id=record['interview_id'],
+        role=record['role'],
+        content=record['content'],
+        timestamp=datetime.fromisoformat(record['timestamp'])
+    )
@@ -0,0 +1,139 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from .models import Interview, ChatMessage
+from config import CONVERSATION_CACHE
+
+
+class _Conversation:
+    __slots__ = ('interview', 'messages', 'complete', 'appended', 'expires_at')
+
+    def __init__(self, expires_at: float):
+        # None means not cached yet
+        self.interview = None
+        self.messages = None
+        # Whether messages holds the whole history or only its most recent part
+        self.complete = False
+        # Messages saved while the history was not cached, merged in when it is loaded
+        self.appended = []
+        self.expires_at = expires_at
+
+
+class ConversationCache:
+    """In-process cache of each active interview's record and chat history.
+
+    Every chat turn needs the interview and its recent messages; serving
+    them from memory saves a MySQL query and a DynamoDB query per turn.
+    Entries are updated when this process writes, and expire after a TTL
+    so changes made by other processes are picked up. Least recently used
+    interviews are evicted beyond max_interviews.
+
+    Args:
+        max_interviews: Most interviews kept.
+        ttl: Seconds an entry is served before it is reloaded.
+        max_messages: Most messages kept per interview; older ones are
+            dropped and only the recent window is served from the cache.
+    """
+
+    def __init__(self, max_interviews: int = CONVERSATION_CACHE['max_interviews'],
+                 ttl: float = CONVERSATION_CACHE['ttl_seconds'],
+                 max_messages: int = CONVERSATION_CACHE['max_messages']):
+        self.max_interviews = max_interviews
+        self.ttl = ttl
+        self.max_messages = max_messages
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'interview_hits': 0, 'interview_misses': 0, 'history_hits': 0, 'history_misses': 0}
+
+    def _entry(self, interview_id: str, create: bool = False) -> Optional[_Conversation]:
+        # Callers hold the lock
+        entry = self._entries.get(interview_id)
+        now = time.monotonic()
+        if entry is not None and now >= entry.expires_at:
+            del self._entries[interview_id]
+            entry = None
+        if entry is None:
+            if not create:
+                return None
+            entry = self._entries[interview_id] = _Conversation(now + self.ttl)
+            while len(self._entries) > self.max_interviews:
+                self._entries.popitem(last=False)
+        self._entries.move_to_end(interview_id)
+        return entry
+
+    def get_interview(self, interview_id: str) -> Optional[Interview]:
+        """Get a copy of the cached interview, or None on a miss."""
+        with self._lock:
+            entry = self._entry(interview_id)
+            if entry is None or entry.interview is None:
+                self._counters['interview_misses'] += 1
+                return None
+            self._counters['interview_hits'] += 1
+            return entry.interview.model_copy()
+
+    def put_interview(self, interview: Interview):
+        with self._lock:
+            self._entry(interview.id, create=True).interview = interview.model_copy()
+
+    def get_messages(self, interview_id: str, limit: Optional[int] = None) -> Optional[List[ChatMessage]]:
+        """Get the cached history, or only its last `limit` messages; None on a miss."""
+        with self._lock:
+            entry = self._entry(interview_id)
+            messages = entry.messages if entry is not None else None
+            if messages is None or not (entry.complete or (limit is not None and len(messages) >= limit)):
+                self._counters['history_misses'] += 1
+                return None
+            self._counters['history_hits'] += 1
+            return list(messages[-limit:]) if limit else list(messages)
+
+    def put_messages(self, interview_id: str, messages: List[ChatMessage], complete: bool = True) -> List[ChatMessage]:
+        """Cache the history of an interview, as just loaded.
+
+        Args:
+            interview_id: Interview the messages belong to.
+            messages: The whole history, or with complete=False only its most recent messages.
+            complete: Whether messages is the whole history.
+
+        Returns:
+            The history including messages saved while it was loading.
+        """
+        with self._lock:
+            entry = self._entry(interview_id, create=True)
+            seen = {message.message_id for message in messages}
+            messages = list(messages) + [message for message in entry.appended if message.message_id not in seen]
+            messages.sort(key=lambda message: message.timestamp)
+            entry.appended = []
+            entry.complete = complete and len(messages) <= self.max_messages
+            entry.messages = messages[-self.max_messages:]
+            entry.expires_at = time.monotonic() + self.ttl
+        return messages
+
+    def append_message(self, message: ChatMessage):
+        """Record a message this process just saved."""
+        with self._lock:
+            entry = self._entry(message.interview_id, create=True)
+            if entry.messages is None:
+                entry.appended = (entry.appended + [message])[-self.max_messages:]
+                return
+            entry.messages.append(message)
+            if len(entry.messages) > self.max_messages:
+                del entry.messages[0]
+                entry.complete = False
+
+    def invalidate_messages(self, interview_id: str):
+        with self._lock:
+            entry = self._entry(interview_id)
+            if entry is not None:
+                entry.messages = None
+                entry.complete = False
+                entry.appended = []
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._counters, interviews=len(self._entries))
+        for kind in ('interview', 'history'):
+            lookups = stats[f'{kind}_hits'] + stats[f'{kind}_misses']
+            stats[f'{kind}_hit_rate'] = round(stats[f'{kind}_hits'] / lookups, 3) if lookups else 0.0
+        return stats
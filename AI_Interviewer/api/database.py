@@ -1,24 +1,95 @@
-import mysql.connector
 from mysql.connector import Error
-from typing import List, Optional
+from mysql.connector.pooling import MySQLConnectionPool
+from typing import Iterator, List, Optional, Tuple
+from base64 import urlsafe_b64encode, urlsafe_b64decode
 from datetime import datetime
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
 import boto3
 from botocore.config import Config
 from .models import Interview, InterviewFeedback, ChatMessage, DsaQuestionBank
-from config import MYSQL_CONFIG, AWS_CONFIG
+from .question_sampler import QuestionSampler
+from .question_cache import QuestionBankCache, QuestionRecord
+from config import MYSQL_CONFIG, MYSQL_POOL_CONFIG, AWS_CONFIG, CHAT_HISTORY_PAGE_SIZE, CHAT_DELETE_CONFIG, QUESTION_CACHE
 import os
 
 
+# Attributes of a ChatMessages item read back into a ChatMessage
+CHAT_MESSAGE_ATTRIBUTES = ('message_id', 'interview_id', 'role', 'content', 'timestamp')
+
+
+def encode_page_cursor(created_at: datetime, interview_id: str) -> str:
+    """Encode the position after an interview as an opaque page cursor."""
+    return urlsafe_b64encode(f"{created_at.isoformat()}|{interview_id}".encode()).decode()
+
+
+def decode_page_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a page cursor; raises ValueError if it is malformed."""
+    try:
+        created_at, interview_id = urlsafe_b64decode(cursor.encode()).decode().split('|', 1)
+        return datetime.fromisoformat(created_at), interview_id
+    except Exception as e:
+        raise ValueError(f"Invalid page cursor: {cursor}") from e
+
+
+def _keyset_condition(cursor: str) -> Tuple[str, list]:
+    # Interviews after the cursor in (created_at DESC, id DESC) order
+    created_at, interview_id = decode_page_cursor(cursor)
+    return "(created_at < %s OR (created_at = %s AND id < %s))", [created_at, created_at, interview_id]
+
+
+def _page_results(results: List[dict], limit: Optional[int]) -> Tuple[List[dict], Optional[str]]:
+    # One row more than the limit is fetched to tell whether another page follows
+    if limit is None or len(results) <= limit:
+        return results, None
+    results = results[:limit]
+    return results, encode_page_cursor(results[-1]['created_at'], results[-1]['id'])
+
+
+def _page_interview_rows(results: List[dict], limit: Optional[int]) -> Tuple[List[dict], Optional[str]]:
+    # Like _page_results for queries returning several rows per interview, grouped
+    # by interview: the rows of one interview more than the limit were fetched
+    interview_ids = list(dict.fromkeys(result['id'] for result in results))
+    if limit is None or len(interview_ids) <= limit:
+        return results, None
+    page_ids = set(interview_ids[:limit])
+    results = [result for result in results if result['id'] in page_ids]
+    return results, encode_page_cursor(results[-1]['created_at'], results[-1]['id'])
+
+
+class PoolTimeoutError(Error):
+    """Raised when no pooled MySQL connection becomes free in time."""
+
+
 class Database:
     def __init__(self):
-        self.mysql_conn = None
+        self.mysql_pool = None
+        self.pool_slots = None
         self.dynamodb = None
         self.chat_table = None
+        # The question bank is served from memory; random picks use its IDs
+        self.question_sampler = QuestionSampler(lambda: self.question_cache.question_ids())
+        self.question_cache = QuestionBankCache(
+            self._get_question_rows,
+            self._get_question_bank_version if QUESTION_CACHE['version_query'] else None,
+            on_reload=self.question_sampler.invalidate
+        )
         self.connect()
 
     def connect(self):
         try:
-            self.mysql_conn = mysql.connector.connect(**MYSQL_CONFIG)
+            self.mysql_pool = MySQLConnectionPool(
+                pool_name=MYSQL_POOL_CONFIG['pool_name'],
+                pool_size=MYSQL_POOL_CONFIG['pool_size'],
+                pool_reset_session=True,
+                **MYSQL_CONFIG
+            )
+            # MySQLConnectionPool fails immediately when exhausted; the semaphore
+            # makes callers wait for a free connection instead
+            self.pool_slots = threading.BoundedSemaphore(MYSQL_POOL_CONFIG['pool_size'])
+            print(f"MySQL connection pool created with {MYSQL_POOL_CONFIG['pool_size']} connections")
 
             # Initialize DynamoDB
             try:
@@ -51,105 +122,222 @@ class Database:
             print(f"Error connecting to database: {e}")
             raise
 
-    def create_interview(self, interview: Interview) -> Interview:
-        cursor = self.mysql_conn.cursor()
-        try:
-            query = """
-                INSERT INTO interviews (
-                    id, title, job_type, candidate_name, company, created_at, 
-                    status, type, updated_at, question_id
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            values = (
-                interview.id, interview.title, interview.job_type,
-                interview.candidate_name, interview.company, interview.created_at,
-                interview.status.value, interview.type.value,
-                interview.updated_at, interview.question_id
-            )
-            cursor.execute(query, values)
-            self.mysql_conn.commit()
-            return interview
-        except Error as e:
-            print(f"Error creating interview: {e}")
-            raise
-        finally:
-            cursor.close()
+    @contextmanager
+    def _connection(self):
+        """Check out a pooled MySQL connection for one unit of work.
 
-    # Add this method to your Database class in database.py
+        The connection is pinged (and reconnected if it dropped) before use,
+        and returned to the pool when the block exits.
 
-    def get_interview_summaries(self):
-        """Get summarized interview data (ID, title, score, feedback only)."""
-        cursor = self.mysql_conn.cursor(dictionary=True)
+        Yields:
+            A live MySQL connection.
+
+        Raises:
+            PoolTimeoutError: If no connection is free within the pool timeout.
+        """
+        if not self.pool_slots.acquire(timeout=MYSQL_POOL_CONFIG['checkout_timeout']):
+            raise PoolTimeoutError(msg="Timed out waiting for a MySQL connection from the pool")
         try:
-            query = """
-                SELECT i.id,i.title,f.score,f.comments as feedback,i.created_at from mock_interview_platform.interviews i join mock_interview_platform.interview_feedback f on (i.id=f.interview_id) ORDER BY 
-                    i.created_at DESC
-            """
-            cursor.execute(query)
-            results = cursor.fetchall()
-
-            # Process the results to ensure consistent format
-            summaries = []
-            for result in results:
-                # If feedback is too long, truncate it
-                if result.get('feedback') and len(result['feedback']) > 400:
-                    result['feedback'] = result['feedback'][:397] + '...'
-
-                summaries.append({
-                    'interviewId': result['id'],
-                    'title': result['title'],
-                    'score': result['score'],
-                    'feedback': result['feedback'],
-                    'created_at':result['created_at']
-                })
-
-            return summaries
-        except Exception as e:
-            print(f"Error getting interview summaries: {e}")
-            raise
+            conn = self.mysql_pool.get_connection()
+            try:
+                conn.ping(reconnect=True, attempts=3, delay=1)
+                yield conn
+            finally:
+                # Returns the connection to the pool (rolling back anything uncommitted)
+                conn.close()
         finally:
-            cursor.close()
+            self.pool_slots.release()
+
+    def create_interview(self, interview: Interview) -> Interview:
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            try:
+                query = """
+                    INSERT INTO interviews (
+                        id, title, job_type, candidate_name, company, created_at, 
+                        status, type, updated_at, question_id
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """
+                values = (
+                    interview.id, interview.title, interview.job_type,
+                    interview.candidate_name, interview.company, interview.created_at,
+                    interview.status.value, interview.type.value,
+                    interview.updated_at, interview.question_id
+                )
+                cursor.execute(query, values)
+                conn.commit()
+                return interview
+            except Error as e:
+                print(f"Error creating interview: {e}")
+                raise
+            finally:
+                cursor.close()
 
+    # Add this method to your Database class in database.py
+
+    def _latest_feedback_page(self, columns: str, where: Optional[str], params: list, limit: Optional[int],
+                              cursor: Optional[str], feedback_chars: int) -> Tuple[List[dict], Optional[str]]:
+        """Fetch one page of interviews (all of them if limit is None), newest first,
+        each with its latest final feedback.
+
+        The feedback is truncated in SQL to feedback_chars characters (with '...')
+        and returned as `feedback`, its score as `feedback_score`.
+
+        Returns:
+            The rows and the cursor of the next page (None on the last page).
+        """
+        conditions = [where] if where else []
+        params = list(params)
+        if cursor:
+            keyset, keyset_params = _keyset_condition(cursor)
+            conditions.append(keyset)
+            params += keyset_params
+
+        # Only the page's interviews are joined with their feedback, using
+        # interview_feedback(interview_id, category, created_at)
+        query = f"""
+            WITH page AS (
+                SELECT {columns} FROM interviews
+                {'WHERE ' + ' AND '.join(conditions) if conditions else ''}
+                ORDER BY created_at DESC, id DESC
+                {'LIMIT %s' if limit is not None else ''}
+            ),
+            latest_feedback AS (
+                SELECT f.interview_id, f.score,
+                    CASE WHEN CHAR_LENGTH(f.comments) > %s THEN CONCAT(LEFT(f.comments, %s), '...')
+                         ELSE f.comments END AS feedback,
+                    ROW_NUMBER() OVER (PARTITION BY f.interview_id ORDER BY f.created_at DESC, f.id DESC) AS position
+                FROM interview_feedback f
+                JOIN page ON page.id = f.interview_id
+                WHERE f.category = 'final_feedback'
+            )
+            SELECT page.*, latest_feedback.score AS feedback_score, latest_feedback.feedback
+            FROM page
+            LEFT JOIN latest_feedback ON latest_feedback.interview_id = page.id AND latest_feedback.position = 1
+            ORDER BY page.created_at DESC, page.id DESC
+        """
+        if limit is not None:
+            params.append(limit + 1)
+        params += [feedback_chars, feedback_chars - 3]
+
+        with self._connection() as conn:
+            db_cursor = conn.cursor(dictionary=True)
+            try:
+                db_cursor.execute(query, params)
+                return _page_results(db_cursor.fetchall(), limit)
+            finally:
+                db_cursor.close()
+
+    def get_interview_summaries(self, limit: Optional[int] = None,
+                                cursor: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+        """Get summarized interview data (ID, title, score, feedback only), newest first.
+
+        As in a join of interviews with their feedback, there is one summary per
+        feedback row and interviews without feedback are left out. A page holds
+        the summaries of up to `limit` interviews; without a limit, all of them.
+        """
+        conditions = ["EXISTS (SELECT 1 FROM interview_feedback f WHERE f.interview_id = interviews.id)"]
+        params = []
+        if cursor:
+            keyset, params = _keyset_condition(cursor)
+            conditions.append(keyset)
+        if limit is not None:
+            params.append(limit + 1)
+
+        # The page is chosen among interviews, then joined with their feedback
+        query = f"""
+            WITH page AS (
+                SELECT id, title, created_at FROM interviews
+                WHERE {' AND '.join(conditions)}
+                ORDER BY created_at DESC, id DESC
+                {'LIMIT %s' if limit is not None else ''}
+            )
+            SELECT page.id, page.title, f.score, f.comments AS feedback, page.created_at
+            FROM page
+            JOIN interview_feedback f ON f.interview_id = page.id
+            ORDER BY page.created_at DESC, page.id DESC, f.created_at
+        """
+
+        with self._connection() as conn:
+            db_cursor = conn.cursor(dictionary=True)
+            try:
+                db_cursor.execute(query, params)
+                results, next_cursor = _page_interview_rows(db_cursor.fetchall(), limit)
+
+                summaries = []
+                for result in results:
+                    # If feedback is too long, truncate it
+                    if result.get('feedback') and len(result['feedback']) > 400:
+                        result['feedback'] = result['feedback'][:397] + '...'
+
+                    summaries.append({
+                        'interviewId': result['id'],
+                        'title': result['title'],
+                        'score': result['score'],
+                        'feedback': result['feedback'],
+                        'created_at': result['created_at']
+                    })
+
+                return summaries, next_cursor
+            except Exception as e:
+                print(f"Error getting interview summaries: {e}")
+                raise
+            finally:
+                db_cursor.close()
 
     def get_interview(self, interview_id: str) -> Optional[Interview]:
-        cursor = self.mysql_conn.cursor(dictionary=True)
-        try:
-            query = "SELECT * FROM interviews WHERE id = %s"
-            cursor.execute(query, (interview_id,))
-            result = cursor.fetchone()
-            if result:
-                return Interview(**result)
-            return None
-        except Error as e:
-            print(f"Error getting interview: {e}")
-            raise
-        finally:
-            cursor.close()
+        with self._connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                query = "SELECT * FROM interviews WHERE id = %s"
+                cursor.execute(query, (interview_id,))
+                result = cursor.fetchone()
+                if result:
+                    return Interview(**result)
+                return None
+            except Error as e:
+                print(f"Error getting interview: {e}")
+                raise
+            finally:
+                cursor.close()
 
     def update_interview(self, interview: Interview) -> Interview:
-        cursor = self.mysql_conn.cursor()
-        try:
-            query = """
-                UPDATE interviews SET
-                    title = %s, job_type = %s, candidate_name = %s, company = %s,
-                    status = %s, feedback_summary = %s, score = %s, 
-                    type = %s, updated_at = %s
-                WHERE id = %s
-            """
-            values = (
-                interview.title, interview.job_type, interview.candidate_name,
-                interview.company, interview.status.value, interview.feedback_summary,
-                interview.score, interview.type.value,
-                datetime.now(), interview.id
-            )
-            cursor.execute(query, values)
-            self.mysql_conn.commit()
-            return interview
-        except Error as e:
-            print(f"Error updating interview: {e}")
-            raise
-        finally:
-            cursor.close()
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            try:
+                query = """
+                    UPDATE interviews SET
+                        title = %s, job_type = %s, candidate_name = %s, company = %s,
+                        status = %s, feedback_summary = %s, score = %s, 
+                        type = %s, updated_at = %s
+                    WHERE id = %s
+                """
+                values = (
+                    interview.title, interview.job_type, interview.candidate_name,
+                    interview.company, interview.status.value, interview.feedback_summary,
+                    interview.score, interview.type.value,
+                    datetime.now(), interview.id
+                )
+                cursor.execute(query, values)
+                conn.commit()
+                return interview
+            except Error as e:
+                print(f"Error updating interview: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _chat_item(message: ChatMessage) -> dict:
+        """Convert a chat message to its DynamoDB item."""
+        return {
+            'message_id': message.message_id,
+            'interview_id': message.interview_id,
+            'role': message.role,
+            'content': message.content,
+            # ISO string format for sorting
+            'timestamp': message.timestamp.isoformat()
+        }
 
     def save_chat_message(self, message: ChatMessage) -> ChatMessage:
         if not self.dynamodb or not self.chat_table:
@@ -157,20 +345,8 @@ class Database:
             return message
 
         try:
-            # Convert datetime to ISO string format for sorting
-            timestamp_str = message.timestamp.isoformat()
-
-            # Create the DynamoDB item
-            item = {
-                'message_id': message.message_id,
-                'interview_id': message.interview_id,
-                'role': message.role,
-                'content': message.content,
-                'timestamp': timestamp_str
-            }
-
             # Save to DynamoDB
-            response = self.chat_table.put_item(Item=item)
+            response = self.chat_table.put_item(Item=self._chat_item(message))
             print(f"Saved chat message {message.message_id} to DynamoDB - Response: {response}")
             return message
         except Exception as e:
@@ -178,89 +354,135 @@ class Database:
             # Return the message anyway to not break application flow
             return message
 
+    def save_chat_messages(self, messages: List[ChatMessage]) -> None:
+        """Save chat messages in batches; raises if DynamoDB rejects the write so callers can retry."""
+        if not self.dynamodb or not self.chat_table:
+            print(f"DynamoDB not available, skipping save of {len(messages)} chat messages")
+            return
 
-    def get_all_interviews(self) -> List[Interview]:
-        """Get all interviews from the database."""
-        cursor = self.mysql_conn.cursor(dictionary=True)
-        try:
-            query = "SELECT * FROM interviews ORDER BY created_at DESC"
-            cursor.execute(query)
-            results = cursor.fetchall()
-            
-            interviews = []
-            for result in results:
-                interview = Interview(**result)
-                interviews.append(interview)
-            
-            return interviews
-        except Error as e:
-            print(f"Error getting all interviews: {e}")
-            raise
-        finally:
-            cursor.close()
+        # batch_writer groups puts into BatchWriteItem calls of up to 25 and resends unprocessed items
+        with self.chat_table.batch_writer(overwrite_by_pkeys=['message_id']) as batch:
+            for message in messages:
+                batch.put_item(Item=self._chat_item(message))
+        print(f"Saved {len(messages)} chat messages to DynamoDB")
 
 
-    def get_interviews_by_user(self, username: str) -> List[Interview]:
-        """Get all interviews for a specific user."""
-        cursor = self.mysql_conn.cursor(dictionary=True)
+    def get_all_interviews(self, limit: Optional[int] = None,
+                           cursor: Optional[str] = None) -> Tuple[List[Interview], Optional[str]]:
+        """Get interviews from the database, newest first; a page of `limit` if given."""
+        with self._connection() as conn:
+            db_cursor = conn.cursor(dictionary=True)
+            try:
+                query = "SELECT * FROM interviews"
+                params = []
+                if cursor:
+                    keyset, params = _keyset_condition(cursor)
+                    query += f" WHERE {keyset}"
+                query += " ORDER BY created_at DESC, id DESC"
+                if limit is not None:
+                    query += " LIMIT %s"
+                    params = params + [limit + 1]
+                db_cursor.execute(query, params)
+                results, next_cursor = _page_results(db_cursor.fetchall(), limit)
+
+                return [Interview(**result) for result in results], next_cursor
+            except Error as e:
+                print(f"Error getting all interviews: {e}")
+                raise
+            finally:
+                db_cursor.close()
+
+    def get_interviews_by_user(self, username: str, limit: Optional[int] = None,
+                               cursor: Optional[str] = None) -> Tuple[List[Interview], Optional[str]]:
+        """Get the interviews of a specific user, newest first; a page of `limit` if given."""
         try:
-            query = """
-                SELECT i.*, 
-                    (SELECT comments FROM interview_feedback 
-                        WHERE interview_id = i.id AND category = 'final_feedback' 
-                        ORDER BY created_at DESC LIMIT 1) as feedback_summary
-                FROM interviews i
-                WHERE i.candidate_name = %s
-             ORDER BY i.created_at DESC
-            """
-            cursor.execute(query, (username,))
-            results = cursor.fetchall()
-        
+            # Uses interviews(candidate_name, created_at)
+            results, next_cursor = self._latest_feedback_page(
+                "*", "candidate_name = %s", [username], limit, cursor, feedback_chars=500)
+
             interviews = []
             for result in results:
-                # If feedback_summary is too long, truncate it
-                if result.get('feedback_summary') and len(result['feedback_summary']) > 500:
-                    result['feedback_summary'] = result['feedback_summary'][:497] + '...'
-                
-                interview = Interview(**result)
-                interviews.append(interview)
-        
-            return interviews
+                result.pop('feedback_score')
+                result['feedback_summary'] = result.pop('feedback')
+                interviews.append(Interview(**result))
+
+            return interviews, next_cursor
         except Error as e:
             print(f"Error getting interviews for user {username}: {e}")
             raise
-        finally:
-            cursor.close()
-    def get_chat_history(self, interview_id: str) -> List[ChatMessage]:
+
+    def _chat_history_pages(self, interview_id: str, newest_first: bool = False,
+                            page_size: Optional[int] = CHAT_HISTORY_PAGE_SIZE,
+                            attributes=CHAT_MESSAGE_ATTRIBUTES) -> Iterator[List[dict]]:
+        """Query the items of an interview's messages page by page, following LastEvaluatedKey."""
+        query = {
+            'IndexName': 'interview-time-index',
+            'KeyConditionExpression': 'interview_id = :id',
+            'ExpressionAttributeValues': {':id': interview_id},
+            # Only the attributes needed ('role' and 'timestamp' are reserved words)
+            'ProjectionExpression': ', '.join(f'#{name}' for name in attributes),
+            'ExpressionAttributeNames': {f'#{name}': name for name in attributes},
+            'ScanIndexForward': not newest_first
+        }
+        if page_size:
+            query['Limit'] = page_size
+
+        while True:
+            response = self.chat_table.query(**query)
+            yield response.get('Items', [])
+            if 'LastEvaluatedKey' not in response:
+                return
+            query['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    @staticmethod
+    def _parse_chat_items(items: List[dict]) -> List[ChatMessage]:
+        messages = []
+        for item in items:
+            try:
+                # Convert the timestamp string back to datetime
+                messages.append(ChatMessage(
+                    message_id=item['message_id'],
+                    interview_id=item['interview_id'],
+                    role=item['role'],
+                    content=item['content'],
+                    timestamp=datetime.fromisoformat(item['timestamp'])
+                ))
+            except Exception as e:
+                print(f"Error parsing message item: {str(e)}, Item: {item}")
+        return messages
+
+    def iter_chat_history(self, interview_id: str,
+                          page_size: Optional[int] = CHAT_HISTORY_PAGE_SIZE) -> Iterator[List[ChatMessage]]:
+        """Yield the messages of an interview in timestamp order, one query page at a time."""
+        if not self.dynamodb or not self.chat_table:
+            print("DynamoDB not available, returning empty chat history")
+            return
+
+        for items in self._chat_history_pages(interview_id, page_size=page_size):
+            yield self._parse_chat_items(items)
+
+    def get_chat_history(self, interview_id: str, last_n: Optional[int] = None) -> List[ChatMessage]:
+        """Get the messages of an interview in timestamp order.
+
+        Args:
+            interview_id: Interview whose messages are returned.
+            last_n: Only return the most recent last_n messages.
+        """
         if not self.dynamodb or not self.chat_table:
             print("DynamoDB not available, returning empty chat history")
             return []
 
         try:
-            # Query using the GSI for all messages of this interview, sorted by timestamp
-            response = self.chat_table.query(
-                IndexName='interview-time-index',
-                KeyConditionExpression='interview_id = :id',
-                ExpressionAttributeValues={':id': interview_id}
-            )
-
-            messages = []
-            for item in response.get('Items', []):
-                try:
-                    # Convert the timestamp string back to datetime
-                    timestamp = datetime.fromisoformat(item['timestamp'])
-
-                    # Create a ChatMessage object
-                    message = ChatMessage(
-                        message_id=item['message_id'],
-                        interview_id=item['interview_id'],
-                        role=item['role'],
-                        content=item['content'],
-                        timestamp=timestamp
-                    )
-                    messages.append(message)
-                except Exception as e:
-                    print(f"Error parsing message item: {str(e)}, Item: {item}")
+            if last_n is None:
+                messages = [message for page in self.iter_chat_history(interview_id) for message in page]
+            else:
+                # Read backwards from the newest message and stop once enough are found
+                items = []
+                for page in self._chat_history_pages(interview_id, newest_first=True, page_size=last_n):
+                    items.extend(page)
+                    if len(items) >= last_n:
+                        break
+                messages = self._parse_chat_items(items[:last_n][::-1])
 
             print(f"Retrieved {len(messages)} messages for interview {interview_id}")
             return messages
@@ -269,26 +491,42 @@ class Database:
             return []
 
     def save_feedback(self, feedback: InterviewFeedback) -> InterviewFeedback:
-        cursor = self.mysql_conn.cursor()
-        try:
-            query = """
-                INSERT INTO interview_feedback (
-                    interview_id, category, score, comments
-                ) VALUES (%s, %s, %s, %s)
-            """
-            values = (
-                feedback.interview_id, feedback.category,
-                feedback.score, feedback.comments
-            )
-            cursor.execute(query, values)
-            self.mysql_conn.commit()
-            feedback.id = cursor.lastrowid
-            return feedback
-        except Error as e:
-            print(f"Error saving feedback: {e}")
-            raise
-        finally:
-            cursor.close()
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            try:
+                query = """
+                    INSERT INTO interview_feedback (
+                        interview_id, category, score, comments
+                    ) VALUES (%s, %s, %s, %s)
+                """
+                values = (
+                    feedback.interview_id, feedback.category,
+                    feedback.score, feedback.comments
+                )
+                cursor.execute(query, values)
+                conn.commit()
+                feedback.id = cursor.lastrowid
+                return feedback
+            except Error as e:
+                print(f"Error saving feedback: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    def _delete_chat_batch(self, keys: List[dict]) -> int:
+        """Delete up to 25 messages, resending the items DynamoDB leaves unprocessed."""
+        request = {self.chat_table.name: [{'DeleteRequest': {'Key': key}} for key in keys]}
+        for attempt in range(CHAT_DELETE_CONFIG['max_retries'] + 1):
+            if attempt:
+                # Unprocessed items usually mean throttling; back off before resending
+                time.sleep(min(CHAT_DELETE_CONFIG['retry_base_seconds'] * 2 ** (attempt - 1), 5))
+            response = self.dynamodb.meta.client.batch_write_item(RequestItems=request)
+            request = response.get('UnprocessedItems') or {}
+            if not request:
+                return len(keys)
+        remaining = sum(len(requests) for requests in request.values())
+        raise RuntimeError(f"{remaining} chat messages were still unprocessed after "
+                           f"{CHAT_DELETE_CONFIG['max_retries']} retries")
 
     def delete_chat_history(self, interview_id: str) -> bool:
         """Delete all chat messages for an interview."""
@@ -297,20 +535,23 @@ class Database:
             return False
 
         try:
-            # Get all messages for this interview
-            messages = self.get_chat_history(interview_id)
-
-            # Delete each message using batch writer for efficiency
-            if messages:
-                with self.chat_table.batch_writer() as batch:
-                    for message in messages:
-                        batch.delete_item(
-                            Key={
-                                'message_id': message.message_id
-                            }
-                        )
-
-                print(f"Deleted {len(messages)} messages for interview {interview_id}")
+            # Page through the keys only and delete them in concurrent batches of 25
+            # (the BatchWriteItem maximum) while later pages are still being read
+            with ThreadPoolExecutor(max_workers=CHAT_DELETE_CONFIG['workers']) as executor:
+                futures = []
+                keys = []
+                for items in self._chat_history_pages(interview_id, page_size=None, attributes=('message_id',)):
+                    for item in items:
+                        keys.append({'message_id': item['message_id']})
+                        if len(keys) == 25:
+                            futures.append(executor.submit(self._delete_chat_batch, keys))
+                            keys = []
+                if keys:
+                    futures.append(executor.submit(self._delete_chat_batch, keys))
+                deleted = sum(future.result() for future in futures)
+
+            if deleted:
+                print(f"Deleted {deleted} messages for interview {interview_id}")
             else:
                 print(f"No messages found to delete for interview {interview_id}")
 
@@ -319,58 +560,117 @@ class Database:
             print(f"Error deleting chat history: {str(e)}")
             raise
 
+    def _get_question_row(self, question_id: str) -> Optional[dict]:
+        with self._connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                query = "SELECT * FROM question_bank WHERE id = %s"
+                cursor.execute(query, (question_id,))
+                return cursor.fetchone()
+            finally:
+                cursor.close()
+
+    def _get_question_rows(self) -> List[dict]:
+        with self._connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                cursor.execute("SELECT id, text, difficulty, follow_ups FROM question_bank")
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def _get_question_bank_version(self):
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(QUESTION_CACHE['version_query'])
+                return cursor.fetchone()
+            finally:
+                cursor.close()
+
+    def reload_question_bank(self) -> int:
+        """Reload the cached question bank; returns the number of questions."""
+        try:
+            return self.question_cache.reload()
+        except Error as e:
+            print(f"Error loading question bank: {e}")
+            raise
+
     def get_question_by_id(self, question_id: str) -> Optional[DsaQuestionBank]:
         """Get a specific question by ID from the question bank."""
-        cursor = self.mysql_conn.cursor(dictionary=True)
         try:
-            query = "SELECT * FROM question_bank WHERE id = %s"
-            cursor.execute(query, (question_id,))
-            result = cursor.fetchone()
-            if result:
-                # Include question ID in the text
-                question_text = f"{result['text']}\n\nQuestion ID: {result['id']}"
-                return DsaQuestionBank(
-                    id=str(result['id']),
-                    text=question_text,
-                    difficulty=result['difficulty'],
-                    follow_ups=result['follow_ups'].split(',') if result['follow_ups'] else None
-                )
-            return None
+            record = self.question_cache.get(question_id)
+            if record is None:
+                # Not cached yet, e.g. added since the last reload
+                result = self._get_question_row(question_id)
+                if not result:
+                    return None
+                record = QuestionRecord.from_row(result)
+                self.question_cache.put(record)
+            return record.to_question(id_in_text=True)
         except Error as e:
             print(f"Error getting question by ID: {e}")
             raise
-        finally:
-            cursor.close()
 
-    def get_random_question(self, difficulty: Optional[int] = None) -> Optional[DsaQuestionBank]:
-        """Get a random question from the question bank."""
-        cursor = self.mysql_conn.cursor(dictionary=True)
+    def get_seen_question_ids(self, candidate_name: str) -> List[str]:
+        """Get the IDs of the questions a candidate was asked in earlier interviews."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            try:
+                query = """
+                    SELECT DISTINCT question_id FROM interviews
+                    WHERE candidate_name = %s AND question_id IS NOT NULL
+                """
+                cursor.execute(query, (candidate_name,))
+                return [str(row[0]) for row in cursor.fetchall()]
+            except Error as e:
+                print(f"Error getting seen questions for {candidate_name}: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    def get_random_question(self, difficulty: Optional[int] = None,
+                            exclude_ids: Optional[List[str]] = None) -> Optional[DsaQuestionBank]:
+        """Get a random question from the question bank.
+
+        Args:
+            difficulty: Only pick questions of this difficulty.
+            exclude_ids: Questions to avoid (e.g. already seen by the candidate),
+                unless no other question is left.
+        """
+        exclude = {str(question_id) for question_id in exclude_ids or ()}
         try:
-            query = "SELECT * FROM question_bank"
-            params = []
-            if difficulty:
-                query += " WHERE difficulty = %s"
-                params.append(difficulty)
-            query += " ORDER BY RAND() LIMIT 1"
-
-            cursor.execute(query, params)
-            result = cursor.fetchone()
-            if result:
-                # Include question ID in the text
-
-                return DsaQuestionBank(
-                    id=str(result['id']),
-                    text=result['text'],
-                    difficulty=result['difficulty'],
-                    follow_ups=result['follow_ups'].split(',') if result['follow_ups'] else None
-                )
+            # A question removed since the IDs were loaded is retried once with fresh IDs
+            for _ in range(2):
+                question_id = self.question_sampler.sample(difficulty, exclude)
+                if question_id is None:
+                    return None
+                record = self.question_cache.get(question_id)
+                if record:
+                    return record.to_question()
+                self.question_sampler.invalidate()
             return None
         except Error as e:
             print(f"Error getting random question: {e}")
             raise
-        finally:
-            cursor.close()
 
     def close(self):
-        if self.mysql_conn:
-            self.mysql_conn.close()
\ No newline at end of file
+        """Close the pooled MySQL connections.
+
+        Every pool slot is taken through pool_slots, so connections still in use
+        are waited for (up to the checkout timeout) instead of being left open.
+        Each connection is then disconnected rather than returned to the pool,
+        and later checkouts fail with PoolTimeoutError.
+        """
+        if not self.mysql_pool:
+            return
+        for _ in range(MYSQL_POOL_CONFIG['pool_size']):
+            if not self.pool_slots.acquire(timeout=MYSQL_POOL_CONFIG['checkout_timeout']):
+                print("Timed out waiting for MySQL connections to be returned to the pool")
+                break
+            try:
+                conn = self.mysql_pool.get_connection()
+                conn.disconnect()
+            except Error as e:
+                print(f"Error closing MySQL connection: {e}")
+        self.mysql_pool = None
\ No newline at end of file
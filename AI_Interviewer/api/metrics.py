@@ -0,0 +1,42 @@
+import threading
+from collections import deque
+from typing import Dict
+
+
+class LatencyTracker:
+    """Keeps the most recent latency samples and summarises them.
+
+    Args:
+        window: Number of recent samples kept for the percentiles.
+    """
+
+    def __init__(self, window: int = 1000):
+        self._samples = deque(maxlen=window)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+            self._count += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            samples = sorted(self._samples)
+            count = self._count
+        if not samples:
+            return {"count": count}
+        return {
+            "count": count,
+            "mean_ms": round(sum(samples) / len(samples) * 1000, 1),
+            "p50_ms": round(samples[len(samples) // 2] * 1000, 1),
+            "p95_ms": round(samples[max(0, int(len(samples) * 0.95) - 1)] * 1000, 1),
+            "max_ms": round(samples[-1] * 1000, 1)
+        }
+
+
+# Streaming chat: time until the first token reaches the candidate, and until the reply is complete
+chat_stream_metrics = {
+    "time_to_first_token": LatencyTracker(),
+    "total_latency": LatencyTracker()
+}
@@ -1,15 +1,14 @@
-import openai
-from typing import List, Dict, Any
-import tempfile
-import os
+from openai import AsyncOpenAI
+from typing import List, Dict, Any, AsyncIterator
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from api import ChatMessage
-from config import OPENAI_API_KEY, OPENAI_MODEL, OPENAI_TEMPERATURE, OPENAI_MAX_TOKENS, RATE_LIMIT
+from config import OPENAI_API_KEY, OPENAI_BASE_URL, OPENAI_MODEL, OPENAI_TEMPERATURE, OPENAI_MAX_TOKENS, RATE_LIMIT
 
 class OpenAIService:  
     def __init__(self):
-        openai.api_key = OPENAI_API_KEY
+        # Async client: a slow completion only suspends its own request
+        self.client = AsyncOpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL)
 
         self.model = OPENAI_MODEL
         self.temperature = OPENAI_TEMPERATURE
@@ -17,24 +16,15 @@ class OpenAIService:
         print("OpenAI Service initialized")
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    def transcribe_audio(self, audio_data: bytes) -> str:
+    async def transcribe_audio(self, audio_data: bytes) -> str:
         """Transcribe audio using OpenAI Whisper model."""
         try:
-            # Create a temporary file for the audio data
-            with tempfile.NamedTemporaryFile(suffix=".webm", delete=False) as temp_file:
-                temp_file.write(audio_data)
-                temp_file_path = temp_file.name
-
-            # Transcribe the audio
-            with open(temp_file_path, "rb") as audio_file:
-                transcript = openai.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    response_format="json"
-                )
-
-            # Clean up the temporary file
-            os.unlink(temp_file_path)
+            # Send the audio straight from memory; the file name sets the format
+            transcript = await self.client.audio.transcriptions.create(
+                model="whisper-1",
+                file=("audio.webm", audio_data),
+                response_format="json"
+            )
             return transcript.text
 
         except Exception as e:
@@ -42,7 +32,7 @@ class OpenAIService:
             raise
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    def evaluate_response(self, question: str, response: str, context: List[Dict[str, Any]] = None,
+    async def evaluate_response(self, question: str, response: str, context: List[Dict[str, Any]] = None,
                           prompt: str = None) -> str:
         """Evaluate a candidate's response using GPT model with an optional custom prompt."""
         try:
@@ -77,7 +67,7 @@ class OpenAIService:
                 messages.append({"role": "user", "content": f"Question: {question}\nResponse: {response}"})
 
             # Make the API call
-            response = openai.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
@@ -93,10 +83,10 @@ class OpenAIService:
     
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    def generate_chat_response(self, messages: List[Dict[str, Any]]) -> str:
+    async def generate_chat_response(self, messages: List[Dict[str, Any]]) -> str:
         """Generate a response to a chat message using OpenAI's chat API."""
         try:
-            response = openai.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
@@ -109,7 +99,29 @@ class OpenAIService:
             raise
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    def generate_feedback(self, interview_history: List[ChatMessage]) -> str:
+    async def _open_chat_stream(self, messages: List[Dict[str, Any]]):
+        # Only opening the stream is retried; tokens already relayed cannot be taken back
+        return await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=True
+        )
+
+    async def stream_chat_response(self, messages: List[Dict[str, Any]]) -> AsyncIterator[str]:
+        """Generate a response to a chat message, yielding content as it arrives."""
+        try:
+            stream = await self._open_chat_stream(messages)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            print(f"Error streaming chat response: {e}")
+            raise
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    async def generate_feedback(self, interview_history: List[ChatMessage]) -> str:
         """Generate comprehensive interview feedback from chat history."""
         try:
             messages = [
@@ -137,7 +149,7 @@ class OpenAIService:
                 elif message.role == "system" or message.role == "assistant":
                     messages.append({"role": "assistant", "content": message.content})
 
-            response = openai.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
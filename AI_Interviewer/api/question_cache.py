@@ -0,0 +1,130 @@
+import time
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .models import DsaQuestionBank
+from config import QUESTION_CACHE
+
+
+class QuestionRecord:
+    """A question_bank row, with its follow-ups already split."""
+
+    __slots__ = ('id', 'text', 'difficulty', 'follow_ups')
+
+    def __init__(self, id: str, text: str, difficulty: int, follow_ups: Optional[Tuple[str, ...]]):
+        self.id = id
+        self.text = text
+        self.difficulty = difficulty
+        self.follow_ups = follow_ups
+
+    @classmethod
+    def from_row(cls, row: dict) -> 'QuestionRecord':
+        return cls(
+            id=str(row['id']),
+            text=row['text'],
+            difficulty=row['difficulty'],
+            follow_ups=tuple(row['follow_ups'].split(',')) if row['follow_ups'] else None
+        )
+
+    def to_question(self, id_in_text: bool = False) -> DsaQuestionBank:
+        # Include question ID in the text if requested
+        return DsaQuestionBank(
+            id=self.id,
+            text=f"{self.text}\n\nQuestion ID: {self.id}" if id_in_text else self.text,
+            difficulty=self.difficulty,
+            follow_ups=list(self.follow_ups) if self.follow_ups else None
+        )
+
+
+class QuestionBankCache:
+    """Read-through, in-memory copy of the question bank.
+
+    The question bank rarely changes, so it is loaded whole and served from
+    memory. It is reloaded after invalidate() (e.g. from the admin endpoint),
+    when load_version reports a new version, and otherwise every
+    refresh_interval as a safety net.
+
+    Args:
+        load_rows: Returns every question_bank row as a dict.
+        load_version: Returns a value that changes whenever the question bank
+            does; None disables the version check.
+        refresh_interval: Seconds before the questions are reloaded regardless.
+        version_check_interval: Seconds between version checks.
+        on_reload: Called after every reload.
+    """
+
+    def __init__(self, load_rows: Callable[[], Iterable[dict]],
+                 load_version: Optional[Callable[[], Any]] = None,
+                 refresh_interval: float = QUESTION_CACHE['refresh_seconds'],
+                 version_check_interval: float = QUESTION_CACHE['version_check_seconds'],
+                 on_reload: Optional[Callable[[], None]] = None):
+        self.load_rows = load_rows
+        self.load_version = load_version
+        self.refresh_interval = refresh_interval
+        self.version_check_interval = version_check_interval
+        self.on_reload = on_reload
+        self._records: Dict[str, QuestionRecord] = {}
+        self._version = None
+        self._loaded_at = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+        # Only one caller reloads or checks the version; the others wait for it
+        self._refresh_lock = threading.Lock()
+
+    def reload(self) -> int:
+        """Load every question; returns how many there are."""
+        version = self.load_version() if self.load_version else None
+        records = {}
+        for row in self.load_rows():
+            record = QuestionRecord.from_row(row)
+            records[record.id] = record
+        with self._lock:
+            self._records = records
+            self._version = version
+            self._loaded_at = self._checked_at = time.monotonic()
+        print(f"Loaded {len(records)} questions into the question bank cache")
+        if self.on_reload:
+            self.on_reload()
+        return len(records)
+
+    def invalidate(self):
+        """Reload the questions on the next lookup."""
+        with self._lock:
+            self._loaded_at = None
+
+    def _due(self) -> Tuple[bool, bool]:
+        with self._lock:
+            now = time.monotonic()
+            expired = self._loaded_at is None or now - self._loaded_at >= self.refresh_interval
+            check = (self.load_version is not None and self._checked_at is not None
+                     and now - self._checked_at >= self.version_check_interval)
+        return expired, check
+
+    def _ensure_fresh(self):
+        if not any(self._due()):
+            return
+        with self._refresh_lock:
+            expired, check = self._due()
+            if not expired and check:
+                version = self.load_version()
+                with self._lock:
+                    self._checked_at = time.monotonic()
+                    expired = version != self._version
+            if expired:
+                self.reload()
+
+    def get(self, question_id: str) -> Optional[QuestionRecord]:
+        self._ensure_fresh()
+        with self._lock:
+            return self._records.get(str(question_id))
+
+    def put(self, record: QuestionRecord):
+        """Add a question read from the database after the last reload."""
+        with self._lock:
+            self._records[record.id] = record
+
+    def question_ids(self) -> List[Tuple[str, int]]:
+        """Get the (id, difficulty) pair of every cached question."""
+        self._ensure_fresh()
+        with self._lock:
+            return [(record.id, record.difficulty) for record in self._records.values()]
@@ -0,0 +1,91 @@
+import time
+import random
+import threading
+from typing import Callable, Collection, Dict, Iterable, List, Optional, Tuple
+
+from config import QUESTION_SAMPLER
+
+
+class QuestionSampler:
+    """Uniform random choice of question IDs, optionally by difficulty.
+
+    The IDs of the question bank are held in memory per difficulty, so a
+    pick is a random index instead of an ORDER BY RAND() sort of the whole
+    table. The IDs are reloaded once they are older than refresh_interval,
+    or on the next pick after invalidate().
+
+    Args:
+        load_ids: Returns (question_id, difficulty) pairs for every question.
+        refresh_interval: Seconds before the IDs are reloaded.
+    """
+
+    # Random draws tried before falling back to filtering out excluded IDs
+    MAX_REJECTIONS = 8
+
+    def __init__(self, load_ids: Callable[[], Iterable[Tuple[str, int]]],
+                 refresh_interval: float = QUESTION_SAMPLER['refresh_seconds']):
+        self.load_ids = load_ids
+        self.refresh_interval = refresh_interval
+        self._all_ids: List[str] = []
+        self._ids_by_difficulty: Dict[int, List[str]] = {}
+        self._loaded_at = None
+        self._lock = threading.Lock()
+        # Only one caller reloads a stale sampler; the others wait for it
+        self._refresh_lock = threading.Lock()
+
+    def refresh(self):
+        """Reload the question IDs."""
+        all_ids = []
+        ids_by_difficulty = {}
+        for question_id, difficulty in self.load_ids():
+            question_id = str(question_id)
+            all_ids.append(question_id)
+            ids_by_difficulty.setdefault(difficulty, []).append(question_id)
+        # Readers keep using the previous lists until both are swapped in
+        with self._lock:
+            self._all_ids = all_ids
+            self._ids_by_difficulty = ids_by_difficulty
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self):
+        """Reload the IDs on the next pick (e.g. after the question bank changed)."""
+        with self._lock:
+            self._loaded_at = None
+
+    def _stale(self) -> bool:
+        with self._lock:
+            return self._loaded_at is None or time.monotonic() - self._loaded_at >= self.refresh_interval
+
+    def _ids(self, difficulty: Optional[int]) -> List[str]:
+        if self._stale():
+            with self._refresh_lock:
+                if self._stale():
+                    self.refresh()
+        with self._lock:
+            return self._ids_by_difficulty.get(difficulty, []) if difficulty else self._all_ids
+
+    def sample(self, difficulty: Optional[int] = None, exclude: Collection[str] = ()) -> Optional[str]:
+        """Pick a question ID uniformly at random.
+
+        Args:
+            difficulty: Only pick questions of this difficulty.
+            exclude: IDs to avoid (a set), such as questions the candidate has seen.
+                They are only picked if every candidate question is excluded.
+
+        Returns:
+            A question ID, or None if there is no question to pick from.
+        """
+        ids = self._ids(difficulty)
+        if not ids:
+            return None
+        if not exclude:
+            return random.choice(ids)
+
+        # Usually only a few questions are excluded, so a couple of draws find one
+        for _ in range(self.MAX_REJECTIONS):
+            question_id = random.choice(ids)
+            if question_id not in exclude:
+                return question_id
+
+        remaining = [question_id for question_id in ids if question_id not in exclude]
+        return random.choice(remaining or ids)
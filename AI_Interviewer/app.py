@@ -1,15 +1,19 @@
 import re
+import time
 
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from api.models import Interview, InterviewFeedback, ChatMessage, InterviewStatus
-from api.database import Database
+from api.async_database import AsyncDatabase
 from api.openai_service import OpenAIService
+from api.metrics import chat_stream_metrics
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import boto3
 from botocore.config import Config
-from config import AWS_CONFIG
+from config import AWS_CONFIG, CHAT_CONTEXT_MESSAGES, INTERVIEW_PAGINATION
 import os
 from pydantic import BaseModel
 
@@ -26,20 +30,39 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets browsers read the pagination cursor
+    expose_headers=["X-Next-Cursor"],
 )
 
 
-# Initialize services
-db = Database()
+# Initialize services (database calls run on a thread pool, OpenAI calls are async)
+db = AsyncDatabase()
 openai_service = OpenAIService()
 
 
+@app.on_event("startup")
+async def load_question_bank():
+    """Load the question bank into memory before serving requests."""
+    try:
+        await db.reload_question_bank()
+    except Exception as e:
+        # Loaded on first use instead
+        print(f"Error preloading question bank: {e}")
+
+
+@app.on_event("shutdown")
+def close_database():
+    """Wait for in-flight database calls and close the connection pool."""
+    db.close()
+
+
 @app.post("/interviews")
 async def create_interview(interview: Interview):
     """Create a new interview and generate the first question."""
     try:
-        # Get a random question from the question bank
-        random_question = db.get_random_question()
+        # Get a random question from the question bank, avoiding ones the candidate was asked before
+        seen_question_ids = await db.get_seen_question_ids(interview.candidate_name)
+        random_question = await db.get_random_question(exclude_ids=seen_question_ids)
         if not random_question:
             raise HTTPException(status_code=500, detail="Failed to get a random question")
 
@@ -47,7 +70,7 @@ async def create_interview(interview: Interview):
         interview.question_id = random_question.id
 
         # Create the interview
-        created_interview = db.create_interview(interview)
+        created_interview = await db.create_interview(interview)
 
         # Create greeting message
         greeting = f"Hello {interview.candidate_name}! Welcome to your {interview.type.value} interview. I'll be your interviewer today. Let's begin with our first question:\n\n{random_question.text}"
@@ -58,7 +81,7 @@ async def create_interview(interview: Interview):
             role="system",
             content=greeting
         )
-        saved_greeting = db.save_chat_message(greeting_message)
+        saved_greeting = await db.save_chat_message(greeting_message)
 
         # Return the interview ID and status
         return {
@@ -68,12 +91,49 @@ async def create_interview(interview: Interview):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/admin/question-bank/reload")
+async def reload_question_bank():
+    """Reload the in-memory question bank after questions were added or changed."""
+    try:
+        return {"questions": await db.reload_question_bank()}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Query parameters of the paginated interview listings; without either, the
+# whole listing is returned as before
+PAGE_LIMIT = Query(None, ge=1, le=INTERVIEW_PAGINATION['max_limit'],
+                   description="Page size; defaults to INTERVIEW_PAGE_SIZE when a cursor is given")
+PAGE_CURSOR = Query(None, description="X-Next-Cursor header of the previous page")
+
+
+def page_limit(limit: Optional[int], cursor: Optional[str]) -> Optional[int]:
+    """Get the page size of a listing request, None for the unpaginated listing."""
+    if limit is None and cursor:
+        return INTERVIEW_PAGINATION['default_limit']
+    return limit
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]):
+    """Point the client at the next page, if there is one."""
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+
 @app.get("/interviews/summary")
-async def get_interview_summaries():
-    """Get summarized interview data (ID, title, score, feedback only)."""
+async def get_interview_summaries(response: Response, limit: Optional[int] = PAGE_LIMIT,
+                                  cursor: Optional[str] = PAGE_CURSOR):
+    """Get summarized interview data (ID, title, score, feedback only), newest first.
+
+    Without `limit` or `cursor` all summaries are returned. Otherwise the page
+    covers up to `limit` interviews; the X-Next-Cursor response header is the
+    `cursor` for the next page and is absent on the last one.
+    """
     try:
-        interviews = db.get_interview_summaries()
+        interviews, next_cursor = await db.get_interview_summaries(page_limit(limit, cursor), cursor)
+        set_next_cursor(response, next_cursor)
         return interviews
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -81,7 +141,7 @@ async def get_interview_summaries():
 async def get_interview(interview_id: str):
     """Get interview details."""
     try:
-        interview = db.get_interview(interview_id)
+        interview = await db.get_interview(interview_id)
         if not interview:
             raise HTTPException(status_code=404, detail="Interview not found")
         return interview
@@ -96,7 +156,7 @@ async def transcribe_audio(interview_id: str, audio: UploadFile = File(...)):
         audio_data = await audio.read()
         
         # Transcribe audio
-        transcript = openai_service.transcribe_audio(audio_data)
+        transcript = await openai_service.transcribe_audio(audio_data)
         
         # Create chat message
         message = ChatMessage(
@@ -106,7 +166,7 @@ async def transcribe_audio(interview_id: str, audio: UploadFile = File(...)):
         )
         
         # Save message
-        saved_message = db.save_chat_message(message)
+        saved_message = await db.save_chat_message(message)
         
         return {"transcript": transcript, "message": saved_message}
     except Exception as e:
@@ -117,10 +177,10 @@ async def evaluate_response(interview_id: str, question: str, response: str):
     """Evaluate a candidate's response."""
     try:
         # Get interview history for context
-        history = db.get_chat_history(interview_id)
+        history = await db.get_chat_history(interview_id)
         
         # Evaluate response
-        evaluation = openai_service.evaluate_response(question, response, history)
+        evaluation = await openai_service.evaluate_response(question, response, history)
         
         # Create feedback
         feedback = InterviewFeedback(
@@ -131,7 +191,7 @@ async def evaluate_response(interview_id: str, question: str, response: str):
         )
         
         # Save feedback
-        saved_feedback = db.save_feedback(feedback)
+        saved_feedback = await db.save_feedback(feedback)
         
         return {"evaluation": evaluation, "feedback": saved_feedback}
     except Exception as e:
@@ -142,16 +202,16 @@ async def generate_question(interview_id: str):
     """Generate a new interview question."""
     try:
         # Get interview details
-        interview = db.get_interview(interview_id)
+        interview = await db.get_interview(interview_id)
         if not interview:
             raise HTTPException(status_code=404, detail="Interview not found")
         
         # Get previous questions
-        history = db.get_chat_history(interview_id)
+        history = await db.get_chat_history(interview_id)
         previous_questions = [msg.content for msg in history if msg.role == "system"]
         
         # Generate question
-        question = openai_service.generate_question(interview.type, previous_questions)
+        question = await openai_service.generate_question(interview.type, previous_questions)
         
         # Create chat message
         message = ChatMessage(
@@ -161,7 +221,7 @@ async def generate_question(interview_id: str):
         )
         
         # Save message
-        saved_message = db.save_chat_message(message)
+        saved_message = await db.save_chat_message(message)
         
         return {"question": question, "message": saved_message}
     except Exception as e:
@@ -172,15 +232,15 @@ async def generate_feedback(interview_id: str):
     """Generate comprehensive interview feedback and update interview status."""
     try:
         # Get interview details
-        interview = db.get_interview(interview_id)
+        interview = await db.get_interview(interview_id)
         if not interview:
             raise HTTPException(status_code=404, detail="Interview not found")
         
         # Get chat history
-        chat_history = db.get_chat_history(interview_id)
+        chat_history = await db.get_chat_history(interview_id)
         
         # Generate concise feedback using OpenAI
-        feedback = openai_service.generate_feedback(chat_history)
+        feedback = await openai_service.generate_feedback(chat_history)
         
         # Extract overall score from feedback
         score = 0
@@ -207,13 +267,13 @@ async def generate_feedback(interview_id: str):
             comments=feedback
         )
         
-        saved_feedback = db.save_feedback(feedback_entry)
+        saved_feedback = await db.save_feedback(feedback_entry)
         
         # Update interview status to completed
         interview.status = InterviewStatus.COMPLETED
         interview.feedback_summary = feedback[:400] if len(feedback) > 400 else feedback
         interview.score = score
-        updated_interview = db.update_interview(interview)
+        updated_interview = await db.update_interview(interview)
         
         return {
             "success": True,
@@ -227,12 +287,70 @@ async def generate_feedback(interview_id: str):
 
 @app.get("/interviews/{interview_id}/history")
 async def get_chat_history(interview_id: str):
-    """Get chat history for an interview."""
+    """Get chat history for an interview.
+
+    The JSON array is streamed as DynamoDB query pages arrive, so long
+    transcripts are never held in memory in full.
+    """
+    pages = db.iter_chat_history(interview_id)
     try:
-        return db.get_chat_history(interview_id)
+        # Read the first page before responding, so a failing query still gets a 500
+        first_page = await pages.__anext__()
+    except StopAsyncIteration:
+        first_page = []
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    async def body():
+        separator = "["
+        try:
+            page = first_page
+            while True:
+                for message in page:
+                    yield separator + json.dumps(jsonable_encoder(message))
+                    separator = ","
+                page = await pages.__anext__()
+        except StopAsyncIteration:
+            yield "[]" if separator == "[" else "]"
+        except Exception as e:
+            # Headers are sent already; leaving the array unterminated shows the client it is incomplete
+            print(f"Error streaming chat history for interview {interview_id}: {e}")
+
+    return StreamingResponse(body(), media_type="application/json")
+
+# System prompt for the interviewer's chat replies
+INTERVIEWER_SYSTEM_PROMPT = """You are a professional technical interviewer conducting a coding interview. Follow these rules strictly:
+Only discuss the current coding interview question. Never reference unrelated topics.
+Never provide implementation help, examples, or pseudocode. Only clarify the problem statement if asked.
+If the candidate is stuck, give at most one brief hint (under 10–15 words) that suggests a general approach, without naming specific algorithms or data structures.
+Example: “Try reducing repeated work using a fixed-size moving view of the data.”
+NOT: “Use a sliding window.”
+Never name specific techniques like DFS, heaps, tries, or dynamic programming. Only describe what they help achieve.
+Example: “Can you track previously seen paths efficiently?”
+Maintain a professional, neutral tone. Do not give opinions, encouragement, or commentary.
+Ask concise follow-up questions testing understanding of time/space complexity and edge cases.
+Never provide complete or partial solutions. Only guide using high-level conceptual prompts.
+If the candidate goes off-topic, politely steer them back to the problem.
+Do not discuss motivation, company culture, or non-technical topics. Focus entirely on code, algorithms, and best practices.
+Keep all responses focused, concise, and technical. No filler, small talk, or elaboration unless clarification is requested.
+                """
+
+
+def build_chat_messages(chat_history: List[ChatMessage]) -> List[Dict[str, Any]]:
+    """Format the system prompt and recent chat history for OpenAI."""
+    formatted_messages = [{"role": "system", "content": INTERVIEWER_SYSTEM_PROMPT}]
+
+    # Add conversation history (limited to the most recent messages for context)
+    for msg in chat_history[-CHAT_CONTEXT_MESSAGES:]:
+        formatted_messages.append({"role": msg.role, "content": msg.content})
+    return formatted_messages
+
+
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format a server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 # Chat APIs
 @app.post("/api/chat/{interview_id}")
 async def send_message(interview_id: str, message: ChatMessageRequest):
@@ -244,41 +362,21 @@ async def send_message(interview_id: str, message: ChatMessageRequest):
             role=message.role,
             content=message.content
         )
-        saved_user_message = db.save_chat_message(user_chat_message)
+        saved_user_message = await db.save_chat_message(user_chat_message)
 
-        # Get chat history for context
-        chat_history = db.get_chat_history(interview_id)
+        # Get recent chat history for context
+        chat_history = await db.get_recent_chat_history(interview_id, CHAT_CONTEXT_MESSAGES)
 
         # Get interview details to understand context
-        interview = db.get_interview(interview_id)
+        interview = await db.get_interview(interview_id)
         if not interview:
             raise HTTPException(status_code=404, detail="Interview not found")
 
         # Format messages for OpenAI
-        formatted_messages = [
-            {"role": "system", "content": """You are a professional technical interviewer conducting a coding interview. Follow these rules strictly:
-Only discuss the current coding interview question. Never reference unrelated topics.
-Never provide implementation help, examples, or pseudocode. Only clarify the problem statement if asked.
-If the candidate is stuck, give at most one brief hint (under 10–15 words) that suggests a general approach, without naming specific algorithms or data structures.
-Example: “Try reducing repeated work using a fixed-size moving view of the data.”
-NOT: “Use a sliding window.”
-Never name specific techniques like DFS, heaps, tries, or dynamic programming. Only describe what they help achieve.
-Example: “Can you track previously seen paths efficiently?”
-Maintain a professional, neutral tone. Do not give opinions, encouragement, or commentary.
-Ask concise follow-up questions testing understanding of time/space complexity and edge cases.
-Never provide complete or partial solutions. Only guide using high-level conceptual prompts.
-If the candidate goes off-topic, politely steer them back to the problem.
-Do not discuss motivation, company culture, or non-technical topics. Focus entirely on code, algorithms, and best practices.
-Keep all responses focused, concise, and technical. No filler, small talk, or elaboration unless clarification is requested.
-                """}
-        ]
-
-        # Add conversation history (limited to last 10 messages for context)
-        for msg in chat_history[-10:]:
-            formatted_messages.append({"role": msg.role, "content": msg.content})
+        formatted_messages = build_chat_messages(chat_history)
 
         # Generate AI response
-        ai_response = openai_service.generate_chat_response(formatted_messages)
+        ai_response = await openai_service.generate_chat_response(formatted_messages)
 
         # Save AI response
         ai_chat_message = ChatMessage(
@@ -286,7 +384,7 @@ Keep all responses focused, concise, and technical. No filler, small talk, or el
             role="assistant",
             content=ai_response
         )
-        saved_ai_message = db.save_chat_message(ai_chat_message)
+        saved_ai_message = await db.save_chat_message(ai_chat_message)
 
         return {
             "user_message": saved_user_message,
@@ -295,11 +393,88 @@ Keep all responses focused, concise, and technical. No filler, small talk, or el
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/chat/{interview_id}/stream")
+async def stream_message(interview_id: str, message: ChatMessageRequest):
+    """Send a chat message and stream the AI response as server-sent events.
+
+    Emits a "user_message" event, a "token" event per content delta, and a
+    final "done" event with the saved AI message and the latency metrics
+    (or an "error" event). The AI message is saved once it is complete.
+    """
+    start = time.perf_counter()
+    try:
+        # Save user message
+        user_chat_message = ChatMessage(
+            interview_id=interview_id,
+            role=message.role,
+            content=message.content
+        )
+        saved_user_message = await db.save_chat_message(user_chat_message)
+
+        chat_history = await db.get_recent_chat_history(interview_id, CHAT_CONTEXT_MESSAGES)
+        interview = await db.get_interview(interview_id)
+        if not interview:
+            raise HTTPException(status_code=404, detail="Interview not found")
+
+        formatted_messages = build_chat_messages(chat_history)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def events():
+        yield sse_event("user_message", jsonable_encoder(saved_user_message))
+
+        tokens = []
+        first_token_at = None
+        try:
+            async for token in openai_service.stream_chat_response(formatted_messages):
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                tokens.append(token)
+                yield sse_event("token", {"content": token})
+
+            # Save AI response
+            ai_chat_message = ChatMessage(
+                interview_id=interview_id,
+                role="assistant",
+                content="".join(tokens)
+            )
+            saved_ai_message = await db.save_chat_message(ai_chat_message)
+        except Exception as e:
+            print(f"Error streaming chat response for interview {interview_id}: {e}")
+            yield sse_event("error", {"detail": str(e)})
+            return
+
+        total = time.perf_counter() - start
+        ttft = (first_token_at or time.perf_counter()) - start
+        chat_stream_metrics["time_to_first_token"].record(ttft)
+        chat_stream_metrics["total_latency"].record(total)
+        yield sse_event("done", {
+            "ai_response": jsonable_encoder(saved_ai_message),
+            "metrics": {"ttft_ms": round(ttft * 1000, 1), "total_ms": round(total * 1000, 1)}
+        })
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@app.get("/metrics/chat-stream")
+async def get_chat_stream_metrics():
+    """Get time-to-first-token and total latency of streamed chat responses."""
+    return {name: tracker.snapshot() for name, tracker in chat_stream_metrics.items()}
+
+
+@app.get("/metrics/conversation-cache")
+async def get_conversation_cache_metrics():
+    """Get hit/miss counters of the interview and chat history cache."""
+    return db.conversations.stats()
+
 @app.get("/api/chat/{interview_id}")
 async def get_chat_history(interview_id: str):
     """Get chat history for an interview."""
     try:
-        return db.get_chat_history(interview_id)
+        return await db.get_chat_history(interview_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -307,18 +482,23 @@ async def get_chat_history(interview_id: str):
 async def delete_chat_history(interview_id: str):
     """Delete chat history for an interview."""
     try:
-        # TODO: Implement delete_chat_history in Database class
+        if not await db.delete_chat_history(interview_id):
+            raise HTTPException(status_code=503, detail="Chat storage is unavailable")
         return {"message": "Chat history deleted successfully"}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/interviews")
-async def get_interviews():
-    """Get all interviews."""
+async def get_interviews(response: Response, limit: Optional[int] = PAGE_LIMIT, cursor: Optional[str] = PAGE_CURSOR):
+    """Get all interviews, newest first, or a page of them (see X-Next-Cursor)."""
     try:
-        # Implement a method in the Database class to get all interviews
-        interviews = db.get_all_interviews()
+        interviews, next_cursor = await db.get_all_interviews(page_limit(limit, cursor), cursor)
+        set_next_cursor(response, next_cursor)
         return interviews
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -328,15 +508,17 @@ class CodeRequest(BaseModel):
     code: str
 
 @app.get("/interviews/user/{username}")
-async def get_interviews_by_user(username: str):
-    """Get all interviews for a specific user."""
+async def get_interviews_by_user(username: str, response: Response, limit: Optional[int] = PAGE_LIMIT,
+                                 cursor: Optional[str] = PAGE_CURSOR):
+    """Get all interviews for a specific user, newest first, or a page of them (see X-Next-Cursor)."""
     try:
         # URL decode the username in case it was URL encoded
         import urllib.parse
         decoded_username = urllib.parse.unquote(username)
         
         # Get interviews using the database method
-        interviews = db.get_interviews_by_user(decoded_username)
+        interviews, next_cursor = await db.get_interviews_by_user(decoded_username, page_limit(limit, cursor), cursor)
+        set_next_cursor(response, next_cursor)
         
         # Convert the list of Interview objects to a list of dictionaries
         # with the structure needed by the frontend
@@ -351,6 +533,8 @@ async def get_interviews_by_user(username: str):
             })
         
         return interview_data
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"Error getting interviews for user {username}: {e}")
         raise HTTPException(status_code=500, detail=str(e))    
@@ -363,7 +547,7 @@ async def evaluate_code(interview_id: str, request: CodeRequest):
         code = request.code
         
         # Get interview details
-        interview = db.get_interview(interview_id)
+        interview = await db.get_interview(interview_id)
         if not interview:
             raise HTTPException(status_code=404, detail="Interview not found")
         
@@ -371,7 +555,7 @@ async def evaluate_code(interview_id: str, request: CodeRequest):
         question_id = interview.question_id
         if not question_id:
             # Fallback: try to extract from chat history if not found in interview record
-            chat_history = db.get_chat_history(interview_id)
+            chat_history = await db.get_chat_history(interview_id)
             for message in reversed(chat_history):
                 if message.role == "system" and "Question ID:" in message.content:
                     question_id_match = re.search(r"Question ID: (\w+)", message.content)
@@ -383,7 +567,7 @@ async def evaluate_code(interview_id: str, request: CodeRequest):
             raise HTTPException(status_code=400, detail="No question ID found for this interview")
             
         # Get the question details
-        question = db.get_question_by_id(question_id)
+        question = await db.get_question_by_id(question_id)
         if not question:
             raise HTTPException(status_code=404, detail="Question not found")
             
@@ -419,7 +603,7 @@ async def evaluate_code(interview_id: str, request: CodeRequest):
             prompt += f"\nInclude the following follow-up questions in your response (max 2): {', '.join(follow_ups[:2])}"
         
         # Evaluate the code using OpenAI with our enhanced prompt
-        evaluation = openai_service.evaluate_response(question.text, code, prompt=prompt)
+        evaluation = await openai_service.evaluate_response(question.text, code, prompt=prompt)
         
         # Save both the code submission and the AI evaluation as chat messages
         code_message = ChatMessage(
@@ -427,7 +611,7 @@ async def evaluate_code(interview_id: str, request: CodeRequest):
             role="user",
             content=f"```\n{code}\n```"
         )
-        db.save_chat_message(code_message)
+        await db.save_chat_message(code_message)
         
         # Save the AI evaluation as a system message
         eval_message = ChatMessage(
@@ -435,7 +619,7 @@ async def evaluate_code(interview_id: str, request: CodeRequest):
             role="system",
             content=evaluation
         )
-        saved_eval = db.save_chat_message(eval_message)
+        saved_eval = await db.save_chat_message(eval_message)
         
         # Return just the evaluation to display in the frontend
         return {
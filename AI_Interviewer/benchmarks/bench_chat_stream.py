@@ -0,0 +1,97 @@
+"""
+Compare when the candidate first sees the interviewer's reply with
+POST /api/chat/{interview_id} (whole completion) and the streaming
+POST /api/chat/{interview_id}/stream, against the local fake OpenAI server
+and a stub database. Both the fake server and the service run locally.
+
+Usage (from AI_Interviewer):
+    python -m benchmarks.bench_chat_stream --requests 20 --ttft-ms 400 --token-ms 20
+"""
+
+import os
+import json
+import time
+import asyncio
+import argparse
+import statistics
+
+import httpx
+
+from benchmarks.fake_openai_server import start_in_thread, serve_in_thread
+
+
+async def full_reply(client, index):
+    start = time.perf_counter()
+    response = await client.post(f"/api/chat/interview-{index}", json={"role": "user", "content": "My approach is..."})
+    response.raise_for_status()
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed
+
+
+async def streamed_reply(client, index):
+    start = time.perf_counter()
+    first_token = None
+    async with client.stream("POST", f"/api/chat/interview-{index}/stream",
+                             json={"role": "user", "content": "My approach is..."}) as response:
+        response.raise_for_status()
+        event = None
+        async for line in response.aiter_lines():
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                if event == "token" and first_token is None:
+                    first_token = time.perf_counter() - start
+                elif event == "error":
+                    raise RuntimeError(json.loads(line[len("data: "):])["detail"])
+    return first_token, time.perf_counter() - start
+
+
+async def run(base_url, count):
+    # One event loop for both variants: the service's OpenAI client keeps its connections
+    async with httpx.AsyncClient(base_url=base_url, timeout=None) as client:
+        whole = await asyncio.gather(*(full_reply(client, index) for index in range(count)))
+        streamed = await asyncio.gather(*(streamed_reply(client, index) for index in range(count)))
+    return whole, streamed
+
+
+def report(label, results):
+    first = sorted(result[0] for result in results)
+    total = sorted(result[1] for result in results)
+    print(f"{label:<10} first content p50 {statistics.median(first) * 1000:7.0f} ms   "
+          f"complete p50 {statistics.median(total) * 1000:7.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark streamed versus whole chat replies')
+    parser.add_argument('--requests', type=int, default=20, help='Concurrent chat requests per variant')
+    parser.add_argument('--ttft-ms', type=float, default=400, help='Fake server delay before the first token')
+    parser.add_argument('--token-ms', type=float, default=20, help='Fake server delay between tokens')
+    parser.add_argument('--port', type=int, default=8090, help='Port for the fake server (the service uses the next one)')
+    args = parser.parse_args()
+
+    # The OpenAI client reads its endpoint from config at import time
+    os.environ["OPENAI_BASE_URL"] = start_in_thread(args.port, args.ttft_ms / 1000, args.token_ms / 1000)
+    os.environ.setdefault("OPENAI_API_KEY", "fake")
+
+    import api.async_database
+    from benchmarks.load_test_async import StubDatabase
+    stub_database = StubDatabase(0.002)
+    # Keep app import from connecting to MySQL and DynamoDB
+    api.async_database.Database = lambda: stub_database
+    import app as interviewer_app
+
+    # Served over real HTTP, since the in-process ASGI transport buffers whole responses
+    service_url = serve_in_thread(interviewer_app.app, args.port + 1)
+
+    print(f"{args.requests} concurrent chat requests "
+          f"(fake OpenAI: {args.ttft_ms} ms to first token, {args.token_ms} ms per token)")
+    whole, streamed = asyncio.run(run(service_url, args.requests))
+    report("whole", whole)
+    report("streamed", streamed)
+
+    print("server-side metrics:", json.dumps(
+        {name: tracker.snapshot() for name, tracker in interviewer_app.chat_stream_metrics.items()}))
+
+
+if __name__ == "__main__":
+    main()
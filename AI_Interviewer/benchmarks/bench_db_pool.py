@@ -0,0 +1,86 @@
+"""
+Benchmark concurrent interview reads (the query behind GET /interviews/{id})
+with the pooled Database against the previous single shared connection,
+which concurrent requests had to take turns on.
+
+Requires a reachable MySQL with the interviews table, e.g. a local stand-in:
+    docker run -d -p 3306:3306 -e MYSQL_ROOT_PASSWORD=pass \
+        -e MYSQL_DATABASE=mock_interview_platform mysql:8
+and the MYSQL_* variables from config.py pointing at it.
+
+Usage (from AI_Interviewer):
+    python -m benchmarks.bench_db_pool --interview-id <id> --concurrency 32 --requests 2000
+"""
+
+import time
+import argparse
+import threading
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+import mysql.connector
+
+from api.database import Database
+from config import MYSQL_CONFIG
+
+
+class SharedConnectionReader:
+    """The previous data access: one connection shared by every request."""
+
+    def __init__(self):
+        self.conn = mysql.connector.connect(**MYSQL_CONFIG)
+        # A single connection cannot run queries concurrently
+        self.lock = threading.Lock()
+
+    def get_interview(self, interview_id):
+        with self.lock:
+            cursor = self.conn.cursor(dictionary=True)
+            try:
+                cursor.execute("SELECT * FROM interviews WHERE id = %s", (interview_id,))
+                return cursor.fetchone()
+            finally:
+                cursor.close()
+
+
+def run(read, interview_id, concurrency, requests):
+    def timed_read(_):
+        start = time.perf_counter()
+        read(interview_id)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(timed_read, range(requests)))
+    elapsed = time.perf_counter() - start
+    return elapsed, sorted(latencies)
+
+
+def report(label, elapsed, latencies):
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{label:<18} {len(latencies) / elapsed:8.0f} req/s   "
+          f"p50 {statistics.median(latencies) * 1000:6.2f} ms   p95 {p95 * 1000:6.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pooled versus shared MySQL connections')
+    parser.add_argument('--interview-id', required=True, help='ID of an existing interview')
+    parser.add_argument('--concurrency', type=int, default=32, help='Concurrent readers')
+    parser.add_argument('--requests', type=int, default=2000, help='Reads per variant')
+    args = parser.parse_args()
+
+    shared = SharedConnectionReader()
+    pooled = Database()
+
+    # Warm up both paths
+    run(shared.get_interview, args.interview_id, 4, 50)
+    run(pooled.get_interview, args.interview_id, 4, 50)
+
+    print(f"{args.requests} reads with {args.concurrency} concurrent readers")
+    report("shared connection", *run(shared.get_interview, args.interview_id, args.concurrency, args.requests))
+    report("connection pool", *run(pooled.get_interview, args.interview_id, args.concurrency, args.requests))
+
+    pooled.close()
+
+
+if __name__ == "__main__":
+    main()
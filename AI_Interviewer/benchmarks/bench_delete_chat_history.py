@@ -0,0 +1,93 @@
+"""
+Benchmark deleting the chat history of a long interview: the previous
+approach (load every message as a ChatMessage, then delete through a single
+batch_writer) against Database.delete_chat_history (page through keys only,
+concurrent BatchWriteItem batches).
+
+Requires DynamoDB Local, e.g.:
+    docker run -d -p 8000:8000 amazon/dynamodb-local
+A table with the ChatMessages schema is created if it does not exist.
+
+Usage (from AI_Interviewer):
+    python -m benchmarks.bench_delete_chat_history --messages 5000 --endpoint http://localhost:8000
+"""
+
+import time
+import argparse
+from datetime import datetime, timedelta
+
+import boto3
+
+from api.database import Database
+from api.models import ChatMessage
+from config import AWS_CONFIG
+
+
+def chat_table(endpoint, table_name):
+    dynamodb = boto3.resource('dynamodb', endpoint_url=endpoint, region_name=AWS_CONFIG['region'],
+                              aws_access_key_id=AWS_CONFIG['aws_access_key_id'],
+                              aws_secret_access_key=AWS_CONFIG['aws_secret_access_key'])
+    if table_name not in [table.name for table in dynamodb.tables.all()]:
+        dynamodb.create_table(
+            TableName=table_name,
+            KeySchema=[{'AttributeName': 'message_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': name, 'AttributeType': 'S'}
+                                  for name in ('message_id', 'interview_id', 'timestamp')],
+            GlobalSecondaryIndexes=[{
+                'IndexName': 'interview-time-index',
+                'KeySchema': [{'AttributeName': 'interview_id', 'KeyType': 'HASH'},
+                              {'AttributeName': 'timestamp', 'KeyType': 'RANGE'}],
+                'Projection': {'ProjectionType': 'ALL'}
+            }],
+            BillingMode='PAY_PER_REQUEST'
+        ).wait_until_exists()
+    return dynamodb, dynamodb.Table(table_name)
+
+
+def seed(database, interview_id, count, content_size):
+    start = datetime.now()
+    database.save_chat_messages([
+        ChatMessage(interview_id=interview_id, role="user" if index % 2 else "assistant",
+                    content="x" * content_size, timestamp=start + timedelta(milliseconds=index))
+        for index in range(count)
+    ])
+
+
+def previous_delete(database, interview_id):
+    """The previous Database.delete_chat_history."""
+    messages = database.get_chat_history(interview_id)
+    with database.chat_table.batch_writer() as batch:
+        for message in messages:
+            batch.delete_item(Key={'message_id': message.message_id})
+
+
+def timed(label, delete, database, interview_id, count, content_size):
+    seed(database, interview_id, count, content_size)
+    start = time.perf_counter()
+    delete(interview_id)
+    elapsed = time.perf_counter() - start
+    left = len(database.get_chat_history(interview_id))
+    print(f"{label:<10} {elapsed:7.2f} s   {count / elapsed:8.0f} messages/s   {left} left")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark bulk deletion of a chat history')
+    parser.add_argument('--messages', type=int, default=5000, help='Messages in the interview')
+    parser.add_argument('--content-size', type=int, default=400, help='Characters per message')
+    parser.add_argument('--endpoint', default=AWS_CONFIG['dynamodb_endpoint'], help='DynamoDB Local endpoint')
+    parser.add_argument('--table', default='ChatMessagesBench', help='Table to use (created if missing)')
+    args = parser.parse_args()
+
+    # Only the DynamoDB side of Database is needed, so skip connect() and its MySQL pool
+    database = Database.__new__(Database)
+    database.mysql_pool = None
+    database.dynamodb, database.chat_table = chat_table(args.endpoint, args.table)
+
+    print(f"Deleting an interview with {args.messages} messages of {args.content_size} characters")
+    timed("previous", lambda interview_id: previous_delete(database, interview_id),
+          database, "bench-previous", args.messages, args.content_size)
+    timed("bulk", database.delete_chat_history, database, "bench-bulk", args.messages, args.content_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark picking a random question from a question bank of 10k and 100k
+questions: the previous ORDER BY RAND() query against the QuestionSampler
+(in-memory IDs plus a primary key lookup), with and without excluded
+questions.
+
+Requires a reachable MySQL with the MYSQL_* variables from config.py
+pointing at it (see bench_db_pool.py); a scratch question_bank_bench table
+is created and dropped. --sampler-only times the in-memory pick alone.
+
+Usage (from AI_Interviewer):
+    python -m benchmarks.bench_random_question --sizes 10000 100000 --picks 200
+"""
+
+import time
+import random
+import argparse
+import statistics
+
+from api.question_sampler import QuestionSampler
+
+TABLE = "question_bank_bench"
+
+
+def create_table(conn, size):
+    cursor = conn.cursor()
+    cursor.execute(f"DROP TABLE IF EXISTS {TABLE}")
+    cursor.execute(f"""
+        CREATE TABLE {TABLE} (
+            id INT PRIMARY KEY,
+            text TEXT NOT NULL,
+            difficulty INT NOT NULL,
+            follow_ups TEXT
+        )
+    """)
+    rows = [(index, f"Question {index}: " + "describe the algorithm " * 20, index % 5 + 1,
+             "What is the time complexity?,How would you handle empty input?") for index in range(size)]
+    for start in range(0, size, 5000):
+        cursor.executemany(f"INSERT INTO {TABLE} (id, text, difficulty, follow_ups) VALUES (%s, %s, %s, %s)",
+                           rows[start:start + 5000])
+    conn.commit()
+    cursor.close()
+
+
+def order_by_rand(conn, difficulty):
+    cursor = conn.cursor(dictionary=True)
+    cursor.execute(f"SELECT * FROM {TABLE} WHERE difficulty = %s ORDER BY RAND() LIMIT 1", (difficulty,))
+    row = cursor.fetchone()
+    cursor.close()
+    return row
+
+
+def sampled(conn, sampler, difficulty, exclude):
+    cursor = conn.cursor(dictionary=True)
+    cursor.execute(f"SELECT * FROM {TABLE} WHERE id = %s", (sampler.sample(difficulty, exclude),))
+    row = cursor.fetchone()
+    cursor.close()
+    return row
+
+
+def timed(label, pick, picks):
+    latencies = []
+    for _ in range(picks):
+        start = time.perf_counter()
+        pick()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    print(f"  {label:<28} p50 {statistics.median(latencies) * 1000:9.3f} ms   "
+          f"p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:9.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark random question selection')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000], help='Question bank sizes')
+    parser.add_argument('--picks', type=int, default=200, help='Random picks per variant')
+    parser.add_argument('--excluded', type=int, default=50, help='Questions excluded as already seen')
+    parser.add_argument('--sampler-only', action='store_true', help='Skip the MySQL variants')
+    args = parser.parse_args()
+
+    conn = None
+    if not args.sampler_only:
+        import mysql.connector
+        from config import MYSQL_CONFIG
+        conn = mysql.connector.connect(**MYSQL_CONFIG)
+
+    for size in args.sizes:
+        question_ids = [(index, index % 5 + 1) for index in range(size)]
+        sampler = QuestionSampler(lambda: question_ids)
+        start = time.perf_counter()
+        sampler.refresh()
+        print(f"{size} questions (IDs loaded in {(time.perf_counter() - start) * 1000:.1f} ms)")
+        exclude = {str(random.randrange(size)) for _ in range(args.excluded)}
+
+        timed("sampler", lambda: sampler.sample(3), args.picks)
+        timed(f"sampler, {args.excluded} excluded", lambda: sampler.sample(3, exclude), args.picks)
+        if conn is None:
+            continue
+
+        create_table(conn, size)
+        timed("ORDER BY RAND()", lambda: order_by_rand(conn, 3), args.picks)
+        timed("sampler + id lookup", lambda: sampled(conn, sampler, 3, ()), args.picks)
+        timed("sampler + id lookup, excluded", lambda: sampled(conn, sampler, 3, exclude), args.picks)
+
+    if conn is not None:
+        cursor = conn.cursor()
+        cursor.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        cursor.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
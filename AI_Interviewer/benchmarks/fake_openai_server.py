@@ -0,0 +1,111 @@
+"""
+Local fake of the OpenAI chat completions endpoint, for exercising the
+interviewer without network access or API costs.
+
+Answers POST /v1/chat/completions with a fixed reply, either whole or as a
+server-sent event stream (stream=true), after a configurable delay before the
+first token and between tokens.
+
+Usage (from AI_Interviewer):
+    python -m benchmarks.fake_openai_server --port 8090 --ttft-ms 400 --token-ms 20
+and point the service at it:
+    OPENAI_BASE_URL=http://127.0.0.1:8090/v1 uvicorn app:app
+"""
+
+import time
+import json
+import asyncio
+import argparse
+import threading
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+REPLY = ("Before writing code, walk me through how your approach handles an empty input "
+         "and what its time and space complexity are in the worst case.")
+
+
+def create_app(ttft, token_delay, tokens=None):
+    """
+    Build the fake server.
+
+    Args:
+        ttft (float): Seconds before the first token
+        token_delay (float): Seconds between tokens
+        tokens (list, optional): Content deltas of the reply
+    """
+    tokens = tokens or [word + " " for word in REPLY.split()]
+    app = FastAPI(title="Fake OpenAI")
+
+    def chunk(completion_id, model, delta, finish_reason=None):
+        return {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+        }
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "fake")
+        completion_id = f"chatcmpl-fake-{time.monotonic_ns()}"
+
+        if not body.get("stream"):
+            await asyncio.sleep(ttft + token_delay * (len(tokens) - 1))
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "".join(tokens)},
+                    "finish_reason": "stop"
+                }],
+                "usage": {"prompt_tokens": 0, "completion_tokens": len(tokens), "total_tokens": len(tokens)}
+            }
+
+        async def events():
+            await asyncio.sleep(ttft)
+            yield f"data: {json.dumps(chunk(completion_id, model, {'role': 'assistant', 'content': ''}))}\n\n"
+            for index, token in enumerate(tokens):
+                if index:
+                    await asyncio.sleep(token_delay)
+                yield f"data: {json.dumps(chunk(completion_id, model, {'content': token}))}\n\n"
+            yield f"data: {json.dumps(chunk(completion_id, model, {}, 'stop'))}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def serve_in_thread(app, port):
+    """Serve an ASGI app on a background thread; returns once it accepts connections."""
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+def start_in_thread(port, ttft, token_delay):
+    """Run the fake server on a background thread; returns its OpenAI base URL."""
+    return serve_in_thread(create_app(ttft, token_delay), port) + "/v1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a fake OpenAI chat completions endpoint')
+    parser.add_argument('--port', type=int, default=8090, help='Port to listen on')
+    parser.add_argument('--ttft-ms', type=float, default=400, help='Delay before the first token')
+    parser.add_argument('--token-ms', type=float, default=20, help='Delay between tokens')
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(args.ttft_ms / 1000, args.token_ms / 1000), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Load test of POST /api/chat/{interview_id} with many concurrent interviews,
+using local stubs for MySQL/DynamoDB and OpenAI with fixed latencies.
+
+Compares the previous behaviour (blocking database and OpenAI calls made
+directly on the event loop) with the async service layer (database calls on
+the AsyncDatabase thread pool, awaited OpenAI calls).
+
+Usage (from AI_Interviewer):
+    python -m benchmarks.load_test_async --interviews 200 --db-ms 5 --llm-ms 300
+"""
+
+import time
+import asyncio
+import argparse
+import statistics
+
+import httpx
+
+import api.async_database
+from api.models import Interview, InterviewType
+
+
+class StubDatabase:
+    """Blocking stand-in for Database with a fixed latency per call."""
+
+    def __init__(self, latency):
+        self.latency = latency
+
+    def _wait(self):
+        time.sleep(self.latency)
+
+    def get_interview(self, interview_id):
+        self._wait()
+        return Interview(id=interview_id, title="Load test", job_type="SWE", candidate_name="load",
+                         company="stub", type=InterviewType.TECHNICAL)
+
+    def get_chat_history(self, interview_id, last_n=None):
+        self._wait()
+        return []
+
+    def iter_chat_history(self, interview_id):
+        self._wait()
+        yield []
+
+    def save_chat_message(self, message):
+        self._wait()
+        return message
+
+    def save_chat_messages(self, messages):
+        self._wait()
+
+    def reload_question_bank(self):
+        # Called by the app's startup hook when served over HTTP; the load tests ask no questions
+        return 0
+
+    def close(self):
+        pass
+
+
+class BlockingDatabase:
+    """The previous data access: blocking calls made directly from async endpoints."""
+
+    def __init__(self, database):
+        self.database = database
+
+    async def get_interview(self, interview_id):
+        return self.database.get_interview(interview_id)
+
+    async def get_chat_history(self, interview_id):
+        return self.database.get_chat_history(interview_id)
+
+    async def get_recent_chat_history(self, interview_id, limit):
+        return self.database.get_chat_history(interview_id)[-limit:]
+
+    async def save_chat_message(self, message):
+        return self.database.save_chat_message(message)
+
+
+class StubOpenAIService:
+    """Stand-in for OpenAIService; blocking=True mimics the previous sync client."""
+
+    def __init__(self, latency, blocking):
+        self.latency = latency
+        self.blocking = blocking
+
+    async def generate_chat_response(self, messages):
+        if self.blocking:
+            time.sleep(self.latency)
+        else:
+            await asyncio.sleep(self.latency)
+        return "Stub interviewer reply"
+
+
+async def run_load(app, interviews):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=None) as client:
+        # All requests arrive together, so latency is measured from the burst start
+        start = time.perf_counter()
+
+        async def chat(index):
+            response = await client.post(f"/api/chat/interview-{index}",
+                                         json={"role": "user", "content": "My approach is..."})
+            response.raise_for_status()
+            return time.perf_counter() - start
+
+        latencies = await asyncio.gather(*(chat(index) for index in range(interviews)))
+        return time.perf_counter() - start, sorted(latencies)
+
+
+def report(label, elapsed, latencies):
+    p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+    print(f"{label:<10} total {elapsed:7.2f} s   {len(latencies) / elapsed:7.1f} req/s   "
+          f"p50 {statistics.median(latencies) * 1000:8.0f} ms   p95 {p95 * 1000:8.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the async interviewer endpoints with stubs')
+    parser.add_argument('--interviews', type=int, default=200, help='Concurrent chat requests')
+    parser.add_argument('--db-ms', type=float, default=5, help='Latency of each database call')
+    parser.add_argument('--llm-ms', type=float, default=300, help='Latency of each OpenAI call')
+    args = parser.parse_args()
+
+    stub_database = StubDatabase(args.db_ms / 1000)
+    # Keep app import from connecting to MySQL and DynamoDB
+    api.async_database.Database = lambda: stub_database
+    import app as interviewer_app
+
+    print(f"{args.interviews} concurrent chat requests "
+          f"(database {args.db_ms} ms per call, OpenAI {args.llm_ms} ms)")
+
+    interviewer_app.db = BlockingDatabase(stub_database)
+    interviewer_app.openai_service = StubOpenAIService(args.llm_ms / 1000, blocking=True)
+    report("blocking", *asyncio.run(run_load(interviewer_app.app, args.interviews)))
+
+    interviewer_app.db = api.async_database.AsyncDatabase(stub_database)
+    interviewer_app.openai_service = StubOpenAIService(args.llm_ms / 1000, blocking=False)
+    report("async", *asyncio.run(run_load(interviewer_app.app, args.interviews)))
+
+
+if __name__ == "__main__":
+    main()
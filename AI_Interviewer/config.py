@@ -8,6 +8,8 @@ OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', 'key')
 OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4')
 OPENAI_TEMPERATURE = float(os.getenv('OPENAI_TEMPERATURE', '0.7'))
 OPENAI_MAX_TOKENS = int(os.getenv('OPENAI_MAX_TOKENS', '2000'))
+# Alternative API endpoint, e.g. a local fake completion server for testing
+OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL')
 
 # Database Configuration
 MYSQL_CONFIG = {
@@ -18,6 +20,69 @@ MYSQL_CONFIG = {
     'port': int(os.getenv('MYSQL_PORT', '3306'))
 }
 
+# MySQL connection pool (mysql.connector allows at most 32 connections per pool)
+MYSQL_POOL_CONFIG = {
+    'pool_name': os.getenv('MYSQL_POOL_NAME', 'interviewer_pool'),
+    'pool_size': min(int(os.getenv('MYSQL_POOL_SIZE', '10')), 32),
+    'checkout_timeout': float(os.getenv('MYSQL_POOL_TIMEOUT', '10'))
+}
+
+# Threads running blocking database calls for the async endpoints
+DB_THREADPOOL_SIZE = int(os.getenv('DB_THREADPOOL_SIZE', '32'))
+
+# Write-behind buffer for chat messages, flushed to DynamoDB in the background
+CHAT_WRITE_BUFFER = {
+    'flush_interval_seconds': float(os.getenv('CHAT_FLUSH_INTERVAL', '0.5')),
+    # BatchWriteItem accepts at most 25 items
+    'max_batch_size': min(int(os.getenv('CHAT_FLUSH_BATCH_SIZE', '25')), 25),
+    # Each process spills to its own file (the process ID is added to the name)
+    'spill_path': os.getenv('CHAT_SPILL_PATH', 'chat_spill.jsonl'),
+    # Messages DynamoDB will never accept (e.g. items over 400 KB), kept for inspection
+    'quarantine_path': os.getenv('CHAT_QUARANTINE_PATH', 'chat_quarantine.jsonl'),
+    'shutdown_retries': 3
+}
+
+# In-process cache of active interviews and their chat history
+CONVERSATION_CACHE = {
+    'max_interviews': int(os.getenv('CONVERSATION_CACHE_SIZE', '1024')),
+    'ttl_seconds': float(os.getenv('CONVERSATION_CACHE_TTL', '300')),
+    'max_messages': int(os.getenv('CONVERSATION_CACHE_MAX_MESSAGES', '200'))
+}
+
+# Recent messages sent to OpenAI as context for a chat reply
+CHAT_CONTEXT_MESSAGES = 10
+
+# Messages read per DynamoDB query page when listing a chat history
+CHAT_HISTORY_PAGE_SIZE = int(os.getenv('CHAT_HISTORY_PAGE_SIZE', '200'))
+
+# Bulk deletion of a chat history: concurrent BatchWriteItem calls and retries of unprocessed items
+CHAT_DELETE_CONFIG = {
+    'workers': int(os.getenv('CHAT_DELETE_WORKERS', '8')),
+    'max_retries': 8,
+    'retry_base_seconds': 0.05
+}
+
+# In-memory question IDs for random question selection
+QUESTION_SAMPLER = {
+    'refresh_seconds': float(os.getenv('QUESTION_SAMPLER_REFRESH', '600'))
+}
+
+# In-memory copy of the question bank. Set QUESTION_BANK_VERSION_QUERY to a query whose
+# result changes with the question bank (e.g. SELECT MAX(version) FROM question_bank)
+# to reload as soon as it does; otherwise it is reloaded every refresh_seconds or from
+# POST /admin/question-bank/reload.
+QUESTION_CACHE = {
+    'refresh_seconds': float(os.getenv('QUESTION_CACHE_REFRESH', '3600')),
+    'version_query': os.getenv('QUESTION_BANK_VERSION_QUERY'),
+    'version_check_seconds': float(os.getenv('QUESTION_BANK_VERSION_CHECK', '30'))
+}
+
+# Keyset pagination of interview listings
+INTERVIEW_PAGINATION = {
+    'default_limit': int(os.getenv('INTERVIEW_PAGE_SIZE', '100')),
+    'max_limit': 500
+}
+
 # AWS Configuration for local DynamoDB
 AWS_CONFIG = {
     'region': 'us-east-2',
@@ -0,0 +1,14 @@
+-- Indexes for the paginated interview listings (GET /interviews, /interviews/summary,
+-- /interviews/user/{username}) and the latest final feedback of each listed interview.
+
+-- Latest feedback of a category per interview
+CREATE INDEX idx_interview_feedback_interview_category_created
+    ON interview_feedback (interview_id, category, created_at);
+
+-- A user's interviews, newest first
+CREATE INDEX idx_interviews_candidate_created
+    ON interviews (candidate_name, created_at);
+
+-- All interviews, newest first, with id as the keyset tie-breaker
+CREATE INDEX idx_interviews_created_id
+    ON interviews (created_at, id);
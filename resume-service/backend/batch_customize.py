@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Batch Resume Customization CLI
+
+Tailors one resume PDF to many job descriptions and generates a PDF for each,
+printing one JSON line per job description as soon as it finishes.
+
+Usage:
+    python batch_customize.py --resume resume.pdf jobs/*.txt
+    python batch_customize.py --resume resume.pdf --output results.jsonl jobs/
+"""
+
+import os
+import sys
+import json
+import asyncio
+import argparse
+
+from main import customize_resume_batch, MAX_BATCH_JOB_DESCRIPTIONS
+from pdf_generator.job_queue import get_job_queue
+
+
+def parse_arguments():
+    """
+    Parse command line arguments.
+    
+    Returns:
+        argparse.Namespace: Parsed command line arguments
+    """
+    parser = argparse.ArgumentParser(description='Tailor one resume to many job descriptions and generate PDFs')
+    parser.add_argument('--resume', '-r', required=True, help='Path to the resume PDF')
+    parser.add_argument('--output', '-o', help='Write results to this JSON lines file instead of stdout')
+    parser.add_argument('job_descriptions', nargs='+',
+                        help='Job description text files, or directories containing .txt files')
+    return parser.parse_args()
+
+
+def read_job_descriptions(paths):
+    """
+    Read job description texts from files and directories.
+    
+    Args:
+        paths (list): File paths or directories of .txt files
+        
+    Returns:
+        list: (file path, text) pairs in a stable order
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(
+                os.path.join(path, name) for name in os.listdir(path) if name.endswith('.txt')
+            ))
+        else:
+            files.append(path)
+    
+    job_descriptions = []
+    for file_path in files:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            job_descriptions.append((file_path, f.read()))
+    return job_descriptions
+
+
+async def run_batch(resume_content, job_descriptions, output):
+    texts = [text for _, text in job_descriptions]
+    succeeded = 0
+    async for result in customize_resume_batch(resume_content, texts):
+        if "index" in result:
+            result["job_description_file"] = job_descriptions[result["index"]][0]
+        succeeded += 1 if result.get("success") else 0
+        output.write(json.dumps(result, default=str) + "\n")
+        output.flush()
+    return succeeded
+
+
+def main():
+    """Main function to run a batch customization from the command line."""
+    args = parse_arguments()
+    
+    job_descriptions = read_job_descriptions(args.job_descriptions)
+    if not job_descriptions:
+        print("No job descriptions found.", file=sys.stderr)
+        sys.exit(1)
+    if len(job_descriptions) > MAX_BATCH_JOB_DESCRIPTIONS:
+        print(f"At most {MAX_BATCH_JOB_DESCRIPTIONS} job descriptions per batch.", file=sys.stderr)
+        sys.exit(1)
+    
+    with open(args.resume, 'rb') as f:
+        resume_content = f.read()
+    
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        succeeded = asyncio.run(run_batch(resume_content, job_descriptions, output))
+    finally:
+        if args.output:
+            output.close()
+        get_job_queue().shutdown(wait=True)
+    
+    print(f"Customized {succeeded} of {len(job_descriptions)} resumes.", file=sys.stderr)
+    if succeeded < len(job_descriptions):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark escape_latex_special_chars against the previous chain of
+str.replace calls over every string of a synthetic resume corpus, checking
+that both produce identical output.
+
+Usage (from resume-service/backend):
+    python -m benchmarks.bench_escape --count 2000
+"""
+
+import time
+import argparse
+
+from benchmarks.sample_resumes import make_corpus
+from pdf_generator.constants import LATEX_SPECIAL_CHARS
+from pdf_generator.json_to_pdf import escape_latex_special_chars
+
+
+def escape_with_replace(text):
+    """The previous implementation: one full-string replace per special character."""
+    if text is None:
+        return ""
+    if not isinstance(text, str):
+        return str(text)
+    text = text.replace('\\', r'\textbackslash{}')
+    for char, replacement in LATEX_SPECIAL_CHARS.items():
+        text = text.replace(char, replacement)
+    return text
+
+
+def collect_strings(value, strings):
+    """Collect every string (keys included) from nested resume data."""
+    if isinstance(value, str):
+        strings.append(value)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            strings.append(key)
+            collect_strings(item, strings)
+    elif isinstance(value, list):
+        for item in value:
+            collect_strings(item, strings)
+    return strings
+
+
+def time_escape(escape_fn, strings, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in strings:
+            escape_fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark LaTeX special character escaping')
+    parser.add_argument('--count', type=int, default=2000, help='Number of synthetic resumes')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best is reported)')
+    args = parser.parse_args()
+
+    strings = []
+    for resume in make_corpus(args.count):
+        collect_strings(resume, strings)
+    # Include every special character on its own and all of them together
+    strings.extend(['\\', *LATEX_SPECIAL_CHARS, '\\' + ''.join(LATEX_SPECIAL_CHARS)])
+
+    mismatches = [text for text in strings if escape_latex_special_chars(text) != escape_with_replace(text)]
+    if mismatches:
+        raise SystemExit(f"Output differs for {len(mismatches)} strings, e.g. {mismatches[0]!r}")
+
+    old = time_escape(escape_with_replace, strings, args.repeat)
+    new = time_escape(escape_latex_special_chars, strings, args.repeat)
+
+    print(f"Escaped {len(strings)} strings from {args.count} resumes (outputs identical)")
+    print(f"str.replace chain: {old * 1000:8.1f} ms")
+    print(f"compiled regex:    {new * 1000:8.1f} ms")
+    print(f"Speedup: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark per-resume LaTeX compile time, cold (latexmk) versus warm
+(single pdflatex pass against the precompiled template format).
+
+Usage (from resume-service/backend, requires a TeX distribution with mylatexformat):
+    python -m benchmarks.bench_latex_compile --count 10
+"""
+
+import os
+import time
+import argparse
+import tempfile
+import statistics
+
+from benchmarks.sample_resumes import make_corpus
+from pdf_generator.json_to_pdf import populate_template, read_latex_template, compile_latex
+from pdf_generator.latex_engine import LatexEngine, DEFAULT_TEMPLATE_FILE
+
+
+def time_compiles(tex_files, compile_fn):
+    timings = []
+    for tex_file in tex_files:
+        start = time.perf_counter()
+        if not compile_fn(tex_file):
+            raise RuntimeError(f"Compilation failed for {tex_file}")
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label, timings):
+    print(f"{label:<6} mean {statistics.mean(timings) * 1000:8.1f} ms   "
+          f"median {statistics.median(timings) * 1000:8.1f} ms   "
+          f"max {max(timings) * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark cold versus warm LaTeX compilation')
+    parser.add_argument('--count', type=int, default=10, help='Number of resumes to compile')
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="bench_latex_")
+    template = read_latex_template(DEFAULT_TEMPLATE_FILE)
+
+    tex_files = []
+    for i, resume in enumerate(make_corpus(args.count)):
+        tex_file = os.path.join(work_dir, f"resume_{i}.tex")
+        with open(tex_file, 'w', encoding='utf-8') as f:
+            f.write(populate_template(template, resume))
+        tex_files.append(tex_file)
+
+    engine = LatexEngine(format_dir=os.path.join(work_dir, "formats"))
+    start = time.perf_counter()
+    if not engine.build_format():
+        raise SystemExit("Could not build the template format (is mylatexformat installed?)")
+    print(f"Format build: {(time.perf_counter() - start) * 1000:.1f} ms (one-off, at startup)")
+
+    cold_dir = os.path.join(work_dir, "cold")
+    warm_dir = os.path.join(work_dir, "warm")
+    os.makedirs(warm_dir, exist_ok=True)
+
+    cold = time_compiles(tex_files, lambda f: compile_latex(f, output_dir=cold_dir, cleanup=True))
+    warm = time_compiles(tex_files, lambda f: engine.compile(f, warm_dir))
+
+    print(f"Compiled {args.count} resumes")
+    report("cold", cold)
+    report("warm", warm)
+    print(f"Speedup: {statistics.mean(cold) / statistics.mean(warm):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
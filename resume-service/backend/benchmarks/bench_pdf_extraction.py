@@ -0,0 +1,78 @@
+"""
+Benchmark the PDF text extraction backends on a set of PDFs, reporting
+extraction time and text fidelity (word-level similarity to pdfminer.six,
+the most layout-faithful backend, or to the first backend if it is missing).
+
+Usage (from resume-service/backend):
+    python -m benchmarks.bench_pdf_extraction path/to/resumes/ other.pdf --repeat 3
+"""
+
+import os
+import time
+import argparse
+import difflib
+
+from pdf_extraction import available_backends, extract_pages_with_backend, PDF_MAX_PAGES
+
+
+def collect_pdfs(paths):
+    pdfs = []
+    for path in paths:
+        if os.path.isdir(path):
+            pdfs.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.lower().endswith('.pdf')
+            )
+        else:
+            pdfs.append(path)
+    return pdfs
+
+
+def extract_all(backend, documents, max_pages):
+    return [''.join(page + '\n' for page in extract_pages_with_backend(backend, data, max_pages))
+            for data in documents]
+
+
+def fidelity(text, reference):
+    return difflib.SequenceMatcher(None, text.split(), reference.split(), autojunk=False).ratio()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark PDF text extraction backends')
+    parser.add_argument('paths', nargs='+', help='PDF files or directories of PDFs')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best is reported)')
+    parser.add_argument('--max-pages', type=int, default=PDF_MAX_PAGES, help='Pages extracted per PDF')
+    args = parser.parse_args()
+
+    documents = []
+    for pdf in collect_pdfs(args.paths):
+        with open(pdf, 'rb') as file:
+            documents.append(file.read())
+    if not documents:
+        raise SystemExit("No PDFs found")
+
+    backends = available_backends()
+    if not backends:
+        raise SystemExit("No extraction backend installed (pypdfium2, PyPDF2 or pdfminer.six)")
+
+    results = {}
+    for backend in backends:
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            texts = extract_all(backend, documents, args.max_pages)
+            best = min(best, time.perf_counter() - start)
+        results[backend.name] = (best, texts)
+
+    reference_name = 'pdfminer' if 'pdfminer' in results else backends[0].name
+    reference = results[reference_name][1]
+
+    print(f"Extracted {len(documents)} PDFs (fidelity relative to {reference_name})")
+    for name, (elapsed, texts) in results.items():
+        score = sum(fidelity(text, ref) for text, ref in zip(texts, reference)) / len(texts)
+        print(f"{name:<10} {elapsed * 1000:9.1f} ms   "
+              f"{elapsed * 1000 / len(documents):7.1f} ms/PDF   fidelity {score:.3f}")
+
+
+if __name__ == "__main__":
+    main()
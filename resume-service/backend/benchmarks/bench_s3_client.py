@@ -0,0 +1,103 @@
+"""
+Benchmark per-request S3 latency with the shared client against the previous
+behaviour (a new client plus a list_buckets probe for every file).
+
+Runs against a local S3 stand-in: the endpoint in S3_ENDPOINT_URL (e.g. MinIO),
+or an in-process moto server when S3_ENDPOINT_URL is not set.
+
+Usage (from resume-service/backend):
+    python -m benchmarks.bench_s3_client --count 50
+"""
+
+import os
+import time
+import argparse
+import tempfile
+import statistics
+
+import boto3
+
+
+def start_stand_in():
+    """Point the S3 settings at a local moto server unless an endpoint is configured."""
+    if os.getenv("S3_ENDPOINT_URL"):
+        return None
+    from moto.server import ThreadedMotoServer
+
+    server = ThreadedMotoServer(port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+    os.environ["S3_ENDPOINT_URL"] = f"http://{host}:{port}"
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    return server
+
+
+def previous_client():
+    """The previous get_s3_client(): a new client and a probe request per call."""
+    s3_client = boto3.client(
+        's3',
+        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        region_name=os.getenv("AWS_REGION", "us-east-2"),
+        endpoint_url=os.getenv("S3_ENDPOINT_URL")
+    )
+    s3_client.list_buckets()
+    return s3_client
+
+
+def time_uploads(get_client, file_path, bucket, count):
+    timings = []
+    for index in range(count):
+        start = time.perf_counter()
+        get_client().upload_file(file_path, bucket, f"bench/{index}.pdf")
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label, timings):
+    print(f"{label:<14} mean {statistics.mean(timings) * 1000:7.2f} ms   "
+          f"median {statistics.median(timings) * 1000:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the shared S3 client')
+    parser.add_argument('--count', type=int, default=50, help='Uploads per variant')
+    parser.add_argument('--size', type=int, default=64 * 1024, help='Size of the uploaded file in bytes')
+    args = parser.parse_args()
+
+    server = start_stand_in()
+    try:
+        from pdf_generator.s3_utils import get_s3_client
+
+        bucket = os.getenv("S3_BUCKET_NAME", "bench-resumes")
+        client = get_s3_client()
+        try:
+            client.create_bucket(
+                Bucket=bucket,
+                CreateBucketConfiguration={'LocationConstraint': os.getenv("AWS_REGION", "us-east-2")}
+            )
+        except client.exceptions.BucketAlreadyOwnedByYou:
+            pass
+
+        with tempfile.NamedTemporaryFile(suffix='.pdf') as file:
+            file.write(os.urandom(args.size))
+            file.flush()
+            # Warm up both paths (imports, endpoint resolution)
+            time_uploads(previous_client, file.name, bucket, 2)
+            time_uploads(get_s3_client, file.name, bucket, 2)
+
+            old = time_uploads(previous_client, file.name, bucket, args.count)
+            new = time_uploads(get_s3_client, file.name, bucket, args.count)
+
+        print(f"{args.count} uploads of {args.size} bytes to {os.environ['S3_ENDPOINT_URL']}")
+        report("client per call", old)
+        report("shared client", new)
+        print(f"Saved per request: {(statistics.mean(old) - statistics.mean(new)) * 1000:.2f} ms")
+    finally:
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark uploading a resume's PDF, LaTeX and JSON: the previous three serial
+upload_file calls from disk versus upload_resume_files, which uploads all
+three concurrently from memory.
+
+Runs against a local S3 stand-in (see benchmarks.bench_s3_client). Use
+--latency to add a simulated per-request round-trip time to every S3 call.
+
+Usage (from resume-service/backend):
+    python -m benchmarks.bench_s3_upload --count 30 --latency 20
+"""
+
+import os
+import time
+import json
+import argparse
+import tempfile
+import statistics
+
+from benchmarks.bench_s3_client import start_stand_in
+from benchmarks.sample_resumes import make_resume
+
+
+def add_latency(s3_client, latency_ms):
+    """Sleep before every request the client sends, simulating a remote endpoint."""
+    def delay(**kwargs):
+        time.sleep(latency_ms / 1000)
+    s3_client.meta.events.register('before-send.s3.*', delay)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark serial versus concurrent artifact uploads')
+    parser.add_argument('--count', type=int, default=30, help='Resumes uploaded per variant')
+    parser.add_argument('--pdf-size', type=int, default=60 * 1024, help='Size of the PDF in bytes')
+    parser.add_argument('--latency', type=float, default=0, help='Simulated round-trip time per request in ms')
+    args = parser.parse_args()
+
+    server = start_stand_in()
+    try:
+        from pdf_generator.s3_utils import get_s3_client, upload_file_to_s3
+        from pdf_generator.generate_pdf import upload_resume_files
+
+        bucket = os.environ.setdefault("S3_BUCKET_NAME", "bench-resumes")
+        client = get_s3_client()
+        try:
+            client.create_bucket(
+                Bucket=bucket,
+                CreateBucketConfiguration={'LocationConstraint': os.getenv("AWS_REGION", "us-east-2")}
+            )
+        except client.exceptions.BucketAlreadyOwnedByYou:
+            pass
+        if args.latency:
+            add_latency(client, args.latency)
+
+        json_content = json.dumps(make_resume(0), indent=2)
+        latex_content = "\\documentclass{article}\n" + "x" * 8000
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf_path = os.path.join(tmp, "resume.pdf")
+            latex_path = os.path.join(tmp, "resume.tex")
+            json_path = os.path.join(tmp, "resume.json")
+            with open(pdf_path, 'wb') as f:
+                f.write(os.urandom(args.pdf_size))
+            with open(latex_path, 'w') as f:
+                f.write(latex_content)
+            with open(json_path, 'w') as f:
+                f.write(json_content)
+
+            def serial(index):
+                upload_file_to_s3(pdf_path, bucket, f"resumes/serial-{index}.pdf", 'application/pdf')
+                upload_file_to_s3(latex_path, bucket, f"latex/serial-{index}.tex", 'text/plain')
+                upload_file_to_s3(json_path, bucket, f"json/serial-{index}.json", 'application/json')
+
+            def concurrent(index):
+                urls = upload_resume_files(
+                    f"concurrent-{index}", pdf_path=pdf_path, latex_content=latex_content,
+                    json_content=json_content, json_filename=f"concurrent-{index}.json"
+                )
+                if not all(urls.values()):
+                    raise RuntimeError(f"Upload failed: {urls}")
+
+            results = {}
+            for label, upload in (("serial", serial), ("concurrent", concurrent)):
+                upload(-1)  # Warm up
+                timings = []
+                for index in range(args.count):
+                    start = time.perf_counter()
+                    upload(index)
+                    timings.append(time.perf_counter() - start)
+                results[label] = timings
+
+        print(f"{args.count} resumes (PDF {args.pdf_size} bytes, simulated latency {args.latency} ms)")
+        for label, timings in results.items():
+            print(f"{label:<11} mean {statistics.mean(timings) * 1000:7.2f} ms   "
+                  f"median {statistics.median(timings) * 1000:7.2f} ms")
+        print(f"Speedup: {statistics.mean(results['serial']) / statistics.mean(results['concurrent']):.1f}x")
+    finally:
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
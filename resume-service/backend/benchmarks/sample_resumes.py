@@ -0,0 +1,94 @@
+"""
+Synthetic resume data for the benchmark scripts.
+
+The generated resumes follow the structure returned by /customize-resume/ and
+deliberately include LaTeX special characters so escaping is exercised.
+"""
+
+import random
+
+FIRST_NAMES = ["Jake", "Priya", "Wei", "Maria", "Omar", "Elena", "Noah", "Aiko"]
+LAST_NAMES = ["Ryan", "Sharma", "Zhang", "Garcia", "Haddad", "Petrova", "Smith", "Tanaka"]
+COMPANIES = ["Acme & Co", "Globex", "Initech", "Umbrella_Corp", "Hooli", "Stark Industries"]
+SCHOOLS = ["San Jose State University", "Southwestern University", "Blinn College"]
+SKILLS = ["Python", "C++", "C#", "SQL", "React", "Node.js", "Docker", "AWS", "LaTeX", "R&D", "CI/CD", "pandas"]
+VERBS = ["Developed", "Optimized", "Designed", "Led", "Automated", "Migrated", "Reduced", "Built"]
+OBJECTS = [
+    "a REST API serving 10k+ req/s",
+    "the billing pipeline cutting costs by 35%",
+    "a $2M data platform with ~99.9% uptime",
+    "CI/CD for 40 micro_services",
+    "a feature store {online & offline}",
+    "C:\\tools\\build scripts for #infra",
+    "x^2 scaling tests for the search index",
+]
+
+
+def make_resume(seed, experiences=4, bullets=5, projects=3):
+    """
+    Build one synthetic resume.
+
+    Args:
+        seed (int): Seed for reproducible content
+        experiences (int): Number of experience entries
+        bullets (int): Number of bullet points per entry
+        projects (int): Number of projects
+
+    Returns:
+        dict: Resume data in the customized resume JSON format
+    """
+    rng = random.Random(seed)
+
+    def sentence():
+        return f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(SKILLS)}"
+
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    return {
+        "personal_info": {
+            "name": name,
+            "phone": "408-555-0199",
+            "email": f"{name.split()[0].lower()}@example.com",
+            "linkedin": f"linkedin.com/in/{name.replace(' ', '_').lower()}",
+            "github": f"github.com/{name.split()[1].lower()}"
+        },
+        "education": [
+            {
+                "institution": rng.choice(SCHOOLS),
+                "location": "San Jose, CA",
+                "degree": "Master of Science in Computer Science",
+                "dates": "Aug 2023 – May 2025",
+                "details": ["GPA: 3.9/4.0", "Coursework: Distributed Systems & ML"]
+            }
+        ],
+        "experience": [
+            {
+                "company": rng.choice(COMPANIES),
+                "title": "Software Engineer",
+                "location": "Remote",
+                "dates": f"Jan {2015 + i} – Dec {2016 + i}",
+                "details": [sentence() for _ in range(bullets)]
+            }
+            for i in range(experiences)
+        ],
+        "projects": [
+            {
+                "name": f"Project_{i} #{seed}",
+                "technologies_used": rng.sample(SKILLS, 4),
+                "details": [sentence() for _ in range(bullets - 2)]
+            }
+            for i in range(projects)
+        ],
+        "skills": {
+            "Technical Skills": {
+                "Languages": rng.sample(SKILLS, 5),
+                "Frameworks": rng.sample(SKILLS, 4)
+            },
+            "Tools": rng.sample(SKILLS, 6),
+            "Soft Skills": "Communication & mentoring"
+        }
+    }
+
+
+def make_corpus(count, **kwargs):
+    """Build a list of synthetic resumes with seeds 0..count-1."""
+    return [make_resume(seed, **kwargs) for seed in range(count)]
@@ -0,0 +1,250 @@
+"""
+HTTP Response Helpers
+
+Byte-range (RFC 7233) handling, content-hash ETags with conditional GETs for
+generated files, and a small LRU cache for recently served file contents.
+"""
+
+import os
+import re
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+from fastapi import HTTPException
+from fastapi.responses import Response, FileResponse
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+
+# Generated files keep their name when regenerated, so clients revalidate them
+# (a 304 when unchanged); a URL pinned to a content hash can be cached forever
+CACHE_CONTROL_REVALIDATE = "no-cache"
+CACHE_CONTROL_IMMUTABLE = "public, max-age=31536000, immutable"
+
+# Most entries kept in the ETag cache before it is reset
+ETAG_CACHE_SIZE = 4096
+
+BYTE_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_byte_range(range_header, size):
+    """
+    Parse a single-range Range header.
+
+    Args:
+        range_header (str): Value of the Range header, or None
+        size (int): Size of the full content in bytes
+
+    Returns:
+        tuple: Inclusive (start, end) offsets, or None to send the full content
+        (no header, or a header this parser ignores such as multiple ranges)
+
+    Raises:
+        HTTPException: 416 if the range cannot be satisfied
+    """
+    if not range_header:
+        return None
+    match = BYTE_RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise HTTPException(status_code=416, detail="Range not satisfiable",
+                                headers={"Content-Range": f"bytes */{size}"})
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise HTTPException(status_code=416, detail="Range not satisfiable",
+                            headers={"Content-Range": f"bytes */{size}"})
+    return start, end
+
+
+def bytes_response(content, media_type, range_header=None, headers=None):
+    """
+    Build a response for in-memory content, honouring a Range header.
+
+    Args:
+        content (bytes): Full content
+        media_type (str): Content type of the response
+        range_header (str, optional): Value of the request's Range header
+        headers (dict, optional): Extra response headers
+
+    Returns:
+        Response: 200 with the full content, or 206 with the requested range
+    """
+    headers = {"Accept-Ranges": "bytes", **(headers or {})}
+    byte_range = parse_byte_range(range_header, len(content))
+    if byte_range is None:
+        return Response(content=content, media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{len(content)}"
+    return Response(content=content[start:end + 1], status_code=206, media_type=media_type, headers=headers)
+
+
+class BytesLRUCache:
+    """
+    Thread-safe LRU cache of small byte strings with a time-to-live.
+
+    Args:
+        max_entries (int): Maximum number of cached items
+        max_item_bytes (int): Larger items are not cached
+        ttl (float): Seconds an item stays valid
+    """
+
+    def __init__(self, max_entries=64, max_item_bytes=512 * 1024, ttl=300):
+        self.max_entries = max_entries
+        self.max_item_bytes = max_item_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            content, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return content
+
+    def put(self, key, content):
+        if len(content) > self.max_item_bytes:
+            return
+        with self._lock:
+            self._entries[key] = (content, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_etag_cache = {}
+_etag_cache_lock = threading.Lock()
+
+
+def file_etag(path, stat_result=None):
+    """
+    Get the strong ETag of a file, derived from the SHA-256 of its content.
+
+    The hash is cached per path until the file's size or mtime changes.
+
+    Args:
+        path (str): Path to the file
+        stat_result (os.stat_result, optional): Result of os.stat(path)
+
+    Returns:
+        str: Quoted ETag value
+    """
+    path = os.path.abspath(str(path))
+    stat_result = stat_result or os.stat(path)
+    version = (stat_result.st_mtime_ns, stat_result.st_size)
+
+    with _etag_cache_lock:
+        cached = _etag_cache.get(path)
+        if cached and cached[0] == version:
+            return cached[1]
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    etag = f'"{digest.hexdigest()[:32]}"'
+
+    with _etag_cache_lock:
+        if len(_etag_cache) >= ETAG_CACHE_SIZE:
+            _etag_cache.clear()
+        _etag_cache[path] = (version, etag)
+    return etag
+
+
+def etag_matches(if_none_match, etag):
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
+def conditional_file_response(path, media_type, request_headers, headers=None, pinned_version=None):
+    """
+    Serve a file with a content-hash ETag, answering conditional and Range requests.
+
+    Args:
+        path (str): Path to the file
+        media_type (str): Content type of the response
+        request_headers: Headers of the request
+        headers (dict, optional): Extra response headers (e.g. Content-Disposition)
+        pinned_version (str, optional): Content hash the URL was requested with; when it
+            matches the file, the URL is content-addressed and may be cached forever
+
+    Returns:
+        Response: 304 if the client's copy is current, 206 for a satisfiable Range,
+        otherwise the whole file
+    """
+    stat_result = os.stat(path)
+    etag = file_etag(path, stat_result)
+    immutable = pinned_version is not None and f'"{pinned_version}"' == etag
+    headers = {
+        **(headers or {}),
+        "ETag": etag,
+        "Cache-Control": CACHE_CONTROL_IMMUTABLE if immutable else CACHE_CONTROL_REVALIDATE,
+        "Accept-Ranges": "bytes"
+    }
+
+    if etag_matches(request_headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    # A Range only applies to the version the client already holds part of
+    range_header = request_headers.get("range")
+    if_range = request_headers.get("if-range")
+    if range_header and (not if_range or if_range.strip() == etag):
+        byte_range = parse_byte_range(range_header, stat_result.st_size)
+        if byte_range is not None:
+            start, end = byte_range
+            with open(path, 'rb') as file:
+                file.seek(start)
+                content = file.read(end - start + 1)
+            headers["Content-Range"] = f"bytes {start}-{end}/{stat_result.st_size}"
+            return Response(content=content, status_code=206, media_type=media_type, headers=headers)
+
+    return FileResponse(path, media_type=media_type, headers=headers, stat_result=stat_result)
+
+
+class ContentHashStaticFiles(StaticFiles):
+    """
+    StaticFiles that sends content-hash ETags (instead of mtime/size based ones)
+    and asks clients to revalidate, so repeat requests become 304s.
+    """
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        request_headers = Headers(scope=scope)
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            stat_result=stat_result,
+            method=scope["method"],
+            headers={
+                "ETag": file_etag(full_path, stat_result),
+                "Cache-Control": CACHE_CONTROL_REVALIDATE
+            }
+        )
+        if etag_matches(request_headers.get("if-none-match"), response.headers["etag"]):
+            return Response(status_code=304, headers={
+                "ETag": response.headers["etag"],
+                "Cache-Control": CACHE_CONTROL_REVALIDATE
+            })
+        return response
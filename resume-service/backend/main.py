@@ -1,24 +1,31 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Depends
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Depends, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse, StreamingResponse, Response, RedirectResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse, StreamingResponse, RedirectResponse
 import os
-import PyPDF2
-import io
 import json
 import re
 import base64
 import logging
-import tempfile
-from typing import Dict, List, Any, Optional, Callable
+import asyncio
+import uuid
+from typing import Dict, List, Any, Optional, Callable, AsyncIterator, Iterator
 from functools import lru_cache
 from dotenv import load_dotenv
 from openai import OpenAI
-from pdf_generator.generate_pdf import generate_resume_pdf, save_resume_json
-from pdf_generator.s3_utils import generate_presigned_url, parse_s3_url, download_file_from_s3
+from pdf_generator.generate_pdf import generate_resume_artifacts
+from pdf_generator.job_queue import get_job_queue, JobQueueBusy
+from pdf_generator.compile_pool import shutdown_compile_pool
+from pdf_generator.latex_engine import get_latex_engine
+from pdf_generator.template_compiler import load_template, compile_template
+from pdf_generator.s3_utils import generate_presigned_url, parse_s3_url, open_s3_object, head_s3_object
+from botocore.exceptions import ClientError
+from pdf_extraction import extract_text, PDFTooLargeError
+from uploads import UploadSizeLimitMiddleware, pdf_upload_view, MAX_UPLOAD_BYTES
+from http_utils import BytesLRUCache, bytes_response, conditional_file_response, file_etag, ContentHashStaticFiles
 from datetime import datetime
 from contextlib import contextmanager
 from pathlib import Path
+from urllib.parse import urlencode
 # Import prompts
 from prompts import (
     DOCUMENT_PARSER_SYSTEM_PROMPT,
@@ -46,6 +53,12 @@ logger = logging.getLogger(__name__)
 # Constants
 MODEL_NAME = "gpt-4.1-nano"
 OUTPUT_DIR = "output"
+BATCH_TAILORING_CONCURRENCY = int(os.getenv("BATCH_TAILORING_CONCURRENCY", "5"))
+MAX_BATCH_JOB_DESCRIPTIONS = 50
+S3_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Recently viewed LaTeX sources from S3, keyed by (bucket, object name)
+latex_source_cache = BytesLRUCache(max_entries=64, max_item_bytes=512 * 1024, ttl=300)
 
 # Ensure output directory exists
 os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -93,6 +106,9 @@ def handle_errors(operation_name: str, error_status: int = 500):
     """
     try:
         yield
+    except HTTPException:
+        # Already carries its own status code (e.g. 413 from PDF extraction)
+        raise
     except Exception as e:
         logger.error(f"{operation_name} error: {str(e)}")
         raise HTTPException(status_code=error_status, detail=f"{operation_name} error: {str(e)}")
@@ -150,19 +166,26 @@ def call_ai_service(prompt: str, system_prompt: str, json_response: bool = True)
 # DOCUMENT PROCESSING FUNCTIONS
 #------------------------------------------------------------
 
-def extract_text_from_pdf(pdf_file: bytes) -> str:
+def extract_text_from_pdf(pdf_file) -> str:
     """
     Extract text content from a PDF file.
     
+    Uses the fastest installed extraction backend (see pdf_extraction). This is
+    CPU-bound, so async endpoints should call it through asyncio.to_thread.
+    
     Args:
-        pdf_file: Binary PDF file content
+        pdf_file: Binary PDF file content (bytes, or a memoryview from pdf_upload_view)
         
     Returns:
         Extracted text from the PDF
     """
-    with handle_errors("PDF extraction"):
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_file))
-        return "".join(page.extract_text() + "\n" for page in pdf_reader.pages)
+    try:
+        return extract_text(pdf_file)
+    except PDFTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        logger.error(f"PDF extraction error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"PDF extraction error: {str(e)}")
 
 def analyze_document_with_ai(text: str, parse_type: str) -> Dict[str, Any]:
     """
@@ -360,6 +383,117 @@ def create_resume_filename(customized_resume: Dict[str, Any], job_description: D
         timestamp = datetime.now().strftime("%m%d%Y_%H%M%S")
         return f"resume-{timestamp}"
 
+def pdf_links(pdf_path: str) -> Dict[str, str]:
+    """
+    Build the view and download URLs of a generated PDF, pinned to its content.
+    
+    The `v` parameter is the PDF's ETag value, so browsers may cache the responses
+    as immutable; a regenerated PDF gets new URLs.
+    
+    Args:
+        pdf_path: Local path of the generated PDF
+        
+    Returns:
+        Dictionary with view_url and download_url, or an empty dictionary if the
+        PDF is missing
+    """
+    try:
+        version = file_etag(pdf_path).strip('"')
+    except OSError:
+        return {}
+    query = urlencode({"path": os.path.relpath(pdf_path, os.path.abspath(OUTPUT_DIR)), "v": version})
+    return {"view_url": f"/view-pdf/?{query}", "download_url": f"/download-pdf/?{query}"}
+
+async def customize_resume_batch(resume_content, job_description_texts: List[str]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Tailor one resume to many job descriptions, yielding each result as soon as it is ready.
+    
+    The resume is extracted and parsed once. Job description parsing and tailoring
+    run in threads with at most BATCH_TAILORING_CONCURRENCY AI calls in flight, and
+    the PDFs are generated on the background job queue's worker pool.
+    
+    Args:
+        resume_content: Binary PDF file content of the resume (bytes or memoryview)
+        job_description_texts: Job descriptions as text
+        
+    Yields:
+        Dictionary per job description with its index, the customized resume and
+        the generated artifacts, or the error that occurred
+    """
+    resume_text = await asyncio.to_thread(extract_text_from_pdf, resume_content)
+    parsed_resume = await asyncio.to_thread(extract_resume_data, resume_text)
+    
+    semaphore = asyncio.Semaphore(BATCH_TAILORING_CONCURRENCY)
+    job_queue = get_job_queue()
+    # Keeps this batch's files and S3 objects apart from other batches and single requests
+    batch_id = uuid.uuid4().hex[:8]
+    
+    async def tailor_one(index: int, job_description_text: str) -> Dict[str, Any]:
+        try:
+            async with semaphore:
+                parsed_job_description = await asyncio.to_thread(extract_job_description_data, job_description_text)
+                customized_resume = await asyncio.to_thread(tailor_resume_for_job, parsed_resume, parsed_job_description)
+                
+                # Suffix with the batch and position so two postings at one company don't overwrite each other
+                custom_filename = f"{create_resume_filename(customized_resume, parsed_job_description)}-{batch_id}-{index + 1}"
+                # A batch waits for room in the PDF queue (holding its slot, so tailoring slows down too)
+                job_id = await asyncio.to_thread(
+                    job_queue.submit, "resume_artifacts", generate_resume_artifacts, customized_resume, custom_filename,
+                    submit_timeout=None
+                )
+            
+            future = job_queue.get_future(job_id)
+            if future is not None:
+                artifacts = await asyncio.wrap_future(future)
+            else:
+                artifacts = (job_queue.get_job(job_id) or {}).get("result") or {}
+            
+            result = {
+                "index": index,
+                "success": True,
+                "customized_resume": customized_resume,
+                "job_id": job_id,
+                "custom_filename": f"{custom_filename}.pdf"
+            }
+            result.update({key: value for key, value in artifacts.items() if value})
+            if artifacts.get("pdf_path"):
+                result.update(await asyncio.to_thread(pdf_links, artifacts["pdf_path"]))
+            return result
+        except Exception as e:
+            detail = e.detail if isinstance(e, HTTPException) else str(e)
+            logger.error(f"Batch item {index} failed: {detail}")
+            return {"index": index, "success": False, "error": detail}
+    
+    tasks = [asyncio.create_task(tailor_one(index, text)) for index, text in enumerate(job_description_texts)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+def stream_s3_body(body, cache_key=None) -> Iterator[bytes]:
+    """
+    Stream an S3 object body in chunks, closing it when done.
+    
+    Args:
+        body: botocore StreamingBody from get_object
+        cache_key: If given, the complete content is stored in latex_source_cache
+        
+    Yields:
+        Chunks of the object content
+    """
+    chunks = []
+    try:
+        for chunk in body.iter_chunks(S3_STREAM_CHUNK_SIZE):
+            if cache_key is not None:
+                chunks.append(chunk)
+            yield chunk
+        if cache_key is not None:
+            latex_source_cache.put(cache_key, b"".join(chunks))
+    finally:
+        body.close()
+
 #------------------------------------------------------------
 # FASTAPI APPLICATION SETUP
 #------------------------------------------------------------
@@ -371,6 +505,14 @@ app = FastAPI(
     version="1.0.0",
 )
 
+# Reject oversized uploads before their multipart body is parsed
+# (added before CORS so that 413 responses still carry CORS headers)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_bytes=MAX_UPLOAD_BYTES,
+    path_prefixes=("/customize-resume/",)
+)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -397,6 +539,7 @@ async def health_check():
 async def customize_resume_endpoint(
     job_description_text: str = Form(..., description="Job description as text"),
     resume: UploadFile = File(...),
+    async_pdf: bool = Form(False, description="Return immediately and generate the PDF in the background (default: wait for the PDF)"),
     client: OpenAI = Depends(get_client)
 ):
     """
@@ -404,16 +547,19 @@ async def customize_resume_endpoint(
     
     - **job_description_text**: The job description as text
     - **resume**: A PDF file containing the applicant's resume
+    - **async_pdf**: Defaults to false, so the request waits for the PDF to be generated and
+      uploaded. If true, return as soon as the resume is tailored; poll `/jobs/{job_id}` for the PDF
     
-    Returns a JSON with the customized resume content and PDF path.
+    Returns a JSON with the customized resume content and PDF path (or the PDF job ID).
+    The `view_url` and `download_url` of the PDF are pinned to its content and cacheable.
     """
     with handle_errors("Resume customization"):
         # Parse job description
         parsed_job_description = extract_job_description_data(job_description_text)
         
-        # Read and parse resume
-        resume_content = await resume.read()
-        resume_text = extract_text_from_pdf(resume_content)
+        # Parse the resume straight from the spooled upload
+        with pdf_upload_view(resume) as resume_content:
+            resume_text = await asyncio.to_thread(extract_text_from_pdf, resume_content)
         parsed_resume = extract_resume_data(resume_text)
         
         # Generate customized resume content
@@ -422,49 +568,114 @@ async def customize_resume_endpoint(
         # Create filename for the resume
         custom_filename = create_resume_filename(customized_resume, parsed_job_description)
         
-        # Generate PDF from the customized resume data
-        pdf_path = None
-        json_path = None
-        s3_pdf_url = None
-        s3_json_url = None
+        # Queue JSON storage, PDF generation and S3 uploads on the worker pool
+        job_queue = get_job_queue()
         try:
-            # Save JSON for reference
-            json_path, s3_json_url = save_resume_json(customized_resume)
-            
-            # Generate PDF with reduced log output, using custom filename if available
-            pdf_path, s3_pdf_url = generate_resume_pdf(customized_resume, verbose=False, output_filename=custom_filename)
-        except Exception as e:
-            # Log the error but continue, as the JSON response is still useful
-            logger.error(f"Error generating PDF: {str(e)}")
+            job_id = job_queue.submit("resume_artifacts", generate_resume_artifacts, customized_resume, custom_filename)
+        except JobQueueBusy as e:
+            raise HTTPException(status_code=503, detail=f"PDF generation is busy, please retry: {e}")
         
-        # Return the results - include customized resume and PDF path if available
         response = {
             "success": True,
-            "customized_resume": customized_resume
+            "customized_resume": customized_resume,
+            "job_id": job_id
         }
         
+        if async_pdf:
+            response["job_status_url"] = f"/jobs/{job_id}"
+            response["custom_filename"] = f"{custom_filename}.pdf"
+            return response
+        
+        # Wait for the job without blocking the event loop
+        artifacts = {}
+        future = job_queue.get_future(job_id)
+        try:
+            if future is not None:
+                artifacts = await asyncio.wrap_future(future)
+            else:
+                artifacts = (job_queue.get_job(job_id) or {}).get("result") or {}
+        except Exception as e:
+            # Log the error but continue, as the JSON response is still useful
+            logger.error(f"Error generating PDF: {str(e)}")
+        
         # Include paths and URLs in the response
-        if pdf_path:
-            response["pdf_path"] = pdf_path
+        if artifacts.get("pdf_path"):
+            response["pdf_path"] = artifacts["pdf_path"]
+            response.update(await asyncio.to_thread(pdf_links, artifacts["pdf_path"]))
             if custom_filename:
                 response["custom_filename"] = f"{custom_filename}.pdf"
-        if s3_pdf_url:
-            response["s3_pdf_url"] = s3_pdf_url
-        if json_path:
-            response["json_path"] = json_path
-        if s3_json_url:
-            response["s3_json_url"] = s3_json_url
+        for key in ["s3_pdf_url", "json_path", "s3_json_url"]:
+            if artifacts.get(key):
+                response[key] = artifacts[key]
             
         return response
 
+@app.post("/customize-resume/batch/")
+async def customize_resume_batch_endpoint(
+    job_descriptions: List[str] = Form(..., description="Job descriptions as text, one form field each"),
+    resume: UploadFile = File(...)
+):
+    """
+    Tailor one resume to several job descriptions at once.
+    
+    - **job_descriptions**: Repeat this field once per job description
+    - **resume**: A PDF file containing the applicant's resume
+    
+    Streams newline-delimited JSON, one object per job description in completion
+    order, each with its `index` in the request.
+    """
+    if len(job_descriptions) > MAX_BATCH_JOB_DESCRIPTIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_JOB_DESCRIPTIONS} job descriptions per batch"
+        )
+    
+    async def stream_results():
+        try:
+            # The upload stays open until the response has been streamed
+            with pdf_upload_view(resume) as resume_content:
+                async for result in customize_resume_batch(resume_content, job_descriptions):
+                    yield json.dumps(result, default=str) + "\n"
+        except Exception as e:
+            # The response has already started, so report resume-level failures in the stream
+            detail = e.detail if isinstance(e, HTTPException) else str(e)
+            yield json.dumps({"success": False, "error": detail}) + "\n"
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+@app.get("/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """
+    Get the status of a background PDF generation job.
+    
+    Args:
+        job_id: The job ID returned by /customize-resume/
+        
+    Returns:
+        The job status (queued, running, completed or failed) and, once completed,
+        the local paths and S3 URLs of the generated artifacts and the PDF's
+        view and download URLs
+    """
+    job = get_job_queue().get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    result = job.get("result") or {}
+    if result.get("pdf_path"):
+        job["result"] = {**result, **await asyncio.to_thread(pdf_links, result["pdf_path"])}
+    return job
+
 @app.get("/view-pdf/")
-async def view_pdf_endpoint(path: str = None, s3_url: str = None):
+async def view_pdf_endpoint(request: Request, path: str = None, s3_url: str = None, v: str = None):
     """
     Serve a generated PDF for viewing
     
+    Local PDFs carry a content-hash ETag, so repeat views are answered with 304,
+    and Range requests are served for incremental loading in the PDF viewer.
+    
     Args:
         path: The path to the generated PDF (relative to the output directory)
         s3_url: The S3 URL of the PDF (in the format s3://bucket-name/object-name)
+        v: Content hash (the ETag value) the URL is pinned to; matching responses are cached as immutable
         
     Returns:
         The PDF file as a streaming response or a redirect to a presigned URL
@@ -494,19 +705,24 @@ async def view_pdf_endpoint(path: str = None, s3_url: str = None):
         
         # Return PDF for viewing in browser
         logger.info(f"Serving PDF for viewing: {pdf_path}")
-        return FileResponse(pdf_path, media_type="application/pdf")
+        return await asyncio.to_thread(
+            conditional_file_response, pdf_path, "application/pdf", request.headers, pinned_version=v
+        )
     
     else:
         raise HTTPException(status_code=400, detail="Either path or s3_url is required")
 
 @app.get("/download-pdf/")
-async def download_pdf_endpoint(path: str = None, s3_url: str = None):
+async def download_pdf_endpoint(request: Request, path: str = None, s3_url: str = None, v: str = None):
     """
     Download a generated PDF
     
+    Local PDFs support ETag revalidation and Range requests, as in /view-pdf/.
+    
     Args:
         path: The path to the generated PDF (relative to the output directory)
         s3_url: The S3 URL of the PDF (in the format s3://bucket-name/object-name)
+        v: Content hash (the ETag value) the URL is pinned to; matching responses are cached as immutable
         
     Returns:
         The PDF file as an attachment or a redirect to a presigned URL for download
@@ -540,27 +756,32 @@ async def download_pdf_endpoint(path: str = None, s3_url: str = None):
         # Return PDF as attachment for download
         logger.info(f"Serving PDF for download: {pdf_path}")
         headers = {"Content-Disposition": f"attachment; filename={filename}"}
-        return FileResponse(pdf_path, headers=headers, media_type="application/pdf")
+        return await asyncio.to_thread(
+            conditional_file_response, pdf_path, "application/pdf", request.headers,
+            headers=headers, pinned_version=v
+        )
     
     else:
         raise HTTPException(status_code=400, detail="Either path or s3_url is required")
 
 @app.get("/view-latex/")
-async def view_latex(path: str = None, s3_url: str = None):
+async def view_latex(path: str = None, s3_url: str = None, range_header: Optional[str] = Header(None, alias="Range")):
     """
     View the LaTeX source for a PDF file.
     
+    Sources in S3 are streamed straight from the object body (recently viewed
+    ones are served from memory while their ETag is unchanged); Range requests
+    return partial content.
+    
     Args:
         path (str, optional): Path to the PDF file
         s3_url (str, optional): S3 URL of the PDF file (s3://bucket-name/object-name)
+        range_header (str, optional): HTTP Range header
         
     Returns:
         Response: The LaTeX source code as plain text
     """
     try:
-        latex_path = None
-        temp_file = None
-        
         # If S3 URL is provided
         if s3_url:
             bucket_name, object_name = parse_s3_url(s3_url)
@@ -574,16 +795,34 @@ async def view_latex(path: str = None, s3_url: str = None):
             # Create corresponding LaTeX filename
             latex_object_name = f"latex/{base_name}.tex"
             
-            # Download the LaTeX file temporarily
-            temp_dir = tempfile.mkdtemp()
-            temp_file = os.path.join(temp_dir, f"{base_name}.tex")
+            # Regenerating a resume overwrites its object, so the cache is keyed on the ETag too
+            head = await asyncio.to_thread(head_s3_object, bucket_name, latex_object_name)
+            if head is None:
+                raise HTTPException(status_code=404, detail="LaTeX file not found in S3")
+            cached = latex_source_cache.get((bucket_name, latex_object_name, head["ETag"]))
+            if cached is not None:
+                return bytes_response(cached, "text/plain", range_header)
             
-            # Download from S3
-            success = download_file_from_s3(bucket_name, latex_object_name, temp_file)
-            if success:
-                latex_path = temp_file
-            else:
+            try:
+                s3_object = await asyncio.to_thread(open_s3_object, bucket_name, latex_object_name, range_header)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                    raise HTTPException(status_code=416, detail="Range not satisfiable")
+                raise
+            if s3_object is None:
                 raise HTTPException(status_code=404, detail="LaTeX file not found in S3")
+            
+            headers = {"Accept-Ranges": "bytes", "Content-Length": str(s3_object["ContentLength"])}
+            body = s3_object["Body"]
+            cache_key = (bucket_name, latex_object_name, s3_object.get("ETag"))
+            if "ContentRange" in s3_object:
+                headers["Content-Range"] = s3_object["ContentRange"]
+                return StreamingResponse(
+                    stream_s3_body(body), status_code=206, media_type="text/plain", headers=headers
+                )
+            return StreamingResponse(
+                stream_s3_body(body, cache_key), media_type="text/plain", headers=headers
+            )
         
         # If local PDF path is provided
         elif path:
@@ -601,27 +840,40 @@ async def view_latex(path: str = None, s3_url: str = None):
             
             if not os.path.isfile(latex_path):
                 raise HTTPException(status_code=404, detail="LaTeX file not found")
+            
+            # Read and return the LaTeX content
+            with open(latex_path, 'rb') as f:
+                latex_content = f.read()
+            return bytes_response(latex_content, "text/plain", range_header)
         
         # Neither path nor S3 URL provided
         else:
             raise HTTPException(status_code=400, detail="Either path or s3_url must be provided")
         
-        # Read and return the LaTeX content
-        with open(latex_path, 'r', encoding='utf-8') as f:
-            latex_content = f.read()
-        
-        # Clean up temporary file if needed
-        if temp_file and os.path.exists(temp_file):
-            os.remove(temp_file)
-        
-        return Response(content=latex_content, media_type="text/plain")
-        
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error accessing LaTeX: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error accessing LaTeX: {str(e)}")
 
+@app.on_event("startup")
+def warm_latex_engine():
+    """Precompile the LaTeX template (preamble format and section slots) so PDF jobs start warm."""
+    engine = get_latex_engine()
+    compile_template(load_template(engine.template_path))
+
+@app.on_event("shutdown")
+def shutdown_job_queue():
+    """Let queued PDF jobs finish before the server exits."""
+    get_job_queue().shutdown(wait=True)
+
+@app.on_event("shutdown")
+def shutdown_latex_workers():
+    """Stop the LaTeX workers of this process and remove their scratch directories."""
+    shutdown_compile_pool()
+
 # Mount static files directories for output
-app.mount("/static-files", StaticFiles(directory=OUTPUT_DIR), name="static-files")
+app.mount("/static-files", ContentHashStaticFiles(directory=OUTPUT_DIR), name="static-files")
 
 #------------------------------------------------------------
 # APPLICATION ENTRY POINT
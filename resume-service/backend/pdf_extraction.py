@@ -0,0 +1,332 @@
+"""
+PDF Text Extraction Engine
+
+Extracts the text of uploaded resume PDFs with the fastest available backend
+(pypdfium2, then PyPDF2, then pdfminer.six), falling back to the next one when
+a backend fails or returns no text. Long documents are split into page ranges
+extracted in parallel worker processes, inputs are capped by size and page
+count, and results are cached by the SHA-256 of the file.
+
+Configuration (environment variables):
+    PDF_EXTRACTION_BACKEND: Force a backend ('pypdfium2', 'pypdf2' or 'pdfminer')
+    PDF_MAX_BYTES: Largest accepted PDF in bytes (default: 10 MB)
+    PDF_MAX_PAGES: Pages extracted at most; later pages are ignored (default: 20)
+"""
+
+import io
+import os
+import hashlib
+import logging
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+PDF_MAX_BYTES = int(os.getenv("PDF_MAX_BYTES", str(10 * 1024 * 1024)))
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "20"))
+
+# Documents with at least this many pages are extracted in parallel
+PARALLEL_PAGE_THRESHOLD = 6
+PAGES_PER_CHUNK = 3
+EXTRACTION_WORKERS = min(4, os.cpu_count() or 1)
+
+# Number of extracted documents kept in memory
+TEXT_CACHE_SIZE = 128
+
+
+class PDFTooLargeError(ValueError):
+    """Raised when an uploaded PDF exceeds PDF_MAX_BYTES."""
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Read-only, seekable file object over a bytes-like buffer (bytes, memoryview,
+    mmap) that does not copy it, unlike io.BytesIO.
+
+    The reader holds a view of the buffer until it is closed, and an mmap or
+    in-memory spool cannot be closed while views of it exist, so use it as a
+    context manager: parsers may keep a reference to it after they are done.
+    """
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._position = max(0, offset)
+        return self._position
+
+    def readinto(self, buffer):
+        with self._view[self._position:self._position + len(buffer)] as chunk:
+            size = len(chunk)
+            buffer[:size] = chunk
+        self._position += size
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+#------------------------------------------------------------
+# EXTRACTION BACKENDS
+#------------------------------------------------------------
+
+class PdfiumBackend:
+    """Text extraction with pypdfium2 (PDFium bindings, fastest)."""
+    name = "pypdfium2"
+
+    def is_available(self):
+        try:
+            import pypdfium2  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def page_count(self, data):
+        import pypdfium2 as pdfium
+        with BufferReader(data) as stream:
+            pdf = pdfium.PdfDocument(stream)
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
+
+    def extract_pages(self, data, start, stop):
+        import pypdfium2 as pdfium
+        with BufferReader(data) as stream:
+            pdf = pdfium.PdfDocument(stream)
+            try:
+                texts = []
+                for index in range(start, stop):
+                    page = pdf[index]
+                    try:
+                        text_page = page.get_textpage()
+                        try:
+                            texts.append(text_page.get_text_range())
+                        finally:
+                            text_page.close()
+                    finally:
+                        page.close()
+                return texts
+            finally:
+                pdf.close()
+
+
+class PyPDF2Backend:
+    """Text extraction with PyPDF2 (pure Python)."""
+    name = "pypdf2"
+
+    def is_available(self):
+        try:
+            import PyPDF2  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def page_count(self, data):
+        import PyPDF2
+        with BufferReader(data) as stream:
+            return len(PyPDF2.PdfReader(stream).pages)
+
+    def extract_pages(self, data, start, stop):
+        import PyPDF2
+        with BufferReader(data) as stream:
+            reader = PyPDF2.PdfReader(stream)
+            return [reader.pages[index].extract_text() or "" for index in range(start, stop)]
+
+
+class PdfminerBackend:
+    """Text extraction with pdfminer.six (slowest, best layout fidelity)."""
+    name = "pdfminer"
+
+    def is_available(self):
+        try:
+            import pdfminer  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def page_count(self, data):
+        from pdfminer.pdfpage import PDFPage
+        with BufferReader(data) as stream:
+            return sum(1 for _ in PDFPage.get_pages(stream))
+
+    def extract_pages(self, data, start, stop):
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.converter import TextConverter
+        from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+
+        # Same output as pdfminer.high_level.extract_text per page, parsing the document once
+        texts = []
+        resources = PDFResourceManager(caching=True)
+        output = io.StringIO()
+        device = TextConverter(resources, output, laparams=LAParams())
+        try:
+            interpreter = PDFPageInterpreter(resources, device)
+            with BufferReader(data) as stream:
+                for index, page in enumerate(PDFPage.get_pages(stream)):
+                    if index >= stop:
+                        break
+                    if index < start:
+                        continue
+                    interpreter.process_page(page)
+                    texts.append(output.getvalue())
+                    output.seek(0)
+                    output.truncate()
+        finally:
+            device.close()
+        return texts
+
+
+# Backends in order of preference
+BACKENDS = [PdfiumBackend(), PyPDF2Backend(), PdfminerBackend()]
+BACKENDS_BY_NAME = {backend.name: backend for backend in BACKENDS}
+
+
+def available_backends():
+    """
+    Get the installed backends in the order they will be tried.
+
+    Returns:
+        list: Backend instances, the forced backend (PDF_EXTRACTION_BACKEND) first
+    """
+    backends = [backend for backend in BACKENDS if backend.is_available()]
+    forced = os.getenv("PDF_EXTRACTION_BACKEND")
+    if forced in BACKENDS_BY_NAME and BACKENDS_BY_NAME[forced] in backends:
+        backends.remove(BACKENDS_BY_NAME[forced])
+        backends.insert(0, BACKENDS_BY_NAME[forced])
+    return backends
+
+
+def _extract_page_range(backend_name, data, start, stop):
+    # Module-level so it can run in a worker process
+    return BACKENDS_BY_NAME[backend_name].extract_pages(data, start, stop)
+
+
+#------------------------------------------------------------
+# EXTRACTION ENGINE
+#------------------------------------------------------------
+
+_executor = None
+_executor_lock = threading.Lock()
+
+_text_cache = OrderedDict()
+_text_cache_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # Spawned, not forked: requests are served by several threads (and
+            # PDFium keeps global state), which a forked child could copy mid-use
+            _executor = ProcessPoolExecutor(
+                max_workers=EXTRACTION_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _executor
+
+
+def extract_pages_with_backend(backend, data, max_pages=PDF_MAX_PAGES):
+    """
+    Extract the text of each page with one backend.
+
+    Args:
+        backend: Backend instance
+        data (bytes-like): PDF file content (bytes, memoryview or mmap)
+        max_pages (int): Maximum number of pages to extract
+
+    Returns:
+        list: Text of each extracted page
+    """
+    page_count = min(backend.page_count(data), max_pages)
+
+    if page_count < PARALLEL_PAGE_THRESHOLD:
+        return backend.extract_pages(data, 0, page_count)
+
+    # Split long documents into page ranges extracted in parallel; worker
+    # processes need a picklable copy, so views are materialized once here
+    payload = data if isinstance(data, bytes) else bytes(data)
+    ranges = [
+        (start, min(start + PAGES_PER_CHUNK, page_count))
+        for start in range(0, page_count, PAGES_PER_CHUNK)
+    ]
+    executor = _get_executor()
+    futures = [executor.submit(_extract_page_range, backend.name, payload, start, stop) for start, stop in ranges]
+    return [text for future in futures for text in future.result()]
+
+
+def extract_text(data):
+    """
+    Extract text from a PDF with the first backend that succeeds.
+
+    Args:
+        data (bytes-like): PDF file content (bytes, memoryview or mmap)
+
+    Returns:
+        str: Extracted text, one newline after each page; blank if the PDF
+        has no text layer (e.g. a scanned resume)
+
+    Raises:
+        PDFTooLargeError: If the PDF exceeds PDF_MAX_BYTES
+        ValueError: If no backend could read the PDF
+    """
+    if len(data) > PDF_MAX_BYTES:
+        raise PDFTooLargeError(f"PDF is larger than {PDF_MAX_BYTES} bytes")
+
+    digest = hashlib.sha256(data).hexdigest()
+    with _text_cache_lock:
+        if digest in _text_cache:
+            _text_cache.move_to_end(digest)
+            return _text_cache[digest]
+
+    text = None
+    # What a backend that read the PDF but found no text returned, in case none finds any
+    blank = None
+    errors = []
+    for backend in available_backends():
+        try:
+            pages = extract_pages_with_backend(backend, data)
+        except Exception as e:
+            logger.warning(f"PDF extraction with {backend.name} failed: {e}")
+            errors.append(f"{backend.name}: {e}")
+            continue
+
+        candidate = "".join(page + "\n" for page in pages)
+        if candidate.strip():
+            logger.debug(f"Extracted {len(pages)} pages with {backend.name}")
+            text = candidate
+            break
+        errors.append(f"{backend.name}: no text")
+        if blank is None:
+            blank = candidate
+
+    if text is None:
+        if blank is None:
+            raise ValueError("Could not extract text from PDF (" + "; ".join(errors or ["no backend installed"]) + ")")
+        logger.warning(f"PDF has no extractable text ({'; '.join(errors)})")
+        text = blank
+
+    with _text_cache_lock:
+        _text_cache[digest] = text
+        while len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    return text
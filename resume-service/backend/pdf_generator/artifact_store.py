@@ -0,0 +1,218 @@
+"""
+Content-Addressed Artifact Store
+
+Maps the SHA-256 hash of a generated LaTeX document to the PDF compiled from
+it and to the S3 objects it was uploaded as. Byte-identical LaTeX (retries,
+cached tailoring results, re-downloads) then reuses the existing artifacts
+instead of compiling and uploading again.
+
+The store also keeps output/pdfs and output/latex within a disk budget by
+evicting the least recently used artifacts.
+
+Configuration (environment variables):
+    ARTIFACT_DISK_BUDGET_MB: Disk budget for generated PDFs and LaTeX (default: 1024)
+    ARTIFACT_INDEX_PATH: Path of the SQLite index (default: output/artifacts.sqlite3)
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+
+# Configure logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Default location of the artifact index
+DEFAULT_INDEX_PATH = Path(__file__).parent.parent / "output" / "artifacts.sqlite3"
+
+
+def hash_latex(latex_content):
+    """Return the hex SHA-256 digest of a LaTeX document."""
+    return hashlib.sha256(latex_content.encode('utf-8')).hexdigest()
+
+
+def _file_hash(path):
+    """Return the hex SHA-256 digest of a file, or None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class ArtifactStore:
+    """
+    SQLite-backed index of generated artifacts keyed by LaTeX content hash.
+
+    Args:
+        index_path (str): Path of the SQLite index
+        managed_dirs (list): Directories whose total size is kept within the budget
+        budget_bytes (int): Disk budget for the managed directories
+    """
+
+    def __init__(self, index_path, managed_dirs, budget_bytes):
+        self.index_path = str(index_path)
+        self.managed_dirs = [str(d) for d in managed_dirs]
+        self.budget_bytes = budget_bytes
+        os.makedirs(os.path.dirname(os.path.abspath(self.index_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS artifacts (
+                    content_hash TEXT PRIMARY KEY,
+                    pdf_path TEXT NOT NULL,
+                    latex_path TEXT NOT NULL,
+                    s3_pdf_url TEXT,
+                    s3_latex_url TEXT,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+
+    def _connect(self):
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def lookup(self, content_hash):
+        """
+        Find the artifacts generated from a LaTeX document.
+
+        Args:
+            content_hash (str): Hash returned by hash_latex()
+
+        Returns:
+            dict: Artifact record (pdf_path, latex_path, s3_pdf_url, s3_latex_url),
+                  or None if the document has not been compiled or its files are
+                  gone or have since been overwritten
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM artifacts WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            # Artifacts are named after the resume, not the hash, so a later resume
+            # may have overwritten them: only trust files still holding this LaTeX
+            if not os.path.exists(row["pdf_path"]) or _file_hash(row["latex_path"]) != content_hash:
+                conn.execute("DELETE FROM artifacts WHERE content_hash = ?", (content_hash,))
+                return None
+
+            conn.execute(
+                "UPDATE artifacts SET last_used = ? WHERE content_hash = ?",
+                (time.time(), content_hash)
+            )
+        return dict(row)
+
+    def record(self, content_hash, pdf_path, latex_path, s3_pdf_url=None, s3_latex_url=None):
+        """
+        Store (or replace) the artifacts generated from a LaTeX document.
+
+        Records of other documents whose files (and so S3 objects, which share
+        their names) were overwritten by these artifacts are removed.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM artifacts WHERE content_hash != ? AND (pdf_path = ? OR latex_path = ?)",
+                (content_hash, str(pdf_path), str(latex_path))
+            )
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO artifacts
+                    (content_hash, pdf_path, latex_path, s3_pdf_url, s3_latex_url, last_used)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (content_hash, str(pdf_path), str(latex_path), s3_pdf_url, s3_latex_url, time.time())
+            )
+
+    def update_s3_urls(self, content_hash, s3_pdf_url, s3_latex_url):
+        """Attach the S3 URLs of an uploaded artifact to its record."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE artifacts SET s3_pdf_url = ?, s3_latex_url = ? WHERE content_hash = ?",
+                (s3_pdf_url, s3_latex_url, content_hash)
+            )
+
+    def evict(self):
+        """
+        Delete least recently used artifacts until the managed directories fit
+        the disk budget. Files that are not in the index are ranked by mtime.
+
+        Returns:
+            int: Number of bytes freed
+        """
+        # Collect every managed file with its size
+        sizes = {}
+        for directory in self.managed_dirs:
+            if not os.path.isdir(directory):
+                continue
+            for entry in os.scandir(directory):
+                if entry.is_file():
+                    sizes[os.path.abspath(entry.path)] = entry.stat().st_size
+
+        total = sum(sizes.values())
+        if total <= self.budget_bytes:
+            return 0
+
+        # Build eviction candidates: indexed artifacts by last use, loose files by mtime
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM artifacts").fetchall()
+
+        candidates = []
+        indexed = set()
+        for row in rows:
+            paths = [os.path.abspath(row["pdf_path"]), os.path.abspath(row["latex_path"])]
+            indexed.update(paths)
+            candidates.append((row["last_used"], row["content_hash"], paths))
+        for path in sizes:
+            if path not in indexed:
+                candidates.append((os.path.getmtime(path), None, [path]))
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        freed = 0
+        with self._connect() as conn:
+            for _, content_hash, paths in candidates:
+                if total - freed <= self.budget_bytes:
+                    break
+                for path in paths:
+                    try:
+                        os.remove(path)
+                        freed += sizes.get(path, 0)
+                    except OSError:
+                        pass
+                if content_hash:
+                    conn.execute("DELETE FROM artifacts WHERE content_hash = ?", (content_hash,))
+
+        logger.info(f"Evicted {freed} bytes of generated artifacts (budget {self.budget_bytes} bytes)")
+        return freed
+
+
+_artifact_store = None
+_artifact_store_lock = threading.Lock()
+
+
+def get_artifact_store(managed_dirs):
+    """
+    Get the process-wide artifact store, creating it on first use.
+
+    Args:
+        managed_dirs (list): Directories whose total size is kept within the budget
+
+    Returns:
+        ArtifactStore: Shared artifact store
+    """
+    global _artifact_store
+    with _artifact_store_lock:
+        if _artifact_store is None:
+            budget_mb = int(os.getenv("ARTIFACT_DISK_BUDGET_MB", "1024"))
+            _artifact_store = ArtifactStore(
+                os.getenv("ARTIFACT_INDEX_PATH", DEFAULT_INDEX_PATH),
+                managed_dirs,
+                budget_mb * 1024 * 1024
+            )
+        return _artifact_store
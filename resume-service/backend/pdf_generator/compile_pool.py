@@ -0,0 +1,194 @@
+"""
+LaTeX Compilation Worker Pool
+
+A bounded set of long-lived compilation workers fed from a job queue. Each
+worker owns a private scratch directory (on tmpfs when /dev/shm is available)
+where it compiles, so concurrent compilations never share auxiliary files;
+only the finished PDF is moved into the requested output location.
+
+When the queue is full, submissions wait up to a configurable time and then
+fail with CompilePoolBusy, which gives callers back-pressure instead of an
+unbounded backlog of LaTeX processes.
+
+Configuration (environment variables):
+    LATEX_COMPILE_WORKERS: Number of workers (default: CPU count)
+    LATEX_COMPILE_QUEUE_SIZE: Maximum number of waiting jobs (default: 4 per worker)
+    LATEX_COMPILE_TIMEOUT: Maximum seconds per compilation (default: 60)
+    LATEX_COMPILE_SUBMIT_TIMEOUT: Seconds compile_latex_to_pdf waits for queue space (default: 30)
+"""
+
+import os
+import queue
+import shutil
+import logging
+import tempfile
+import threading
+from concurrent.futures import Future
+
+# Configure logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Preferred parent directory for scratch directories (memory-backed on Linux)
+TMPFS_DIR = "/dev/shm"
+
+# Seconds a compilation waits for queue space before CompilePoolBusy is raised
+COMPILE_SUBMIT_TIMEOUT = float(os.getenv("LATEX_COMPILE_SUBMIT_TIMEOUT", "30"))
+
+
+class CompilePoolBusy(RuntimeError):
+    """Raised when the compilation queue stays full for longer than the submit timeout."""
+
+
+def get_scratch_root():
+    """Return tmpfs if it is usable, otherwise the system temporary directory."""
+    if os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK):
+        return TMPFS_DIR
+    return tempfile.gettempdir()
+
+
+class CompilePool:
+    """
+    Pool of compilation worker threads, each driving LaTeX subprocesses in
+    its own scratch directory.
+
+    Args:
+        compile_fn (callable): compile_fn(tex_file, output_dir, timeout=..., **kwargs) -> bool
+        workers (int): Number of workers
+        queue_size (int): Maximum number of jobs waiting for a worker
+        timeout (int): Maximum seconds per compilation
+    """
+
+    def __init__(self, compile_fn, workers, queue_size, timeout):
+        self.compile_fn = compile_fn
+        self.timeout = timeout
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._scratch_root = get_scratch_root()
+        self._workers = []
+
+        for index in range(workers):
+            scratch_dir = tempfile.mkdtemp(prefix=f"latex-worker-{index}-", dir=self._scratch_root)
+            worker = threading.Thread(
+                target=self._worker_loop,
+                args=(scratch_dir,),
+                name=f"latex-worker-{index}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append((worker, scratch_dir))
+
+        logger.info(f"Started {workers} LaTeX workers with scratch space in {self._scratch_root}")
+
+    def _worker_loop(self, scratch_dir):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                self._queue.task_done()
+                shutil.rmtree(scratch_dir, ignore_errors=True)
+                return
+
+            tex_file, output_pdf, kwargs, future = job
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(self._compile_in_scratch(scratch_dir, tex_file, output_pdf, kwargs))
+                except Exception as e:
+                    future.set_exception(e)
+            self._queue.task_done()
+
+    def _compile_in_scratch(self, scratch_dir, tex_file, output_pdf, kwargs):
+        base_filename = os.path.splitext(os.path.basename(tex_file))[0]
+        scratch_tex = os.path.join(scratch_dir, base_filename + ".tex")
+        scratch_pdf = os.path.join(scratch_dir, base_filename + ".pdf")
+
+        try:
+            shutil.copyfile(tex_file, scratch_tex)
+            if not self.compile_fn(scratch_tex, scratch_dir, timeout=self.timeout, **kwargs):
+                return False
+
+            os.makedirs(os.path.dirname(os.path.abspath(output_pdf)), exist_ok=True)
+            shutil.move(scratch_pdf, output_pdf)
+            return True
+        finally:
+            # Leave the scratch directory empty for the next job
+            for entry in os.listdir(scratch_dir):
+                path = os.path.join(scratch_dir, entry)
+                if os.path.isdir(path):
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+    def submit(self, tex_file, output_pdf, submit_timeout=None, **kwargs):
+        """
+        Queue a LaTeX file for compilation.
+
+        Args:
+            tex_file (str): Path to the LaTeX file to compile
+            output_pdf (str): Destination path of the generated PDF
+            submit_timeout (float, optional): Seconds to wait for queue space; None waits forever
+            **kwargs: Extra arguments for compile_fn (compiler, verbose, ...)
+
+        Returns:
+            Future: Resolves to True if the PDF was generated, False otherwise
+
+        Raises:
+            CompilePoolBusy: If the queue is still full after submit_timeout
+        """
+        future = Future()
+        try:
+            self._queue.put((tex_file, output_pdf, kwargs, future), timeout=submit_timeout)
+        except queue.Full:
+            raise CompilePoolBusy("LaTeX compilation queue is full")
+        return future
+
+    def compile(self, tex_file, output_pdf, submit_timeout=None, **kwargs):
+        """
+        Compile a LaTeX file on the pool and wait for the result.
+
+        Returns:
+            bool: True if the PDF was generated, False otherwise
+        """
+        return self.submit(tex_file, output_pdf, submit_timeout=submit_timeout, **kwargs).result()
+
+    def shutdown(self):
+        """Stop the workers after the queued jobs and remove their scratch directories."""
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker, _ in self._workers:
+            worker.join()
+        self._workers = []
+
+
+_compile_pool = None
+_compile_pool_lock = threading.Lock()
+
+
+def get_compile_pool():
+    """
+    Get the process-wide compilation pool, starting it on first use.
+
+    Returns:
+        CompilePool: Shared pool compiling with compile_latex_in_directory
+    """
+    global _compile_pool
+    with _compile_pool_lock:
+        if _compile_pool is None:
+            # Imported here because json_to_pdf uses this pool
+            from .json_to_pdf import compile_latex_in_directory
+
+            workers = int(os.getenv("LATEX_COMPILE_WORKERS", os.cpu_count() or 1))
+            queue_size = int(os.getenv("LATEX_COMPILE_QUEUE_SIZE", workers * 4))
+            timeout = int(os.getenv("LATEX_COMPILE_TIMEOUT", "60"))
+            _compile_pool = CompilePool(compile_latex_in_directory, workers, queue_size, timeout)
+        return _compile_pool
+
+
+def shutdown_compile_pool():
+    """Stop the process-wide compilation pool, if it was started, and remove its scratch directories."""
+    global _compile_pool
+    with _compile_pool_lock:
+        pool, _compile_pool = _compile_pool, None
+    if pool is not None:
+        pool.shutdown()
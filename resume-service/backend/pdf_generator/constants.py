@@ -29,6 +29,21 @@ SECTION_PATTERNS = {
     'skills': r'\\section{Technical Skills}\s*\\begin{itemize}.*?\\end{itemize}'
 }
 
+# Text every formatted section starts with, used to compile the template into slots
+SECTION_PREFIXES = {
+    'personal_info': '\\begin{center}',
+    'education': '\\section{Education}',
+    'experience': '\\section{Experience}',
+    'projects': '\\section{Projects}',
+    'skills': '\\section{Technical Skills}'
+}
+
+# Regex removing leftover template entries after section replacement
+TEMPLATE_CLEANUP_PATTERN = r'%---+\s*\\resumeSubheading.*?(?=\\section|\s*\\end{document})'
+
+# Commands that need more than one LaTeX pass to resolve
+CROSS_REFERENCE_PATTERN = r'\\(?:ref|pageref|eqref|autoref|cref|label|cite|tableofcontents|listoffigures|listoftables|bibliography|addbibresource|printbibliography)\b|LastPage'
+
 # Regex patterns for parsing education entries from string
 EDUCATION_PATTERNS = {
     'institution_split': r'(University|Institute|College|Aug \d{4})',
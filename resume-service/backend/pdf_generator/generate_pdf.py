@@ -31,6 +31,7 @@ Usage:
 
 import os
 import json
+import shutil
 import tempfile
 from pathlib import Path
 import uuid
@@ -43,9 +44,12 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 # Import the JSON to PDF module
-from .json_to_pdf import populate_template, read_latex_template, compile_latex_to_pdf
+from .json_to_pdf import populate_template, compile_latex_to_pdf
+from .template_compiler import load_template
 from .constants import DEFAULT_TEMPLATE_PATH
-from .s3_utils import upload_file_to_s3
+from .s3_utils import upload_buffers_to_s3
+from .artifact_store import get_artifact_store, hash_latex
+from .compile_pool import CompilePoolBusy
 
 # Directory for storing generated PDFs
 PDF_OUTPUT_DIR = Path(__file__).parent.parent / "output" / "pdfs"
@@ -68,19 +72,89 @@ def get_s3_bucket_name():
     logger.debug(f"S3 bucket name from environment: {bucket_name}")
     return bucket_name
 
-def generate_resume_pdf(resume_data, template_path=None, output_filename=None, verbose=False, upload_to_s3=True):
+def upload_resume_files(output_filename, pdf_path=None, latex_content=None, json_content=None, json_filename=None):
     """
-    Generate a PDF resume from JSON data.
+    Upload the artifacts of one resume to S3 concurrently, straight from memory.
+    
+    Args:
+        output_filename (str): Base name of the PDF and LaTeX objects (without extension)
+        pdf_path (str, optional): Path to the compiled PDF, read once into memory
+        latex_content (str, optional): LaTeX source of the PDF
+        json_content (str, optional): Serialized resume JSON
+        json_filename (str, optional): Name of the JSON object (with extension)
+        
+    Returns:
+        dict: s3_pdf_url, s3_latex_url and s3_json_url - None for any upload that
+        was skipped or failed (the LaTeX URL is only kept if the PDF uploaded)
+    """
+    urls = {"s3_pdf_url": None, "s3_latex_url": None, "s3_json_url": None}
+    try:
+        # Get bucket name dynamically
+        bucket_name = get_s3_bucket_name()
+        logger.debug(f"Attempting to upload resume files to S3. S3_BUCKET_NAME={bucket_name}")
+        
+        # Check if S3 bucket name is configured
+        if not bucket_name:
+            logger.warning("S3_BUCKET_NAME environment variable not set. Skipping S3 upload.")
+            return urls
+        
+        uploads = []
+        keys = []
+        if pdf_path is not None:
+            if not os.path.exists(str(pdf_path)):
+                logger.error(f"File to upload does not exist: {pdf_path}")
+            else:
+                with open(pdf_path, 'rb') as f:
+                    uploads.append((f.read(), f"resumes/{output_filename}.pdf", 'application/pdf'))
+                keys.append("s3_pdf_url")
+                if latex_content is not None:
+                    uploads.append((latex_content.encode('utf-8'), f"latex/{output_filename}.tex", 'text/plain'))
+                    keys.append("s3_latex_url")
+        if json_content is not None:
+            uploads.append((json_content.encode('utf-8'), f"json/{json_filename}", 'application/json'))
+            keys.append("s3_json_url")
+        
+        if uploads:
+            for key, (_, object_name, _), url in zip(keys, uploads, upload_buffers_to_s3(uploads, bucket_name)):
+                if not url:
+                    logger.error(f"Failed to upload {object_name} to S3")
+                urls[key] = url
+        
+        # Without its PDF, an uploaded LaTeX source is not referenced anywhere
+        if not urls["s3_pdf_url"]:
+            urls["s3_latex_url"] = None
+    except Exception as e:
+        logger.exception(f"Error uploading files to S3: {e}")
+    
+    return urls
+
+def link_or_copy(source, destination):
+    """
+    Hardlink a file to a new name (copying it where links are not supported),
+    atomically replacing any existing file there.
+    """
+    temp_path = f"{destination}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        os.link(source, temp_path)
+    except OSError:
+        shutil.copyfile(source, temp_path)
+    os.replace(temp_path, destination)
+
+def build_resume_pdf(resume_data, template_path=None, output_filename=None, verbose=False):
+    """
+    Compile the PDF for resume data, reusing the artifacts of byte-identical LaTeX.
     
     Args:
         resume_data (dict): Resume data in JSON format
         template_path (str, optional): Path to LaTeX template. Defaults to template.tex.
         output_filename (str, optional): Name for output file. Defaults to generated UUID.
         verbose (bool, optional): Whether to show detailed LaTeX compilation output.
-        upload_to_s3 (bool, optional): Whether to upload the PDF to S3. Defaults to True.
         
     Returns:
-        tuple: (local_pdf_path, s3_url) - Path to the generated PDF file and S3 URL if uploaded
+        dict: pdf_path, latex_content, content_hash, output_filename (the base name
+        the S3 objects use) and the cached s3_pdf_url/s3_latex_url if the PDF was
+        reused under the same name; None if compilation failed. The PDF is always
+        at the requested name, linked to an identical earlier PDF where possible
     """
     # Get template path
     if not template_path:
@@ -99,103 +173,151 @@ def generate_resume_pdf(resume_data, template_path=None, output_filename=None, v
     latex_path = LATEX_OUTPUT_DIR / f"{output_filename}.tex"
     pdf_path = PDF_OUTPUT_DIR / f"{output_filename}.pdf"
     
-    try:
-        # Read template
-        template = read_latex_template(template_path)
-        
-        # Convert resume data to LaTeX
-        latex_content = populate_template(template, resume_data)
+    # Read template (cached until the file changes)
+    template = load_template(template_path)
+    
+    # Convert resume data to LaTeX
+    latex_content = populate_template(template, resume_data)
+    
+    # Reuse the artifacts of byte-identical LaTeX if we still have them
+    artifact_store = get_artifact_store([PDF_OUTPUT_DIR, LATEX_OUTPUT_DIR])
+    content_hash = hash_latex(latex_content)
+    cached = artifact_store.lookup(content_hash)
+    if cached:
+        logger.info(f"Reusing PDF generated from identical LaTeX: {cached['pdf_path']}")
+        if os.path.abspath(cached['pdf_path']) == os.path.abspath(pdf_path):
+            return {
+                "pdf_path": str(pdf_path),
+                "latex_content": latex_content,
+                "content_hash": content_hash,
+                "output_filename": output_filename,
+                "s3_pdf_url": cached['s3_pdf_url'],
+                "s3_latex_url": cached['s3_latex_url']
+            }
         
-        # Write LaTeX to file
+        # Another name was asked for: skip the compilation, but give the caller
+        # its own files (and S3 objects, uploaded under the new name)
         with open(latex_path, 'w', encoding='utf-8') as f:
             f.write(latex_content)
+        link_or_copy(cached['pdf_path'], pdf_path)
+        artifact_store.record(content_hash, pdf_path, latex_path)
+        artifact_store.evict()
+        return {
+            "pdf_path": str(pdf_path),
+            "latex_content": latex_content,
+            "content_hash": content_hash,
+            "output_filename": output_filename,
+            "s3_pdf_url": None,
+            "s3_latex_url": None
+        }
+    
+    # Write LaTeX to file
+    with open(latex_path, 'w', encoding='utf-8') as f:
+        f.write(latex_content)
+    
+    # Compile LaTeX to PDF with reduced output
+    compile_success = compile_latex_to_pdf(
+        str(latex_path),
+        output_pdf=str(pdf_path),
+        verbose=verbose
+    )
+    
+    if not compile_success:
+        print("Failed to compile PDF")
+        return None
+    
+    print(f"Successfully generated PDF: {pdf_path}")
+    
+    # Remember the artifacts and keep the output directories within budget
+    artifact_store.record(content_hash, pdf_path, latex_path)
+    artifact_store.evict()
+    
+    return {
+        "pdf_path": str(pdf_path),
+        "latex_content": latex_content,
+        "content_hash": content_hash,
+        "output_filename": output_filename,
+        "s3_pdf_url": None,
+        "s3_latex_url": None
+    }
+
+def _upload_built_resume(built, json_content=None, json_filename=None):
+    """
+    Upload a built resume (skipping a PDF already in S3) together with its JSON.
+    
+    Returns:
+        dict: s3_pdf_url, s3_latex_url and s3_json_url
+    """
+    needs_pdf_upload = not built["s3_pdf_url"]
+    urls = upload_resume_files(
+        built["output_filename"],
+        pdf_path=built["pdf_path"] if needs_pdf_upload else None,
+        latex_content=built["latex_content"] if needs_pdf_upload else None,
+        json_content=json_content,
+        json_filename=json_filename
+    )
+    
+    if not needs_pdf_upload:
+        urls["s3_pdf_url"] = built["s3_pdf_url"]
+        urls["s3_latex_url"] = built["s3_latex_url"]
+    elif urls["s3_pdf_url"]:
+        artifact_store = get_artifact_store([PDF_OUTPUT_DIR, LATEX_OUTPUT_DIR])
+        artifact_store.update_s3_urls(built["content_hash"], urls["s3_pdf_url"], urls["s3_latex_url"])
+    return urls
+
+def generate_resume_pdf(resume_data, template_path=None, output_filename=None, verbose=False, upload_to_s3=True):
+    """
+    Generate a PDF resume from JSON data.
+    
+    If byte-identical LaTeX has been compiled before, the existing PDF and S3
+    object are returned instead of compiling and uploading again.
+    
+    Args:
+        resume_data (dict): Resume data in JSON format
+        template_path (str, optional): Path to LaTeX template. Defaults to template.tex.
+        output_filename (str, optional): Name for output file. Defaults to generated UUID.
+        verbose (bool, optional): Whether to show detailed LaTeX compilation output.
+        upload_to_s3 (bool, optional): Whether to upload the PDF to S3. Defaults to True.
+        
+    Returns:
+        tuple: (local_pdf_path, s3_url) - Path to the generated PDF file and S3 URL if uploaded
         
-        # Compile LaTeX to PDF with reduced output
-        compile_success = compile_latex_to_pdf(
-            str(latex_path),
-            output_pdf=str(pdf_path),
-            verbose=verbose
-        )
+    Raises:
+        CompilePoolBusy: If the LaTeX compilation queue stayed full
+    """
+    try:
+        built = build_resume_pdf(resume_data, template_path, output_filename, verbose)
+        if built is None:
+            return None, None
         
-        if compile_success:
-            print(f"Successfully generated PDF: {pdf_path}")
-            
-            # Upload to S3 if requested and S3 bucket is configured
-            s3_url = None
-            if upload_to_s3:
-                try:
-                    # Get bucket name dynamically
-                    bucket_name = get_s3_bucket_name()
-                    logger.debug(f"Attempting to upload PDF to S3. S3_BUCKET_NAME={bucket_name}")
-                    
-                    # Check if S3 bucket name is configured
-                    if not bucket_name:
-                        logger.warning("S3_BUCKET_NAME environment variable not set. Skipping S3 upload.")
-                    else:
-                        # Create S3 object name for PDF
-                        s3_object_name = f"resumes/{output_filename}.pdf"
-                        logger.debug(f"S3 object name: {s3_object_name}")
-                        
-                        # Check if the PDF file exists
-                        if not os.path.exists(str(pdf_path)):
-                            logger.error(f"File to upload does not exist: {pdf_path}")
-                        else:
-                            logger.debug(f"File exists, size: {os.path.getsize(str(pdf_path))} bytes")
-                            
-                            # Upload the PDF file to S3
-                            s3_url = upload_file_to_s3(
-                                str(pdf_path),
-                                bucket_name,
-                                s3_object_name,
-                                content_type='application/pdf'
-                            )
-                            
-                            if s3_url:
-                                logger.info(f"Successfully uploaded PDF to S3: {s3_url}")
-                                
-                                # Also upload the LaTeX file to S3
-                                latex_object_name = f"latex/{output_filename}.tex"
-                                logger.debug(f"Uploading LaTeX file to S3: {latex_object_name}")
-                                
-                                latex_s3_url = upload_file_to_s3(
-                                    str(latex_path),
-                                    bucket_name,
-                                    latex_object_name,
-                                    content_type='text/plain'
-                                )
-                                
-                                if latex_s3_url:
-                                    logger.info(f"Successfully uploaded LaTeX to S3: {latex_s3_url}")
-                                else:
-                                    logger.error("Failed to upload LaTeX to S3")
-                            else:
-                                logger.error("Failed to upload PDF to S3")
-                except Exception as e:
-                    logger.exception(f"Error uploading files to S3: {e}")
-            else:
-                logger.debug("S3 upload skipped (upload_to_s3=False)")
-            
-            return str(pdf_path), s3_url
+        # Upload to S3 if requested and S3 bucket is configured
+        s3_url = None
+        if upload_to_s3:
+            s3_url = _upload_built_resume(built)["s3_pdf_url"]
         else:
-            print("Failed to compile PDF")
-            return None, None
+            logger.debug("S3 upload skipped (upload_to_s3=False)")
+        
+        return built["pdf_path"], s3_url
             
+    except CompilePoolBusy:
+        # Let callers tell back-pressure apart from a missing PDF
+        raise
     except Exception as e:
         print(f"Error generating PDF: {e}")
         return None, None
 
 
-def save_resume_json(resume_data, filename=None, upload_to_s3=True):
+def write_resume_json(resume_data, filename=None):
     """
-    Save resume JSON to a file.
+    Serialize resume JSON and write it to the JSON output directory.
     
     Args:
         resume_data (dict): Resume data in JSON format
         filename (str, optional): Output filename. Defaults to a generated UUID.
-        upload_to_s3 (bool, optional): Whether to upload the JSON to S3. Defaults to True.
         
     Returns:
-        tuple: (local_json_path, s3_url) - Path to the saved JSON file and S3 URL if uploaded
+        tuple: (local_json_path, filename, json_content) - the serialized JSON is
+        returned so it can be uploaded without reading the file back
     """
     # Create JSON output directory
     json_output_dir = Path(__file__).parent.parent / "output" / "json"
@@ -213,51 +335,91 @@ def save_resume_json(resume_data, filename=None, upload_to_s3=True):
     # Create output path
     json_path = json_output_dir / filename
     
-    try:
-        # Write JSON to file
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(resume_data, f, indent=2)
+    # Write JSON to file
+    json_content = json.dumps(resume_data, indent=2)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        f.write(json_content)
+    
+    print(f"Successfully saved JSON: {json_path}")
+    return str(json_path), filename, json_content
+
+
+def save_resume_json(resume_data, filename=None, upload_to_s3=True):
+    """
+    Save resume JSON to a file.
+    
+    Args:
+        resume_data (dict): Resume data in JSON format
+        filename (str, optional): Output filename. Defaults to a generated UUID.
+        upload_to_s3 (bool, optional): Whether to upload the JSON to S3. Defaults to True.
         
-        print(f"Successfully saved JSON: {json_path}")
+    Returns:
+        tuple: (local_json_path, s3_url) - Path to the saved JSON file and S3 URL if uploaded
+    """
+    try:
+        json_path, filename, json_content = write_resume_json(resume_data, filename)
         
         # Upload to S3 if requested and S3 bucket is configured
         s3_url = None
         if upload_to_s3:
-            try:
-                # Get bucket name dynamically
-                bucket_name = get_s3_bucket_name()
-                logger.debug(f"Attempting to upload JSON to S3. S3_BUCKET_NAME={bucket_name}")
-                
-                # Check if S3 bucket name is configured
-                if not bucket_name:
-                    logger.warning("S3_BUCKET_NAME environment variable not set. Skipping S3 upload.")
-                else:
-                    # Create S3 object name
-                    s3_object_name = f"json/{filename}"
-                    
-                    # Upload the file to S3
-                    s3_url = upload_file_to_s3(
-                        str(json_path),
-                        bucket_name,
-                        s3_object_name,
-                        content_type='application/json'
-                    )
-                    
-                    if s3_url:
-                        logger.info(f"Successfully uploaded JSON to S3: {s3_url}")
-                    else:
-                        logger.error("Failed to upload JSON to S3")
-            except Exception as e:
-                logger.exception(f"Error uploading JSON to S3: {e}")
+            s3_url = upload_resume_files(None, json_content=json_content, json_filename=filename)["s3_json_url"]
         else:
             logger.debug("S3 upload skipped (upload_to_s3=False)")
         
-        return str(json_path), s3_url
+        return json_path, s3_url
     except Exception as e:
         logger.error(f"Error saving JSON: {e}")
         return None, None
 
 
+def generate_resume_artifacts(resume_data, output_filename=None):
+    """
+    Save the resume JSON and generate the PDF, then upload the PDF, its LaTeX
+    source and the JSON to S3 concurrently.
+    
+    This is the unit of work executed by the background job queue, so it must
+    stay a module-level function with a JSON-serializable return value.
+    
+    Args:
+        resume_data (dict): Resume data in JSON format
+        output_filename (str, optional): Name for output files (without extension)
+        
+    Returns:
+        dict: Local paths and S3 URLs of the generated artifacts
+        
+    Raises:
+        CompilePoolBusy: If the LaTeX compilation queue stayed full
+    """
+    try:
+        json_path, json_filename, json_content = write_resume_json(resume_data)
+    except Exception as e:
+        logger.error(f"Error saving JSON: {e}")
+        json_path, json_filename, json_content = None, None, None
+    
+    try:
+        built = build_resume_pdf(resume_data, output_filename=output_filename)
+    except CompilePoolBusy:
+        # Fail the job with the busy error rather than reporting a missing PDF
+        raise
+    except Exception as e:
+        print(f"Error generating PDF: {e}")
+        built = None
+    
+    if built is not None:
+        urls = _upload_built_resume(built, json_content, json_filename)
+    elif json_content is not None:
+        urls = upload_resume_files(None, json_content=json_content, json_filename=json_filename)
+    else:
+        urls = {"s3_pdf_url": None, "s3_json_url": None}
+    
+    return {
+        "pdf_path": built["pdf_path"] if built else None,
+        "s3_pdf_url": urls["s3_pdf_url"],
+        "json_path": json_path,
+        "s3_json_url": urls["s3_json_url"]
+    }
+
+
 if __name__ == "__main__":
     # Example usage (for testing)
     import json
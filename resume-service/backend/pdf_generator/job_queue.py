@@ -0,0 +1,439 @@
+"""
+Background Job Queue Module
+
+Runs PDF compilation and S3 uploads off the request path. Jobs are executed by a
+bounded pool of worker processes (LaTeX compilation is CPU-bound) and their
+status is recorded in a job store, either in memory or in a SQLite database.
+
+Usage:
+    from pdf_generator.job_queue import get_job_queue
+
+    job_queue = get_job_queue()
+    job_id = job_queue.submit("resume_artifacts", some_function, arg1, arg2)
+    job = job_queue.get_job(job_id)
+
+Configuration (environment variables):
+    JOB_QUEUE_BACKEND: 'memory' (default) or 'sqlite'
+    JOB_QUEUE_DB_PATH: Path of the SQLite database (default: output/jobs.sqlite3)
+    PDF_WORKER_PROCESSES: Number of worker processes (default: min(4, CPU count))
+    PDF_JOB_QUEUE_SIZE: Most unfinished jobs (queued or running) at once (default: 8 per worker)
+    JOB_RESULT_TTL: Seconds finished jobs are kept by the memory store (default: 3600)
+    JOB_STORE_MAX_JOBS: Most jobs kept by the memory store (default: 10000)
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import logging
+import multiprocessing.util
+import threading
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Configure logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Job status values
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+# Default location of the SQLite job database
+DEFAULT_JOB_DB_PATH = Path(__file__).parent.parent / "output" / "jobs.sqlite3"
+
+# Error recorded for jobs whose server process exited before they finished
+INTERRUPTED_JOB_ERROR = "Job was interrupted by a server restart"
+
+
+class JobQueueBusy(RuntimeError):
+    """Raised when the queue already holds its maximum number of unfinished jobs."""
+
+
+def _process_owner():
+    """Identify this server process in job records (host and PID)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class MemoryJobStore:
+    """
+    Job store that keeps job records in a dictionary of the current process.
+
+    Finished jobs are dropped once they are older than result_ttl, and the
+    oldest finished jobs go first when the store holds more than max_jobs.
+    Worker processes cannot reach the records, so the queue marks jobs as
+    running itself.
+
+    Args:
+        result_ttl (float): Seconds a finished job is kept
+        max_jobs (int): Most jobs kept (unfinished jobs are never dropped)
+    """
+
+    # Worker processes can update the records of a shared store
+    shared = False
+
+    def __init__(self, result_ttl=3600, max_jobs=10000):
+        self.result_ttl = result_ttl
+        self.max_jobs = max_jobs
+        self._jobs = {}
+        # job_id -> time.monotonic() when it finished, in finishing order
+        self._finished = {}
+        self._lock = threading.Lock()
+
+    def _evict(self):
+        # Callers hold the lock
+        expired_before = time.monotonic() - self.result_ttl
+        for job_id, finished_at in list(self._finished.items()):
+            if finished_at > expired_before and len(self._jobs) < self.max_jobs:
+                break
+            del self._finished[job_id]
+            self._jobs.pop(job_id, None)
+
+    def create(self, job_id, kind):
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._evict()
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "kind": kind,
+                "status": JOB_QUEUED,
+                "result": None,
+                "error": None,
+                "created_at": now,
+                "updated_at": now
+            }
+
+    def update(self, job_id, **fields):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(fields)
+            job["updated_at"] = datetime.now().isoformat()
+            if job["status"] in (JOB_COMPLETED, JOB_FAILED):
+                self._finished[job_id] = time.monotonic()
+
+    def mark_running(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job["status"] == JOB_QUEUED:
+                job["status"] = JOB_RUNNING
+                job["updated_at"] = datetime.now().isoformat()
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def fail_interrupted(self):
+        # Jobs in memory cannot outlive the process that ran them
+        return 0
+
+
+class SQLiteJobStore:
+    """
+    Job store backed by a SQLite database, so job records survive restarts
+    and can be read by every server process sharing the database file.
+    Worker processes mark their jobs as running when they start them.
+    """
+
+    shared = True
+
+    def __init__(self, db_path=DEFAULT_JOB_DB_PATH):
+        self.db_path = str(db_path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
+
+            # Added after the table was first created: the process that queued the job
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(jobs)")]
+            if "owner" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def create(self, job_id, kind):
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (job_id, kind, status, owner, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, JOB_QUEUED, _process_owner(), now, now)
+            )
+
+    def update(self, job_id, **fields):
+        if "result" in fields:
+            fields["result"] = json.dumps(fields["result"])
+        fields["updated_at"] = datetime.now().isoformat()
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with self._connect() as conn:
+            conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE job_id = ?",
+                (*fields.values(), job_id)
+            )
+
+    def mark_running(self, job_id):
+        # A job is only started once it was queued, never after it finished
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE job_id = ? AND status = ?",
+                (JOB_RUNNING, datetime.now().isoformat(), job_id, JOB_QUEUED)
+            )
+
+    def get(self, job_id):
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job.pop("owner", None)
+        if job["result"]:
+            job["result"] = json.loads(job["result"])
+        return job
+
+    def fail_interrupted(self):
+        """
+        Mark unfinished jobs of server processes on this host that have exited
+        as failed. Their function and arguments are not stored, so they cannot
+        be queued again; jobs of live processes (or other hosts) are left alone.
+
+        Returns:
+            int: Number of jobs marked as failed
+        """
+        hostname = socket.gethostname()
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT job_id, owner FROM jobs WHERE status IN (?, ?)", (JOB_QUEUED, JOB_RUNNING)
+            ).fetchall()
+            interrupted = []
+            for job_id, owner in rows:
+                # Jobs from before owners were recorded are all leftovers
+                host, _, pid = (owner or "").rpartition(":")
+                if owner is None or (host == hostname and pid.isdigit() and not _process_alive(int(pid))):
+                    interrupted.append(job_id)
+            now = datetime.now().isoformat()
+            conn.executemany(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE job_id = ?",
+                [(JOB_FAILED, INTERRUPTED_JOB_ERROR, now, job_id) for job_id in interrupted]
+            )
+        return len(interrupted)
+
+
+def _init_worker_process():
+    # Each worker process runs one job at a time, so one LaTeX worker is enough
+    os.environ.setdefault("LATEX_COMPILE_WORKERS", "1")
+    # Worker processes skip atexit handlers, so remove the LaTeX scratch directory with a finalizer
+    from .compile_pool import shutdown_compile_pool
+    multiprocessing.util.Finalize(None, shutdown_compile_pool, exitpriority=10)
+
+
+def _run_job(store, job_id, fn, args, kwargs):
+    # Runs in the worker process, so "running" means the job has really started
+    # (a queued future already counts as running once it is handed to a worker)
+    if store is not None:
+        try:
+            store.mark_running(job_id)
+        except Exception as e:
+            logger.warning(f"Could not mark job {job_id} as running: {e}")
+    return fn(*args, **kwargs)
+
+
+class JobQueue:
+    """
+    Bounded pool of worker processes with job status tracking.
+
+    Jobs are submitted as a module-level (picklable) function plus arguments.
+    The return value of the function must be JSON-serializable; it is stored
+    as the job result once the worker finishes.
+
+    At most max_pending jobs are unfinished at a time; further submissions
+    wait for a slot up to their submit_timeout and then fail with
+    JobQueueBusy, so a traffic spike gets back-pressure instead of an
+    unbounded backlog.
+
+    Args:
+        store: MemoryJobStore or SQLiteJobStore
+        max_workers (int): Number of worker processes
+        max_pending (int, optional): Most unfinished jobs; defaults to 8 per worker
+    """
+
+    def __init__(self, store, max_workers, max_pending=None):
+        self.store = store
+        self.max_workers = max_workers
+        self.max_pending = max_pending or max_workers * 8
+        self._executor = None
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+
+        interrupted = self.store.fail_interrupted()
+        if interrupted:
+            logger.warning(f"Marked {interrupted} jobs interrupted by a server restart as failed")
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                logger.info(f"Starting PDF worker pool with {self.max_workers} processes")
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker_process
+                )
+            return self._executor
+
+    def _discard_executor(self, executor):
+        # A worker process died, so the pool refuses all work; the next job starts a new one
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        logger.error("PDF worker pool is broken, restarting it")
+        executor.shutdown(wait=False)
+
+    def submit(self, kind, fn, *args, submit_timeout=0, **kwargs):
+        """
+        Queue a job for background execution.
+
+        Args:
+            kind (str): Short label describing the job type
+            fn (callable): Module-level function to run in a worker process
+            *args, **kwargs: Arguments passed to fn
+            submit_timeout (float, optional): Seconds to wait for a free slot when
+                max_pending jobs are unfinished; 0 fails at once, None waits forever
+
+        Returns:
+            str: ID of the queued job
+
+        Raises:
+            JobQueueBusy: If no slot became free within submit_timeout
+        """
+        if not self._slots.acquire(timeout=submit_timeout):
+            raise JobQueueBusy(f"PDF job queue is full ({self.max_pending} unfinished jobs)")
+
+        try:
+            job_id = uuid.uuid4().hex
+            self.store.create(job_id, kind)
+
+            job = (self.store if self.store.shared else None, job_id, fn, args, kwargs)
+            executor = self._get_executor()
+            try:
+                future = executor.submit(_run_job, *job)
+            except BrokenProcessPool:
+                self._discard_executor(executor)
+                executor = self._get_executor()
+                future = executor.submit(_run_job, *job)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._futures[job_id] = future
+        future.add_done_callback(lambda f: self._on_job_done(job_id, f, executor))
+
+        logger.debug(f"Queued {kind} job {job_id}")
+        return job_id
+
+    def _on_job_done(self, job_id, future, executor):
+        # Record the outcome before dropping the future, so get_job never sees
+        # a job that has neither a pending future nor its result
+        try:
+            result = future.result()
+            self.store.update(job_id, status=JOB_COMPLETED, result=result)
+            logger.info(f"Job {job_id} completed")
+        except Exception as e:
+            self.store.update(job_id, status=JOB_FAILED, error=str(e))
+            logger.error(f"Job {job_id} failed: {e}")
+            if isinstance(e, BrokenProcessPool):
+                self._discard_executor(executor)
+        finally:
+            with self._lock:
+                self._futures.pop(job_id, None)
+            self._slots.release()
+
+    def get_future(self, job_id):
+        """Return the pending future for a job, or None once it has finished."""
+        with self._lock:
+            return self._futures.get(job_id)
+
+    def get_job(self, job_id):
+        """
+        Get the status record of a job.
+
+        Args:
+            job_id (str): ID returned by submit()
+
+        Returns:
+            dict: Job record, or None if the job is unknown
+        """
+        job = self.store.get(job_id)
+        if job and job["status"] == JOB_QUEUED and not self.store.shared:
+            # Approximated by the future, which also runs while handed to a busy worker
+            future = self.get_future(job_id)
+            if future is not None and future.running():
+                self.store.mark_running(job_id)
+                job["status"] = JOB_RUNNING
+        return job
+
+    def shutdown(self, wait=True):
+        """Stop the worker pool, optionally waiting for queued jobs to finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue():
+    """
+    Get the process-wide job queue, creating it on first use.
+
+    Returns:
+        JobQueue: Configured job queue
+    """
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            backend = os.getenv("JOB_QUEUE_BACKEND", "memory").lower()
+            if backend == "sqlite":
+                store = SQLiteJobStore(os.getenv("JOB_QUEUE_DB_PATH", DEFAULT_JOB_DB_PATH))
+            else:
+                store = MemoryJobStore(
+                    result_ttl=float(os.getenv("JOB_RESULT_TTL", "3600")),
+                    max_jobs=int(os.getenv("JOB_STORE_MAX_JOBS", "10000"))
+                )
+
+            max_workers = int(os.getenv("PDF_WORKER_PROCESSES", min(4, os.cpu_count() or 1)))
+            max_pending = int(os.getenv("PDF_JOB_QUEUE_SIZE", max_workers * 8))
+            logger.debug(f"Job queue backend: {backend}, workers: {max_workers}, queue size: {max_pending}")
+            _job_queue = JobQueue(store, max_workers, max_pending)
+        return _job_queue
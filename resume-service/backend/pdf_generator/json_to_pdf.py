@@ -8,7 +8,6 @@ import webbrowser
 import glob
 from .constants import (
     LATEX_SPECIAL_CHARS,
-    SECTION_PATTERNS,
     EDUCATION_PATTERNS,
     DEFAULT_JSON_PATH,
     DEFAULT_TEMPLATE_PATH,
@@ -18,11 +17,36 @@ from .constants import (
     GITHUB_PATTERN,
     PHONE_MIN_DIGITS
 )
+from .latex_engine import get_latex_engine
+from .compile_pool import get_compile_pool, COMPILE_SUBMIT_TIMEOUT
+from .template_compiler import render_sections
 
 #------------------------------------------------------------------------------
 # Utility Functions
 #------------------------------------------------------------------------------
 
+def _build_latex_escapes():
+    """
+    Build the replacement map used by escape_latex_special_chars.
+    
+    Each character is mapped to what the original chain of replacements
+    (backslash first, then LATEX_SPECIAL_CHARS in order) produced for it, so
+    the braces of \\textbackslash{} are themselves escaped as before.
+    """
+    escapes = {}
+    for char in ['\\', *LATEX_SPECIAL_CHARS]:
+        replacement = char.replace('\\', r'\textbackslash{}')
+        for special, special_replacement in LATEX_SPECIAL_CHARS.items():
+            replacement = replacement.replace(special, special_replacement)
+        escapes[char] = replacement
+    return escapes
+
+LATEX_ESCAPES = _build_latex_escapes()
+LATEX_ESCAPE_PATTERN = re.compile('[' + re.escape(''.join(LATEX_ESCAPES)) + ']')
+
+def _replace_latex_special_char(match):
+    return LATEX_ESCAPES[match.group()]
+
 def escape_latex_special_chars(text):
     """
     Escape LaTeX special characters in the given text.
@@ -39,14 +63,8 @@ def escape_latex_special_chars(text):
     if not isinstance(text, str):
         return str(text)
     
-    # Process backslashes first to avoid double-escaping
-    text = text.replace('\\', r'\textbackslash{}')
-    
-    # Then handle other special characters
-    for char, replacement in LATEX_SPECIAL_CHARS.items():
-        text = text.replace(char, replacement)
-    
-    return text
+    # Single pass over the text with a precompiled character class
+    return LATEX_ESCAPE_PATTERN.sub(_replace_latex_special_char, text)
 
 def is_email(text):
     """Check if text is likely an email address."""
@@ -143,7 +161,7 @@ def write_latex_output(latex_content, output_path):
 # LaTeX Compilation Functions
 #------------------------------------------------------------------------------
 
-def compile_latex(tex_file, compiler="pdflatex", output_dir=None, continue_on_error=True, verbose=False, open_pdf=False, cleanup=False):
+def compile_latex(tex_file, compiler="pdflatex", output_dir=None, continue_on_error=True, verbose=False, open_pdf=False, cleanup=False, timeout=None):
     """
     Compile a LaTeX file to PDF using the specified compiler.
     
@@ -155,6 +173,7 @@ def compile_latex(tex_file, compiler="pdflatex", output_dir=None, continue_on_er
         verbose (bool): Whether to print detailed compilation output
         open_pdf (bool): Whether to open the PDF after successful compilation
         cleanup (bool): Whether to clean up auxiliary files after compilation
+        timeout (int, optional): Maximum time in seconds for the compilation
         
     Returns:
         bool: True if compilation succeeded, False otherwise
@@ -222,7 +241,8 @@ def compile_latex(tex_file, compiler="pdflatex", output_dir=None, continue_on_er
             cmd, 
             stdout=subprocess.PIPE if not verbose else None,
             stderr=subprocess.PIPE if not verbose else None,
-            text=True
+            text=True,
+            timeout=timeout
         )
         
         success = result.returncode == 0 or continue_on_error
@@ -240,6 +260,9 @@ def compile_latex(tex_file, compiler="pdflatex", output_dir=None, continue_on_er
     except FileNotFoundError:
         print("Latexmk not found. Please install TeX Live, MiKTeX, or another LaTeX distribution.")
         return False
+    except subprocess.TimeoutExpired:
+        print(f"Compilation of {filename} timed out after {timeout} seconds.")
+        return False
     
     # Check if PDF was generated
     pdf_path = os.path.join(output_dir, base_filename + ".pdf")
@@ -284,10 +307,52 @@ def compile_latex(tex_file, compiler="pdflatex", output_dir=None, continue_on_er
     
     return True
 
+def compile_latex_in_directory(tex_file, output_dir, compiler="pdflatex", verbose=False, timeout=None):
+    """
+    Compile a LaTeX file into a PDF in the given directory.
+    
+    Documents built from the default template are compiled in a single warm
+    pdflatex pass against the precompiled template format; anything else, or
+    a failed warm run, goes through latexmk.
+    
+    Args:
+        tex_file (str): Path to the LaTeX file to compile
+        output_dir (str): Directory to store the PDF and auxiliary files
+        compiler (str): LaTeX compiler to use ('pdflatex', 'xelatex', etc.)
+        verbose (bool): Whether to print detailed compilation output
+        timeout (int, optional): Maximum time in seconds for the compilation
+        
+    Returns:
+        bool: True if compilation succeeded, False otherwise
+    """
+    # Try the warm single-pass compilation first
+    if compiler == "pdflatex":
+        engine = get_latex_engine()
+        with open(tex_file, 'r', encoding='utf-8') as file:
+            latex_content = file.read()
+        if engine.can_compile(latex_content):
+            if engine.compile(tex_file, output_dir, verbose=verbose, timeout=timeout):
+                return True
+            print("Warm compilation failed, falling back to latexmk...")
+    
+    return compile_latex(
+        tex_file,
+        compiler=compiler,
+        output_dir=output_dir,
+        continue_on_error=True,
+        verbose=verbose,
+        open_pdf=False,
+        cleanup=True,
+        timeout=timeout
+    )
+
 def compile_latex_to_pdf(tex_file, output_pdf=None, compiler="pdflatex", verbose=False):
     """
     Wrapper function to compile a LaTeX file to PDF.
     
+    The compilation runs on the shared worker pool, in a private scratch
+    directory, and only the finished PDF is moved to output_pdf.
+    
     Args:
         tex_file (str): Path to the LaTeX file to compile
         output_pdf (str, optional): Path for the output PDF. If None, uses the same name as tex_file.
@@ -296,26 +361,25 @@ def compile_latex_to_pdf(tex_file, output_pdf=None, compiler="pdflatex", verbose
         
     Returns:
         bool: True if compilation succeeded, False otherwise
+        
+    Raises:
+        CompilePoolBusy: If the pool's queue stays full for COMPILE_SUBMIT_TIMEOUT seconds
     """
+    if not os.path.isfile(tex_file):
+        print(f"Error: File {tex_file} not found.")
+        return False
+    
     if output_pdf is None:
         # Use the same name as the input, but with .pdf extension
         output_pdf = os.path.splitext(tex_file)[0] + ".pdf"
     
-    # Get the output directory
-    output_dir = os.path.dirname(output_pdf)
-    
-    # Ensure the output directory exists
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Compile the LaTeX file
-    return compile_latex(
+    # Compile the LaTeX file on the worker pool
+    return get_compile_pool().compile(
         tex_file,
+        output_pdf,
+        submit_timeout=COMPILE_SUBMIT_TIMEOUT,
         compiler=compiler,
-        output_dir=output_dir,
-        continue_on_error=True,
-        verbose=verbose,
-        open_pdf=False,
-        cleanup=True
+        verbose=verbose
     )
 
 #------------------------------------------------------------------------------
@@ -422,7 +486,7 @@ def format_education(education):
     Returns:
         str: Formatted LaTeX for education section
     """
-    edu_latex = "\\section{Education}\n\\resumeSubHeadingListStart\n"
+    edu_parts = ["\\section{Education}\n\\resumeSubHeadingListStart\n"]
     
     # Handle education as a list of dictionaries (new format)
     if isinstance(education, list) and education:
@@ -442,15 +506,14 @@ def format_education(education):
                 degree = escape_latex_special_chars(entry.get('degree', ''))
                 dates = escape_latex_special_chars(entry.get('dates', ''))
                 
-                edu_latex += format_education_entry(institution, location, degree, dates)
+                edu_parts.append(format_education_entry(institution, location, degree, dates))
                 
                 # Add descriptions/achievements if available
                 if 'details' in entry and isinstance(entry['details'], list) and entry['details']:
-                    edu_latex += "\\resumeItemListStart\n"
+                    edu_parts.append("\\resumeItemListStart\n")
                     for detail in entry['details']:
-                        detail_text = escape_latex_special_chars(detail)
-                        edu_latex += f"\\resumeItem{{{detail_text}}}\n"
-                    edu_latex += "\\resumeItemListEnd\n"
+                        edu_parts.append(f"\\resumeItem{{{escape_latex_special_chars(detail)}}}\n")
+                    edu_parts.append("\\resumeItemListEnd\n")
     
     # Handle education as a string (legacy format)
     elif isinstance(education, str) and education.strip():
@@ -489,10 +552,10 @@ def format_education(education):
             degree = escape_latex_special_chars(entry['degree'])
             dates = escape_latex_special_chars(entry['dates'])
             
-            edu_latex += format_education_entry(institution, location, degree, dates)
+            edu_parts.append(format_education_entry(institution, location, degree, dates))
     
-    edu_latex += "\\resumeSubHeadingListEnd\n"
-    return edu_latex
+    edu_parts.append("\\resumeSubHeadingListEnd\n")
+    return ''.join(edu_parts)
 
 def format_education_entry(institution, location, degree, dates):
     """Helper function to format a single education entry."""
@@ -518,7 +581,7 @@ def format_experience(experience):
         str: Formatted LaTeX for experience section
     """
     if isinstance(experience, list) and experience:
-        exp_latex = "\\section{Experience}\n\\resumeSubHeadingListStart\n"
+        exp_parts = ["\\section{Experience}\n\\resumeSubHeadingListStart\n"]
         
         for job in experience:
             company = escape_latex_special_chars(job.get('company', ''))
@@ -532,23 +595,22 @@ def format_experience(experience):
             location = "" if location is None else location
             dates = "" if dates is None else dates
             
-            exp_latex += f"""\\resumeSubheading
+            exp_parts.append(f"""\\resumeSubheading
 {{{title}}}{{{dates}}}
 {{{company}}}{{{location}}}
 \\resumeItemListStart
-"""
+""")
             
             # Add bullet points for job details
             details = job.get('details', [])
             if isinstance(details, list) and details:
                 for detail in details:
-                    detail_text = escape_latex_special_chars(detail)
-                    exp_latex += f"\\resumeItem{{{detail_text}}}\n"
+                    exp_parts.append(f"\\resumeItem{{{escape_latex_special_chars(detail)}}}\n")
             
-            exp_latex += "\\resumeItemListEnd\n"
+            exp_parts.append("\\resumeItemListEnd\n")
         
-        exp_latex += "\\resumeSubHeadingListEnd\n"
-        return exp_latex
+        exp_parts.append("\\resumeSubHeadingListEnd\n")
+        return ''.join(exp_parts)
     
     # Default return if format is unexpected or empty
     return "\\section{Experience}\n\\resumeSubHeadingListStart\n\\resumeSubHeadingListEnd\n"
@@ -563,7 +625,7 @@ def format_skills(skills):
     Returns:
         str: Formatted LaTeX for skills section
     """
-    skills_latex = "\\section{Technical Skills}\n\\begin{itemize}[leftmargin=0pt, itemindent=0pt, labelwidth=0pt, labelsep=0pt, align=left, label={}]%\n\\small{\\item{\n"
+    skills_parts = ["\\section{Technical Skills}\n\\begin{itemize}[leftmargin=0pt, itemindent=0pt, labelwidth=0pt, labelsep=0pt, align=left, label={}]%\n\\small{\\item{\n"]
     
     # Handle skills as a dictionary with categories (new format)
     if isinstance(skills, dict):
@@ -591,15 +653,9 @@ def format_skills(skills):
             elif isinstance(tech_skills, list) and tech_skills:
                 skills_text = ", ".join([escape_latex_special_chars(skill) for skill in tech_skills])
                 formatted_skills.append(f"\\textbf{{Technical Skills}}: {skills_text}")
-            
-            # Remove "Technical Skills" so we don't process it again
-            skills_copy = dict(skills)
-            del skills_copy["Technical Skills"]
-        else:
-            skills_copy = skills
         
         # Process each category and its skills
-        for category, skill_list in skills_copy.items():
+        for category, skill_list in skills.items():
             # Skip if this is "Technical Skills" which we already handled
             if category == "Technical Skills":
                 continue
@@ -630,8 +686,7 @@ def format_skills(skills):
                 formatted_skills.append(f"\\textbf{{{category_text}}}: {skills_text}")
         
         # Join categories with line breaks
-        skills_text = " \\\\\n".join(formatted_skills)
-        skills_latex += skills_text
+        skills_parts.append(" \\\\\n".join(formatted_skills))
     
     # Handle skills as a flat list (legacy format)
     elif isinstance(skills, list) and skills:
@@ -654,11 +709,10 @@ def format_skills(skills):
             formatted_skills.append(formatted_skill)
         
         # Join skills with proper LaTeX line breaks
-        skills_text = " \\\\\n".join(formatted_skills)
-        skills_latex += skills_text
+        skills_parts.append(" \\\\\n".join(formatted_skills))
     
-    skills_latex += "\n}}\n\\end{itemize}\n"
-    return skills_latex
+    skills_parts.append("\n}}\n\\end{itemize}\n")
+    return ''.join(skills_parts)
 
 def format_projects(projects):
     """
@@ -671,7 +725,7 @@ def format_projects(projects):
         str: Formatted LaTeX for projects section
     """
     if isinstance(projects, list) and projects:
-        proj_latex = "\\section{Projects}\n\\resumeSubHeadingListStart\n"
+        proj_parts = ["\\section{Projects}\n\\resumeSubHeadingListStart\n"]
         
         for project in projects:
             # Get project name from either 'name' or 'title' field
@@ -692,23 +746,23 @@ def format_projects(projects):
             # Make sure technologies aren't too long - if they are, we'll break them to a new line
             # Use empty second parameter for dates to avoid text being cut off
             if technologies_formatted and len(technologies_formatted) > 40:  # Threshold for reasonable length
-                proj_latex += f"""\\resumeProjectHeading
+                proj_parts.append(f"""\\resumeProjectHeading
 {{\\textbf{{{project_name}}}}}{{}}
 \\resumeItemListStart
 \\resumeItem{{\\emph{{Technologies:}} {technologies_formatted}}}
-"""
+""")
             elif technologies_formatted:
                 # Short technology list can be included in the heading 
-                proj_latex += f"""\\resumeProjectHeading
+                proj_parts.append(f"""\\resumeProjectHeading
 {{\\textbf{{{project_name}}} $|$ \\emph{{{technologies_formatted}}}}}{{}}
 \\resumeItemListStart
-"""
+""")
             else:
                 # No technologies provided
-                proj_latex += f"""\\resumeProjectHeading
+                proj_parts.append(f"""\\resumeProjectHeading
 {{\\textbf{{{project_name}}}}}{{}}
 \\resumeItemListStart
-"""
+""")
             
             # Add bullet points for project details - check both 'details' and 'description' fields
             details = project.get('details', [])
@@ -723,13 +777,12 @@ def format_projects(projects):
             
             if isinstance(details, list) and details:
                 for detail in details:
-                    detail_text = escape_latex_special_chars(detail)
-                    proj_latex += f"\\resumeItem{{{detail_text}}}\n"
+                    proj_parts.append(f"\\resumeItem{{{escape_latex_special_chars(detail)}}}\n")
             
-            proj_latex += "\\resumeItemListEnd\n"
+            proj_parts.append("\\resumeItemListEnd\n")
         
-        proj_latex += "\\resumeSubHeadingListEnd\n"
-        return proj_latex
+        proj_parts.append("\\resumeSubHeadingListEnd\n")
+        return ''.join(proj_parts)
     
     # Default return if format is unexpected or empty
     return "\\section{Projects}\n\\resumeSubHeadingListStart\n\\resumeSubHeadingListEnd\n"
@@ -738,48 +791,39 @@ def format_projects(projects):
 # Template Processing Functions 
 #------------------------------------------------------------------------------
 
-def populate_template(template, resume_data):
+def format_sections(resume_data):
     """
-    Replace content in template with resume data from JSON.
+    Format every resume section for LaTeX.
     
     Args:
-        template (str): LaTeX template content
         resume_data (dict): Resume data parsed from JSON
         
     Returns:
-        str: Populated LaTeX template with resume data
+        dict: Formatted LaTeX keyed by section name
     """
-    # Create a copy of the template for manipulation
-    populated_template = template
-    
-    # Format the sections first
-    sections = {
+    return {
         'personal_info': format_personal_info(resume_data.get('personal_info', '')),
         'education': format_education(resume_data.get('education', '')),
         'experience': format_experience(resume_data.get('experience', [])),
         'projects': format_projects(resume_data.get('projects', [])),
         'skills': format_skills(resume_data.get('skills', []))
     }
+
+def populate_template(template, resume_data):
+    """
+    Replace content in template with resume data from JSON.
     
-    # Replace each section pattern with formatted content
-    for section_name, pattern in SECTION_PATTERNS.items():
-        # Use a function for replacement to avoid escape sequence issues
-        populated_template = re.sub(
-            pattern, 
-            lambda m: sections[section_name], 
-            populated_template, 
-            flags=re.DOTALL
-        )
+    The template is compiled once into static chunks and section slots
+    (see template_compiler), so repeated calls only join strings.
     
-    # Remove any duplicate sections or unwanted content
-    populated_template = re.sub(
-        r'%---+\s*\\resumeSubheading.*?(?=\\section|\s*\\end{document})', 
-        '', 
-        populated_template, 
-        flags=re.DOTALL
-    )
-    
-    return populated_template
+    Args:
+        template (str): LaTeX template content
+        resume_data (dict): Resume data parsed from JSON
+        
+    Returns:
+        str: Populated LaTeX template with resume data
+    """
+    return render_sections(template, format_sections(resume_data))
 
 #------------------------------------------------------------------------------
 # Command Line Interface Functions
@@ -0,0 +1,250 @@
+"""
+Warm LaTeX Compilation Engine
+
+Every generated resume shares the preamble of templates/template.tex, so the
+packages and fonts it loads can be dumped once into a pdfTeX format file
+(.fmt) with mylatexformat and reused by every compilation. Documents are then
+compiled with a single pdflatex pass when they contain no cross-references,
+falling back to latexmk whenever the fast path does not apply.
+
+Usage:
+    from pdf_generator.latex_engine import get_latex_engine
+
+    engine = get_latex_engine()
+    engine.build_format()                      # at startup
+    engine.compile("resume.tex", "output/pdfs")
+"""
+
+import os
+import re
+import hashlib
+import logging
+import subprocess
+import threading
+from pathlib import Path
+
+from .constants import DEFAULT_TEMPLATE_PATH, CROSS_REFERENCE_PATTERN
+
+# Configure logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Default locations of the template and of the precompiled formats
+DEFAULT_TEMPLATE_FILE = Path(__file__).parent / "templates" / DEFAULT_TEMPLATE_PATH
+DEFAULT_FORMAT_DIR = Path(__file__).parent.parent / "output" / "formats"
+
+# Marker separating the preamble from the document body
+BEGIN_DOCUMENT = "\\begin{document}"
+
+# Auxiliary files produced by a single pdflatex pass
+SINGLE_PASS_AUX_EXTENSIONS = [".aux", ".log", ".out"]
+
+
+def split_preamble(latex_content):
+    """
+    Return the preamble of a LaTeX document (everything before \\begin{document}).
+
+    Args:
+        latex_content (str): Complete LaTeX document content
+
+    Returns:
+        str: The preamble, or None if the document has no \\begin{document}
+    """
+    index = latex_content.find(BEGIN_DOCUMENT)
+    if index < 0:
+        return None
+    return latex_content[:index]
+
+
+def needs_multiple_passes(latex_content):
+    """Check whether a document uses cross-references that need more than one pass."""
+    return re.search(CROSS_REFERENCE_PATTERN, latex_content) is not None
+
+
+class LatexEngine:
+    """
+    pdflatex driver that compiles against a format precompiled from the
+    template preamble.
+    """
+
+    def __init__(self, template_path=DEFAULT_TEMPLATE_FILE, format_dir=DEFAULT_FORMAT_DIR):
+        self.template_path = Path(template_path)
+        self.format_dir = Path(format_dir)
+        self.format_name = None
+        self.preamble = None
+        self._lock = threading.Lock()
+
+    def _format_name_for(self, preamble):
+        digest = hashlib.sha1(preamble.encode('utf-8')).hexdigest()[:12]
+        return f"resume-{digest}"
+
+    def build_format(self, timeout=120):
+        """
+        Precompile the template preamble into a format file.
+
+        The format name includes a hash of the preamble, so editing the template
+        produces a new format, and a format already built by another process is
+        reused as-is.
+
+        Args:
+            timeout (int): Maximum time in seconds for the format build
+
+        Returns:
+            bool: True if a usable format is available, False otherwise
+        """
+        with self._lock:
+            try:
+                with open(self.template_path, 'r', encoding='utf-8') as f:
+                    preamble = split_preamble(f.read())
+            except FileNotFoundError:
+                logger.error(f"LaTeX template file not found: {self.template_path}")
+                return False
+
+            if preamble is None:
+                logger.error(f"No \\begin{{document}} in template: {self.template_path}")
+                return False
+
+            format_name = self._format_name_for(preamble)
+            format_file = self.format_dir / f"{format_name}.fmt"
+
+            if format_file.exists():
+                self.format_name, self.preamble = format_name, preamble
+                return True
+
+            os.makedirs(self.format_dir, exist_ok=True)
+
+            # Build under a temporary job name and rename, so concurrent
+            # processes never load a partially written format
+            temp_name = f"{format_name}-{os.getpid()}"
+            cmd = [
+                "pdflatex",
+                "-ini",
+                "-interaction=nonstopmode",
+                f"-jobname={temp_name}",
+                "&pdflatex",
+                "mylatexformat.ltx",
+                str(self.template_path.resolve())
+            ]
+
+            logger.info(f"Precompiling LaTeX format {format_name}")
+            try:
+                subprocess.run(
+                    cmd,
+                    cwd=self.format_dir,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    timeout=timeout
+                )
+            except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+                logger.warning(f"Could not precompile LaTeX format: {e}")
+                return False
+
+            temp_file = self.format_dir / f"{temp_name}.fmt"
+            if not temp_file.exists():
+                logger.warning("Format precompilation produced no .fmt file; using latexmk")
+                return False
+
+            os.replace(temp_file, format_file)
+            try:
+                os.remove(self.format_dir / f"{temp_name}.log")
+            except OSError:
+                pass
+
+            self.format_name, self.preamble = format_name, preamble
+            logger.info(f"LaTeX format ready: {format_file}")
+            return True
+
+    def can_compile(self, latex_content):
+        """
+        Check whether a document can take the warm single-pass path.
+
+        Args:
+            latex_content (str): Complete LaTeX document content
+
+        Returns:
+            bool: True if the precompiled format matches and no cross-references are used
+        """
+        if self.format_name is None:
+            return False
+        if split_preamble(latex_content) != self.preamble:
+            return False
+        return not needs_multiple_passes(latex_content)
+
+    def compile(self, tex_file, output_dir, verbose=False, timeout=60):
+        """
+        Compile a LaTeX file with one pdflatex pass against the precompiled format.
+
+        Args:
+            tex_file (str): Path to the LaTeX file to compile
+            output_dir (str): Directory to store the PDF
+            verbose (bool): Whether to print detailed compilation output
+            timeout (int): Maximum time in seconds for the compilation
+
+        Returns:
+            bool: True if the PDF was generated, False otherwise
+        """
+        tex_file = os.path.abspath(tex_file)
+        output_dir = os.path.abspath(output_dir)
+        base_filename = os.path.splitext(os.path.basename(tex_file))[0]
+        pdf_path = os.path.join(output_dir, base_filename + ".pdf")
+
+        # Remove a stale PDF so a failed run is not mistaken for success
+        if os.path.exists(pdf_path):
+            os.remove(pdf_path)
+
+        # Let kpathsea find the format in our format directory first
+        env = dict(os.environ)
+        env["TEXFORMATS"] = f"{self.format_dir.resolve()}{os.pathsep}{env.get('TEXFORMATS', '')}"
+
+        cmd = [
+            "pdflatex",
+            f"-fmt={self.format_name}",
+            "-interaction=nonstopmode",
+            "-file-line-error",
+            f"-output-directory={output_dir}",
+            tex_file
+        ]
+
+        if verbose:
+            print(f"Running: {' '.join(cmd)}")
+
+        try:
+            subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE if not verbose else None,
+                stderr=subprocess.PIPE if not verbose else None,
+                text=True,
+                env=env,
+                timeout=timeout
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Warm LaTeX compilation failed: {e}")
+            return False
+        finally:
+            for ext in SINGLE_PASS_AUX_EXTENSIONS:
+                try:
+                    os.remove(os.path.join(output_dir, base_filename + ext))
+                except OSError:
+                    pass
+
+        return os.path.exists(pdf_path)
+
+
+_latex_engine = None
+_latex_engine_lock = threading.Lock()
+
+
+def get_latex_engine():
+    """
+    Get the process-wide LaTeX engine, loading an existing format if available.
+
+    Returns:
+        LatexEngine: Shared engine for the default template
+    """
+    global _latex_engine
+    with _latex_engine_lock:
+        if _latex_engine is None:
+            _latex_engine = LatexEngine()
+            _latex_engine.build_format()
+        return _latex_engine
@@ -1,5 +1,12 @@
+import io
 import os
+import time
 import boto3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import logging
 
@@ -7,19 +14,33 @@ logger = logging.getLogger(__name__)
 # Set logger level to DEBUG for detailed information
 logger.setLevel(logging.DEBUG)
 
-def get_s3_client():
-    """
-    Create and return an S3 client using AWS credentials from environment variables.
-    
-    Returns:
-        boto3.client: Configured S3 client
-    """
+# Process-wide S3 client, created on first use (see get_s3_client)
+_s3_client = None
+_s3_client_pid = None
+_s3_client_lock = threading.Lock()
+
+# Transfer settings shared by all uploads. Resume artifacts are small, so they
+# go up in a single request; only unusually large files use multipart uploads.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4
+)
+
+# Thread pool running concurrent uploads (see upload_buffers_to_s3)
+_upload_executor = None
+_upload_executor_pid = None
+_upload_executor_lock = threading.Lock()
+
+
+def _create_s3_client():
     aws_access_key = os.getenv("AWS_ACCESS_KEY_ID")
     aws_secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
     aws_region = os.getenv("AWS_REGION", "us-east-2")
-    s3_bucket = os.getenv("S3_BUCKET_NAME")
+    endpoint_url = os.getenv("S3_ENDPOINT_URL") or None
+    max_pool_connections = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "32"))
     
-    logger.debug(f"AWS Config - Region: {aws_region}, Bucket: {s3_bucket}")
+    logger.debug(f"AWS Config - Region: {aws_region}, Bucket: {os.getenv('S3_BUCKET_NAME')}")
     logger.debug(f"AWS Access Key ID exists: {bool(aws_access_key)}")
     logger.debug(f"AWS Secret Access Key exists: {bool(aws_secret_key)}")
     
@@ -27,20 +48,55 @@ def get_s3_client():
         logger.error("AWS credentials not found in environment variables")
         raise ValueError("AWS credentials not found in environment variables")
     
-    try:
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=aws_access_key,
-            aws_secret_access_key=aws_secret_key,
-            region_name=aws_region
-        )
-        # Test if client works
-        s3_client.list_buckets()
-        logger.debug("Successfully created S3 client and connected to AWS")
-        return s3_client
-    except Exception as e:
-        logger.error(f"Error creating S3 client: {str(e)}")
-        raise
+    # One config for uploads, downloads and presigning: regional endpoint,
+    # SigV4, and a connection pool sized for concurrent requests
+    config = Config(
+        signature_version='s3v4',
+        region_name=aws_region,
+        # Local S3 stand-ins (MinIO, moto) only support path-style addressing
+        s3={'addressing_style': 'path' if endpoint_url else 'virtual'},
+        max_pool_connections=max_pool_connections,
+        retries={'max_attempts': 3, 'mode': 'standard'}
+    )
+    
+    s3_client = boto3.client(
+        's3',
+        aws_access_key_id=aws_access_key,
+        aws_secret_access_key=aws_secret_key,
+        region_name=aws_region,
+        endpoint_url=endpoint_url,
+        config=config
+    )
+    logger.debug(f"Created S3 client (pool size {max_pool_connections})")
+    return s3_client
+
+def get_s3_client():
+    """
+    Get the process-wide S3 client, creating it on first use.
+    
+    boto3 clients are thread-safe, so every upload, download and presigned URL
+    shares one client and its connection pool. A new client is created after a
+    fork, since connections must not be shared between processes.
+    
+    Configuration (environment variables):
+        AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY: Credentials (required)
+        AWS_REGION: Region of the bucket (default: us-east-2)
+        S3_ENDPOINT_URL: Alternative endpoint, e.g. a local MinIO server
+        S3_MAX_POOL_CONNECTIONS: Size of the connection pool (default: 32)
+    
+    Returns:
+        boto3.client: Configured S3 client
+    """
+    global _s3_client, _s3_client_pid
+    pid = os.getpid()
+    if _s3_client is not None and _s3_client_pid == pid:
+        return _s3_client
+    
+    with _s3_client_lock:
+        if _s3_client is None or _s3_client_pid != pid:
+            _s3_client = _create_s3_client()
+            _s3_client_pid = pid
+        return _s3_client
 
 def upload_file_to_s3(file_path, bucket_name, object_name=None, content_type=None):
     """
@@ -69,7 +125,7 @@ def upload_file_to_s3(file_path, bucket_name, object_name=None, content_type=Non
     
     try:
         logger.debug(f"About to upload file: {file_path} to bucket: {bucket_name}, object: {object_name}")
-        s3_client.upload_file(file_path, bucket_name, object_name, ExtraArgs=extra_args)
+        s3_client.upload_file(file_path, bucket_name, object_name, ExtraArgs=extra_args, Config=TRANSFER_CONFIG)
         logger.info(f"File {file_path} uploaded to {bucket_name}/{object_name}")
         
         # Generate S3 URL
@@ -80,6 +136,114 @@ def upload_file_to_s3(file_path, bucket_name, object_name=None, content_type=Non
         logger.error(f"Error uploading file to S3: {str(e)}")
         return None
 
+def upload_fileobj_to_s3(fileobj, bucket_name, object_name, content_type=None):
+    """
+    Upload a file-like object (e.g. an in-memory buffer) to an S3 bucket
+    
+    Args:
+        fileobj: Readable binary file-like object
+        bucket_name (str): Name of the S3 bucket
+        object_name (str): S3 object name
+        content_type (str, optional): Content type of the file (e.g., 'application/pdf')
+        
+    Returns:
+        str: S3 URL of the uploaded file, or None if upload failed
+    """
+    extra_args = {'ContentType': content_type} if content_type else {}
+    
+    try:
+        get_s3_client().upload_fileobj(fileobj, bucket_name, object_name, ExtraArgs=extra_args, Config=TRANSFER_CONFIG)
+        logger.info(f"Uploaded {bucket_name}/{object_name}")
+        return f"s3://{bucket_name}/{object_name}"
+    except ClientError as e:
+        logger.error(f"Error uploading {object_name} to S3: {str(e)}")
+        return None
+
+def _get_upload_executor():
+    global _upload_executor, _upload_executor_pid
+    with _upload_executor_lock:
+        if _upload_executor is None or _upload_executor_pid != os.getpid():
+            workers = int(os.getenv("S3_UPLOAD_WORKERS", "8"))
+            _upload_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s3-upload")
+            _upload_executor_pid = os.getpid()
+        return _upload_executor
+
+def upload_buffers_to_s3(uploads, bucket_name):
+    """
+    Upload several in-memory objects to an S3 bucket concurrently
+    
+    Args:
+        uploads (list): (data, object_name, content_type) tuples, where data is bytes
+        bucket_name (str): Name of the S3 bucket
+        
+    Returns:
+        list: S3 URL of each upload in order, None for uploads that failed
+    """
+    def upload(data, object_name, content_type):
+        return upload_fileobj_to_s3(io.BytesIO(data), bucket_name, object_name, content_type)
+    
+    if len(uploads) == 1:
+        futures = [None]
+    else:
+        executor = _get_upload_executor()
+        futures = [executor.submit(upload, *item) for item in uploads]
+    
+    # A failed upload (e.g. a connection error, which is not a ClientError)
+    # must not discard the URLs of the others
+    urls = []
+    for item, future in zip(uploads, futures):
+        try:
+            urls.append(future.result() if future is not None else upload(*item))
+        except Exception as e:
+            logger.error(f"Error uploading {item[1]} to S3: {str(e)}")
+            urls.append(None)
+    return urls
+
+class PresignedUrlCache:
+    """
+    LRU cache of presigned URLs that hands out a URL only while at least
+    (1 - reuse_fraction) of its validity remains, well before the signature expires.
+    
+    Args:
+        max_entries (int): Maximum number of cached URLs
+        reuse_fraction (float): Share of the URL's validity during which it is reused
+    """
+    
+    def __init__(self, max_entries=4096, reuse_fraction=0.5):
+        self.max_entries = max_entries
+        self.reuse_fraction = reuse_fraction
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            url, reuse_until = entry
+            if time.monotonic() >= reuse_until:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return url
+    
+    def put(self, key, url, expiration):
+        reuse_until = time.monotonic() + expiration * self.reuse_fraction
+        with self._lock:
+            self._entries[key] = (url, reuse_until)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+# Presigned URLs for view/download links, keyed by (bucket, key, disposition, expiration)
+presigned_url_cache = PresignedUrlCache(
+    max_entries=int(os.getenv("PRESIGNED_URL_CACHE_SIZE", "4096"))
+)
+
 def generate_presigned_url(bucket_name, object_name, expiration=3600, download=False):
     """
     Generate a presigned URL for an S3 object
@@ -92,9 +256,15 @@ def generate_presigned_url(bucket_name, object_name, expiration=3600, download=F
         
     Returns:
         str: Presigned URL or None if generation failed
+    
+    URLs are cached and reused for the first half of their validity, so repeated
+    clicks on the same resume do not sign again.
     """
-    # Get the region from environment variables
-    aws_region = os.getenv("AWS_REGION", "us-east-2")
+    cache_key = (bucket_name, object_name, download, expiration)
+    url = presigned_url_cache.get(cache_key)
+    if url:
+        logger.debug(f"Reusing cached presigned URL for {bucket_name}/{object_name}")
+        return url
     
     # Set response headers based on download parameter
     response_headers = {}
@@ -102,24 +272,11 @@ def generate_presigned_url(bucket_name, object_name, expiration=3600, download=F
         filename = os.path.basename(object_name)
         response_headers['ResponseContentDisposition'] = f'attachment; filename="{filename}"'
     
-    # Use specific config to ensure regional endpoint and proper signing
-    config = boto3.session.Config(
-        signature_version='s3v4',
-        region_name=aws_region,
-        s3={'addressing_style': 'virtual'}  # Use virtual addressing style
-    )
-    
     try:
-        # Create a client with explicit config
-        s3_client = boto3.client(
-            's3',
-            region_name=aws_region,
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            config=config
-        )
+        # Presigning is local; the shared client already uses SigV4 and the regional endpoint
+        s3_client = get_s3_client()
         
-        logger.debug(f"Generating presigned URL for {bucket_name}/{object_name} in region {aws_region}")
+        logger.debug(f"Generating presigned URL for {bucket_name}/{object_name}")
         
         # Generate presigned URL
         url = s3_client.generate_presigned_url(
@@ -133,11 +290,60 @@ def generate_presigned_url(bucket_name, object_name, expiration=3600, download=F
         )
         
         logger.debug(f"Generated presigned URL: {url}")
+        presigned_url_cache.put(cache_key, url, expiration)
         return url
     except ClientError as e:
         logger.error(f"Error generating presigned URL: {str(e)}")
         return None
 
+def open_s3_object(bucket_name, object_name, byte_range=None):
+    """
+    Open an S3 object for streaming, without writing it to disk
+    
+    Args:
+        bucket_name (str): Name of the S3 bucket
+        object_name (str): Name of the S3 object
+        byte_range (str, optional): HTTP Range header value (e.g. 'bytes=0-1023')
+        
+    Returns:
+        dict: get_object response (Body is a botocore StreamingBody, ContentRange
+        is set for ranged reads), or None if the object does not exist
+        
+    Raises:
+        ClientError: For errors other than a missing object (e.g. InvalidRange)
+    """
+    params = {'Bucket': bucket_name, 'Key': object_name}
+    if byte_range:
+        params['Range'] = byte_range
+    
+    try:
+        return get_s3_client().get_object(**params)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+            logger.debug(f"S3 object not found: {bucket_name}/{object_name}")
+            return None
+        raise
+
+def head_s3_object(bucket_name, object_name):
+    """
+    Get the metadata of an S3 object without reading its body
+    
+    Args:
+        bucket_name (str): Name of the S3 bucket
+        object_name (str): Name of the S3 object
+        
+    Returns:
+        dict: head_object response (ETag, ContentLength, LastModified, ...), or
+        None if the object does not exist
+    """
+    try:
+        return get_s3_client().head_object(Bucket=bucket_name, Key=object_name)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+            logger.debug(f"S3 object not found: {bucket_name}/{object_name}")
+            return None
+        raise
+
 def download_file_from_s3(bucket_name, object_name, destination_path):
     """
     Download a file from an S3 bucket
@@ -0,0 +1,183 @@
+"""
+LaTeX Template Compiler
+
+Parses a LaTeX template once into static chunks and named section slots, so
+rendering a resume is a single join instead of running the SECTION_PATTERNS
+substitutions and the cleanup regex over the whole template per request.
+
+The chunks are produced by running the original substitution pipeline with a
+sentinel in place of each section. Every sentinel starts with the same text
+as the real section content (SECTION_PREFIXES), so the cleanup regex sees the
+same boundaries and rendering is byte-identical to substitute_sections().
+
+Usage:
+    from pdf_generator.template_compiler import load_template, render_sections
+
+    template = load_template("templates/template.tex")
+    latex_content = render_sections(template, sections)
+"""
+
+import os
+import re
+import threading
+from functools import lru_cache
+
+from .constants import SECTION_PATTERNS, SECTION_PREFIXES, TEMPLATE_CLEANUP_PATTERN
+
+# Marker delimiting a slot name inside a sentinel (never present in templates)
+SLOT_MARKER = "\x00"
+
+
+def substitute_sections(template, sections):
+    """
+    Replace the template sections with formatted content using SECTION_PATTERNS.
+
+    Args:
+        template (str): LaTeX template content
+        sections (dict): Formatted LaTeX for each section name
+
+    Returns:
+        str: Populated LaTeX document
+    """
+    populated_template = template
+
+    # Replace each section pattern with formatted content
+    for section_name, pattern in SECTION_PATTERNS.items():
+        # Use a function for replacement to avoid escape sequence issues
+        populated_template = re.sub(
+            pattern,
+            lambda m: sections[section_name],
+            populated_template,
+            flags=re.DOTALL
+        )
+
+    # Remove any duplicate sections or unwanted content
+    populated_template = re.sub(
+        TEMPLATE_CLEANUP_PATTERN,
+        '',
+        populated_template,
+        flags=re.DOTALL
+    )
+
+    return populated_template
+
+
+def _sentinel(section_name):
+    return f"{SECTION_PREFIXES[section_name]}{SLOT_MARKER}{section_name}{SLOT_MARKER}"
+
+
+class CompiledTemplate:
+    """
+    A template split into static chunks around named section slots.
+
+    Args:
+        chunks (list): Static text, one more entry than slots
+        slots (list): Section name filling the gap after each chunk
+    """
+
+    def __init__(self, chunks, slots):
+        self.chunks = chunks
+        self.slots = slots
+
+    def render(self, sections):
+        """
+        Render the template with formatted section content.
+
+        Args:
+            sections (dict): Formatted LaTeX for each section name
+
+        Returns:
+            str: Populated LaTeX document
+        """
+        parts = [self.chunks[0]]
+        for section_name, chunk in zip(self.slots, self.chunks[1:]):
+            parts.append(sections[section_name])
+            parts.append(chunk)
+        return ''.join(parts)
+
+
+@lru_cache(maxsize=8)
+def compile_template(template):
+    """
+    Compile template text into a CompiledTemplate.
+
+    Args:
+        template (str): LaTeX template content
+
+    Returns:
+        CompiledTemplate: The compiled template, or None if the template does not
+        have exactly the expected section slots (callers then use substitute_sections)
+    """
+    if SLOT_MARKER in template:
+        return None
+
+    sentinels = {name: _sentinel(name) for name in SECTION_PATTERNS}
+    rendered = substitute_sections(template, sentinels)
+
+    # Splitting on the marker alternates chunk, slot name, chunk, ...
+    pieces = rendered.split(SLOT_MARKER)
+    chunks = [pieces[0]]
+    slots = pieces[1::2]
+    for section_name, chunk in zip(slots, pieces[2::2]):
+        prefix = SECTION_PREFIXES.get(section_name)
+        if prefix is None or not chunks[-1].endswith(prefix):
+            return None
+        # The prefix belongs to the section content, not to the static chunk
+        chunks[-1] = chunks[-1][:-len(prefix)]
+        chunks.append(chunk)
+
+    # Every section must fill exactly one slot
+    if sorted(slots) != sorted(SECTION_PATTERNS):
+        return None
+
+    return CompiledTemplate(chunks, slots)
+
+
+def render_sections(template, sections):
+    """
+    Render formatted sections into template text, using the compiled form when possible.
+
+    Args:
+        template (str): LaTeX template content
+        sections (dict): Formatted LaTeX for each section name
+
+    Returns:
+        str: Populated LaTeX document
+    """
+    compiled = compile_template(template)
+    if compiled is None or not all(
+        sections[name].startswith(prefix) for name, prefix in SECTION_PREFIXES.items()
+    ):
+        return substitute_sections(template, sections)
+    return compiled.render(sections)
+
+
+_template_cache = {}
+_template_cache_lock = threading.Lock()
+
+
+def load_template(template_path):
+    """
+    Read a template file, reusing the cached text until the file changes on disk.
+
+    Args:
+        template_path (str): Path to the LaTeX template file
+
+    Returns:
+        str: Content of the template file
+    """
+    template_path = os.path.abspath(str(template_path))
+    stat = os.stat(template_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    with _template_cache_lock:
+        cached = _template_cache.get(template_path)
+        if cached and cached[0] == version:
+            return cached[1]
+
+    with open(template_path, 'r', encoding='utf-8') as file:
+        template = file.read()
+
+    with _template_cache_lock:
+        _template_cache[template_path] = (version, template)
+    return template
@@ -0,0 +1,41 @@
+"""Minimal hand-built PDFs for the extraction and upload tests."""
+
+
+def make_pdf(pages, padding=0):
+    """
+    Build a PDF with one Helvetica text line per entry of each page.
+
+    Args:
+        pages (list): Lines of text per page; an empty list makes a page without text
+        padding (int): Size of an unreferenced stream appended to make the file larger
+
+    Returns:
+        bytes: The PDF file content
+    """
+    page_ids = [3 + 2 * index for index in range(len(pages))]
+    font_id = 3 + 2 * len(pages)
+    objects = {
+        1: "<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{' '.join(f'{page_id} 0 R' for page_id in page_ids)}] /Count {len(pages)} >>",
+        font_id: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for page_id, lines in zip(page_ids, pages):
+        content = "BT /F1 12 Tf 72 720 Td " + " ".join(f"({line}) Tj 0 -14 Td" for line in lines) + " ET"
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {page_id + 1} 0 R "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> >>"
+        )
+        objects[page_id + 1] = f"<< /Length {len(content)} >>\nstream\n{content}\nendstream"
+    if padding:
+        objects[font_id + 1] = f"<< /Length {padding} >>\nstream\n{'x' * padding}\nendstream"
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for object_id in sorted(objects):
+        offsets.append(len(pdf))
+        pdf += f"{object_id} 0 obj\n{objects[object_id]}\nendobj\n".encode()
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return pdf
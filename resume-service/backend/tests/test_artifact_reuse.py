@@ -0,0 +1,67 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from pdf_generator import generate_pdf
+from pdf_generator.artifact_store import ArtifactStore
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "rendering"
+
+
+@pytest.fixture
+def build_env(tmp_path, monkeypatch):
+    pdf_dir = tmp_path / "pdfs"
+    latex_dir = tmp_path / "latex"
+    pdf_dir.mkdir()
+    latex_dir.mkdir()
+    store = ArtifactStore(tmp_path / "artifacts.sqlite3", [pdf_dir, latex_dir], 1024 * 1024)
+    compiled = []
+
+    def fake_compile(latex_path, output_pdf=None, verbose=False):
+        compiled.append(output_pdf)
+        Path(output_pdf).write_bytes(b"%PDF-1.4 " + Path(latex_path).read_bytes())
+        return True
+
+    monkeypatch.setattr(generate_pdf, "PDF_OUTPUT_DIR", pdf_dir)
+    monkeypatch.setattr(generate_pdf, "LATEX_OUTPUT_DIR", latex_dir)
+    monkeypatch.setattr(generate_pdf, "get_artifact_store", lambda managed_dirs: store)
+    monkeypatch.setattr(generate_pdf, "compile_latex_to_pdf", fake_compile)
+    return pdf_dir, compiled
+
+
+def load_resume():
+    name = sorted(FIXTURES_DIR.glob("*.json"))[0]
+    with open(name, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_identical_latex_under_another_name_gets_its_own_pdf(build_env):
+    pdf_dir, compiled = build_env
+    resume_data = load_resume()
+
+    first = generate_pdf.build_resume_pdf(resume_data, output_filename="resume_first")
+    second = generate_pdf.build_resume_pdf(resume_data, output_filename="resume_second")
+
+    assert len(compiled) == 1
+    assert second["content_hash"] == first["content_hash"]
+    assert second["output_filename"] == "resume_second"
+    assert second["pdf_path"] == str(pdf_dir / "resume_second.pdf")
+    assert Path(second["pdf_path"]).read_bytes() == Path(first["pdf_path"]).read_bytes()
+    # S3 objects are named after the resume, so the new name needs its own upload
+    assert second["s3_pdf_url"] is None
+
+
+def test_identical_latex_under_the_same_name_reuses_s3_urls(build_env):
+    _, compiled = build_env
+    resume_data = load_resume()
+
+    first = generate_pdf.build_resume_pdf(resume_data, output_filename="resume_first")
+    generate_pdf.get_artifact_store(None).update_s3_urls(
+        first["content_hash"], "https://bucket/resume_first.pdf", "https://bucket/resume_first.tex"
+    )
+    again = generate_pdf.build_resume_pdf(resume_data, output_filename="resume_first")
+
+    assert len(compiled) == 1
+    assert again["pdf_path"] == first["pdf_path"]
+    assert again["s3_pdf_url"] == "https://bucket/resume_first.pdf"
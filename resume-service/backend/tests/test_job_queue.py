@@ -0,0 +1,80 @@
+import os
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from pdf_generator.job_queue import (
+    JOB_COMPLETED, JOB_QUEUED, JOB_RUNNING, JobQueue, JobQueueBusy, MemoryJobStore, SQLiteJobStore
+)
+from pdf_samples import make_pdf
+
+# main refuses to import without an API key; no AI call is made by these tests
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+import main  # noqa: E402
+
+
+@pytest.fixture
+def full_queue():
+    # One slot, taken by a job that keeps the worker busy
+    job_queue = JobQueue(MemoryJobStore(), max_workers=1, max_pending=1)
+    job_queue.submit("sleep", time.sleep, 2)
+    yield job_queue
+    job_queue.shutdown(wait=False)
+
+
+def test_submit_raises_busy_when_queue_is_full(full_queue):
+    with pytest.raises(JobQueueBusy):
+        full_queue.submit("sleep", time.sleep, 0)
+
+
+def test_submit_waits_for_a_free_slot():
+    job_queue = JobQueue(MemoryJobStore(), max_workers=1, max_pending=1)
+    try:
+        job_queue.submit("sleep", time.sleep, 0.2)
+        job_id = job_queue.submit("sleep", time.sleep, 0, submit_timeout=30)
+        assert job_queue.get_job(job_id) is not None
+    finally:
+        job_queue.shutdown(wait=True)
+
+
+def wait_for_status(job_queue, job_id, status, timeout=10):
+    deadline = time.monotonic() + timeout
+    while job_queue.get_job(job_id)["status"] != status:
+        assert time.monotonic() < deadline, f"job {job_id} never became {status}"
+        time.sleep(0.02)
+
+
+def test_shared_store_marks_jobs_running_only_once_started(tmp_path):
+    store = SQLiteJobStore(tmp_path / "jobs.sqlite3")
+    job_queue = JobQueue(store, max_workers=1)
+    try:
+        first = job_queue.submit("sleep", time.sleep, 1)
+        second = job_queue.submit("sleep", time.sleep, 0)
+        wait_for_status(job_queue, first, JOB_RUNNING)
+
+        # Handed to the busy worker already (its future runs), but not started
+        assert job_queue.get_future(second).running()
+        assert store.get(second)["status"] == JOB_QUEUED
+
+        wait_for_status(job_queue, second, JOB_COMPLETED)
+        assert store.get(first)["status"] == JOB_COMPLETED
+    finally:
+        job_queue.shutdown(wait=True)
+
+
+def test_customize_resume_answers_503_when_pdf_queue_is_full(monkeypatch, full_queue):
+    monkeypatch.setattr(main, "get_job_queue", lambda: full_queue)
+    monkeypatch.setattr(main, "extract_job_description_data", lambda text: {"company": "Acme"})
+    monkeypatch.setattr(main, "extract_resume_data", lambda text: {"personal_info": {"name": "Jane Doe"}})
+    monkeypatch.setattr(main, "tailor_resume_for_job", lambda resume, job: resume)
+
+    client = TestClient(main.app)
+    response = client.post(
+        "/customize-resume/",
+        data={"job_description_text": "Engineer at Acme"},
+        files={"resume": ("resume.pdf", make_pdf([["Jane Doe"]]), "application/pdf")}
+    )
+
+    assert response.status_code == 503
+    assert "busy" in response.json()["detail"]
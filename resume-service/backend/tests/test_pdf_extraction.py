@@ -0,0 +1,46 @@
+import io
+
+import pytest
+
+import pdf_extraction
+from pdf_samples import make_pdf
+
+
+@pytest.fixture(autouse=True)
+def empty_text_cache(monkeypatch):
+    monkeypatch.setattr(pdf_extraction, "_text_cache", type(pdf_extraction._text_cache)())
+
+
+def test_pdf_without_text_extracts_blank_text():
+    # A scanned resume has pages but no text layer
+    text = pdf_extraction.extract_text(make_pdf([[], []]))
+    assert text.strip() == ""
+
+
+def test_unreadable_pdf_raises_value_error():
+    with pytest.raises(ValueError):
+        pdf_extraction.extract_text(b"%PDF-1.4\nnot really a pdf")
+
+
+def test_pdfminer_pages_match_high_level_extract_text():
+    backend = pdf_extraction.BACKENDS_BY_NAME["pdfminer"]
+    if not backend.is_available():
+        pytest.skip("pdfminer.six is not installed")
+    from pdfminer.high_level import extract_text
+
+    data = make_pdf([["Jane Doe"], [], ["Experience", "Python engineer"], ["Education"]])
+    expected = [extract_text(io.BytesIO(data), page_numbers=[index]) for index in range(1, 4)]
+    assert backend.extract_pages(data, 1, 4) == expected
+
+
+@pytest.mark.parametrize("backend", pdf_extraction.available_backends(), ids=lambda backend: backend.name)
+def test_long_pdf_pages_extracted_in_parallel_match_serial_extraction(backend):
+    pages = [[f"Page {number}", "Python engineer"] for number in range(1, 9)]
+    assert len(pages) >= pdf_extraction.PARALLEL_PAGE_THRESHOLD
+    data = make_pdf(pages)
+
+    parallel = pdf_extraction.extract_pages_with_backend(backend, memoryview(data))
+
+    assert pdf_extraction._executor is not None
+    assert parallel == backend.extract_pages(data, 0, len(pages))
+    assert [text for text in parallel if "Page 8" in text]
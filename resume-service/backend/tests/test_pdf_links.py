@@ -0,0 +1,53 @@
+import os
+from functools import partial
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from fastapi.testclient import TestClient
+
+from http_utils import CACHE_CONTROL_IMMUTABLE
+from pdf_generator.job_queue import JobQueue, MemoryJobStore
+from pdf_samples import make_pdf
+
+# main refuses to import without an API key; no AI call is made by these tests
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+import main  # noqa: E402
+
+
+def write_artifacts(resume_data, output_filename, output_dir):
+    pdf_path = Path(output_dir) / "pdfs" / f"{output_filename}.pdf"
+    pdf_path.parent.mkdir(exist_ok=True)
+    pdf_path.write_bytes(make_pdf([[resume_data["personal_info"]["name"]]]))
+    return {"pdf_path": str(pdf_path), "s3_pdf_url": None, "json_path": None, "s3_json_url": None}
+
+
+def test_customize_resume_returns_pinned_pdf_urls(monkeypatch, tmp_path):
+    job_queue = JobQueue(MemoryJobStore(), max_workers=1)
+    monkeypatch.setattr(main, "OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(main, "get_job_queue", lambda: job_queue)
+    # Runs on the worker pool, so it must pickle
+    monkeypatch.setattr(main, "generate_resume_artifacts", partial(write_artifacts, output_dir=str(tmp_path)))
+    monkeypatch.setattr(main, "extract_job_description_data", lambda text: {"company": "Acme"})
+    monkeypatch.setattr(main, "extract_resume_data", lambda text: {"personal_info": {"name": "Jane Doe"}})
+    monkeypatch.setattr(main, "tailor_resume_for_job", lambda resume, job: resume)
+
+    client = TestClient(main.app)
+    try:
+        response = client.post(
+            "/customize-resume/",
+            data={"job_description_text": "Engineer at Acme"},
+            files={"resume": ("resume.pdf", make_pdf([["Jane Doe"]]), "application/pdf")}
+        )
+    finally:
+        job_queue.shutdown(wait=True)
+
+    assert response.status_code == 200
+    body = response.json()
+    query = parse_qs(urlsplit(body["view_url"]).query)
+    assert query["path"] == [os.path.join("pdfs", Path(body["pdf_path"]).name)]
+    assert body["download_url"] == body["view_url"].replace("/view-pdf/", "/download-pdf/")
+
+    pdf = client.get(body["view_url"])
+    assert pdf.status_code == 200
+    assert pdf.headers["etag"] == f'"{query["v"][0]}"'
+    assert pdf.headers["cache-control"] == CACHE_CONTROL_IMMUTABLE
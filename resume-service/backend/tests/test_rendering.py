@@ -0,0 +1,63 @@
+"""
+Golden-output tests for LaTeX rendering.
+
+Each tests/fixtures/rendering/<name>.json resume is rendered into the default
+template and compared byte for byte with <name>.tex, which was produced by the
+original formatters and regex substitution pipeline. Escaping, the section
+formatters and the compiled template must all keep their output unchanged.
+
+After an intended change to the generated LaTeX, regenerate the golden files
+(and review their diff) with:
+    python -m tests.test_rendering --update
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from pdf_generator.json_to_pdf import format_sections, populate_template
+from pdf_generator.latex_engine import DEFAULT_TEMPLATE_FILE
+from pdf_generator.template_compiler import load_template, substitute_sections
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "rendering"
+CASES = sorted(path.stem for path in FIXTURES_DIR.glob("*.json"))
+
+
+def load_case(name):
+    with open(FIXTURES_DIR / f"{name}.json", encoding="utf-8") as f:
+        resume_data = json.load(f)
+    with open(FIXTURES_DIR / f"{name}.tex", encoding="utf-8", newline="") as f:
+        golden = f.read()
+    return resume_data, golden
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_populate_template_matches_golden(name):
+    resume_data, golden = load_case(name)
+    assert populate_template(load_template(DEFAULT_TEMPLATE_FILE), resume_data) == golden
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_substitution_fallback_matches_golden(name):
+    # Used when the template cannot be compiled into slots
+    resume_data, golden = load_case(name)
+    template = load_template(DEFAULT_TEMPLATE_FILE)
+    assert substitute_sections(template, format_sections(resume_data)) == golden
+
+
+def update_golden_files():
+    template = load_template(DEFAULT_TEMPLATE_FILE)
+    for name in CASES:
+        with open(FIXTURES_DIR / f"{name}.json", encoding="utf-8") as f:
+            resume_data = json.load(f)
+        with open(FIXTURES_DIR / f"{name}.tex", "w", encoding="utf-8", newline="") as f:
+            f.write(populate_template(template, resume_data))
+        print(f"Updated {name}.tex")
+
+
+if __name__ == "__main__":
+    if "--update" not in sys.argv:
+        raise SystemExit("Usage: python -m tests.test_rendering --update")
+    update_golden_files()
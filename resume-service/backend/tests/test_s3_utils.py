@@ -0,0 +1,23 @@
+from botocore.exceptions import EndpointConnectionError
+
+from pdf_generator import s3_utils
+
+
+def fake_upload(fileobj, bucket_name, object_name, content_type=None):
+    if object_name.endswith(".tex"):
+        raise EndpointConnectionError(endpoint_url="https://s3.example.com")
+    return f"s3://{bucket_name}/{object_name}"
+
+
+def test_failed_upload_keeps_the_other_urls(monkeypatch):
+    monkeypatch.setattr(s3_utils, "upload_fileobj_to_s3", fake_upload)
+    uploads = [
+        (b"%PDF", "resumes/a.pdf", "application/pdf"),
+        (b"\\documentclass", "latex/a.tex", "application/x-tex"),
+        (b"{}", "json/a.json", "application/json"),
+    ]
+
+    assert s3_utils.upload_buffers_to_s3(uploads, "bucket") == [
+        "s3://bucket/resumes/a.pdf", None, "s3://bucket/json/a.json"
+    ]
+    assert s3_utils.upload_buffers_to_s3(uploads[1:2], "bucket") == [None]
@@ -0,0 +1,87 @@
+import asyncio
+import tempfile
+
+import httpx
+import pytest
+from fastapi import FastAPI, File, Form, UploadFile
+from starlette.datastructures import UploadFile as SpooledUpload
+
+import pdf_extraction
+from uploads import UploadSizeLimitMiddleware, pdf_upload_view
+from pdf_samples import make_pdf
+
+LIMIT = 64 * 1024
+
+
+def upload_app():
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, max_bytes=LIMIT, path_prefixes=("/upload/",))
+
+    @app.post("/upload/")
+    async def upload(note: str = Form(...), resume: UploadFile = File(...)):
+        return {"note": note, "size": len(await resume.read())}
+
+    return app
+
+
+def multipart_body(size):
+    boundary = "testboundary"
+    body = (
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"note\"\r\n\r\nhello\r\n"
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"resume\"; filename=\"r.pdf\"\r\n"
+        f"Content-Type: application/pdf\r\n\r\n"
+    ).encode() + b"x" * size + f"\r\n--{boundary}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+def post(body, content_type, chunked):
+    async def chunks():
+        for start in range(0, len(body), 8192):
+            yield body[start:start + 8192]
+
+    async def send():
+        transport = httpx.ASGITransport(app=upload_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(
+                "/upload/",
+                content=chunks() if chunked else body,
+                headers={"content-type": content_type}
+            )
+
+    return asyncio.run(send())
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_accepts_upload_within_limit(chunked):
+    body, content_type = multipart_body(LIMIT // 2)
+    response = post(body, content_type, chunked)
+    assert response.status_code == 200
+    assert response.json() == {"note": "hello", "size": LIMIT // 2}
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_rejects_oversized_upload_with_413(chunked):
+    body, content_type = multipart_body(LIMIT * 2)
+    response = post(body, content_type, chunked)
+    assert response.status_code == 413
+    assert "larger than" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("backend", ["pypdfium2", "pypdf2", "pdfminer"])
+@pytest.mark.parametrize("padding", [0, 2 * 1024 * 1024])
+def test_pdf_upload_view_can_be_closed_after_extraction(monkeypatch, backend, padding):
+    # The padded PDF rolls the 1 MB spool over to disk, so it is read through an mmap
+    if not pdf_extraction.BACKENDS_BY_NAME[backend].is_available():
+        pytest.skip(f"{backend} is not installed")
+    monkeypatch.setenv("PDF_EXTRACTION_BACKEND", backend)
+    monkeypatch.setattr(pdf_extraction, "_text_cache", type(pdf_extraction._text_cache)())
+
+    spool = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    spool.write(make_pdf([["Jane Doe", "Python engineer"]], padding=padding))
+    spool.seek(0)
+
+    with pdf_upload_view(SpooledUpload(spool)) as content:
+        text = pdf_extraction.extract_text(content)
+    spool.close()
+
+    assert "Jane Doe" in text
@@ -0,0 +1,60 @@
+import hashlib
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+# main refuses to import without an API key; no AI call is made by these tests
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+import main  # noqa: E402
+
+
+class FakeBody:
+    def __init__(self, content):
+        self.content = content
+
+    def iter_chunks(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def s3_objects(monkeypatch):
+    objects = {}
+
+    def head(bucket_name, object_name):
+        content = objects.get((bucket_name, object_name))
+        if content is None:
+            return None
+        return {"ETag": f'"{hashlib.md5(content).hexdigest()}"', "ContentLength": len(content)}
+
+    def open_object(bucket_name, object_name, byte_range=None):
+        metadata = head(bucket_name, object_name)
+        if metadata is None:
+            return None
+        return {**metadata, "Body": FakeBody(objects[(bucket_name, object_name)])}
+
+    monkeypatch.setattr(main, "head_s3_object", head)
+    monkeypatch.setattr(main, "open_s3_object", open_object)
+    monkeypatch.setattr(main, "latex_source_cache", type(main.latex_source_cache)())
+    return objects
+
+
+def test_regenerated_latex_is_not_served_from_the_cache(s3_objects):
+    client = TestClient(main.app)
+    params = {"s3_url": "s3://bucket/resumes/jane.pdf"}
+
+    s3_objects[("bucket", "latex/jane.tex")] = b"\\section{Old}"
+    assert client.get("/view-latex/", params=params).content == b"\\section{Old}"
+    assert client.get("/view-latex/", params=params).content == b"\\section{Old}"
+
+    s3_objects[("bucket", "latex/jane.tex")] = b"\\section{Regenerated}"
+    assert client.get("/view-latex/", params=params).content == b"\\section{Regenerated}"
+
+
+def test_missing_latex_answers_404(s3_objects):
+    response = TestClient(main.app).get("/view-latex/", params={"s3_url": "s3://bucket/resumes/nobody.pdf"})
+    assert response.status_code == 404
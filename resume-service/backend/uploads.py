@@ -0,0 +1,146 @@
+"""
+Upload Handling
+
+Keeps uploaded resume PDFs out of Python bytes objects. Starlette already
+spools multipart uploads into a SpooledTemporaryFile; pdf_upload_view() exposes
+that spool as a memoryview (of the in-memory buffer, or of a read-only mmap once
+it has rolled over to disk) so the PDF parser reads the upload in place.
+
+UploadSizeLimitMiddleware rejects oversized request bodies with 413 before
+they are parsed: immediately from Content-Length when the client sends one,
+otherwise as soon as the streamed body exceeds the limit.
+
+Configuration (environment variables):
+    MAX_UPLOAD_BYTES: Largest accepted request body in bytes (default: 12 MB)
+"""
+
+import os
+import mmap
+import json
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(12 * 1024 * 1024)))
+
+
+class UploadSizeLimitMiddleware:
+    """
+    ASGI middleware enforcing a maximum request body size on upload routes.
+
+    Args:
+        app: ASGI application
+        max_bytes (int): Largest accepted request body
+        path_prefixes (tuple): Only requests whose path starts with one of these are checked
+    """
+
+    def __init__(self, app, max_bytes=MAX_UPLOAD_BYTES, path_prefixes=("/",)):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.path_prefixes = tuple(path_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        # Reject up front when the declared length is already too large
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                try:
+                    declared = int(value)
+                except ValueError:
+                    declared = 0
+                if declared > self.max_bytes:
+                    await self._reject(send)
+                    return
+                break
+
+        received = 0
+        exceeded = False
+        rejected = False
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received, exceeded, rejected
+            if exceeded:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # Answer here rather than raising into the app, where the body
+                    # parser would turn the error into a 400; the app then sees a
+                    # disconnected client and stops reading
+                    exceeded = True
+                    if not response_started:
+                        rejected = True
+                        await self._reject(send)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message):
+            nonlocal response_started
+            # Whatever the app answers after the 413 has nowhere to go
+            if rejected:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not rejected:
+                raise
+
+    async def _reject(self, send):
+        logger.warning(f"Rejected request body larger than {self.max_bytes} bytes")
+        body = json.dumps({"detail": f"Request body is larger than {self.max_bytes} bytes"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode())
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+@contextmanager
+def pdf_upload_view(upload):
+    """
+    Expose an uploaded file's spooled content as a read-only memoryview.
+
+    The view must not be used after the block exits; it is released there so
+    the upload can be closed afterwards.
+
+    Args:
+        upload: FastAPI UploadFile
+
+    Yields:
+        memoryview: Content of the upload
+    """
+    spool = upload.file
+    # SpooledTemporaryFile keeps small files in memory until it rolls over;
+    # calling fileno() would force that rollover, so check which one it is
+    in_memory = getattr(spool, "_rolled", True) is False
+    backing = spool._file if in_memory else spool
+
+    if in_memory:
+        view = backing.getbuffer().toreadonly()
+        mapping = None
+    else:
+        backing.flush()
+        size = os.fstat(backing.fileno()).st_size
+        mapping = mmap.mmap(backing.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        view = memoryview(mapping) if mapping is not None else memoryview(b"")
+
+    try:
+        yield view
+    finally:
+        view.release()
+        if mapping is not None:
+            mapping.close()
@@ -16,8 +16,10 @@ const ResultDisplay: React.FC<ResultDisplayProps> = ({ result, onReset, apiBaseU
     if (result.s3_pdf_url) {
       // Use S3 URL if available
       window.open(`${apiBaseUrl}/download-pdf/?s3_url=${encodeURIComponent(result.s3_pdf_url)}`, '_blank');
+    } else if (result.download_url) {
+      // Fall back to the local PDF, pinned to its content so the browser can cache it
+      window.open(`${apiBaseUrl}${result.download_url}`, '_blank');
     } else if (result.pdf_path) {
-      // Fall back to local path
       window.open(`${apiBaseUrl}/download-pdf/?path=${result.pdf_path}`, '_blank');
     }
   };
@@ -26,8 +28,10 @@ const ResultDisplay: React.FC<ResultDisplayProps> = ({ result, onReset, apiBaseU
     if (result.s3_pdf_url) {
       // Use S3 URL if available
       window.open(`${apiBaseUrl}/view-pdf/?s3_url=${encodeURIComponent(result.s3_pdf_url)}`, '_blank');
+    } else if (result.view_url) {
+      // Fall back to the local PDF, pinned to its content so the browser can cache it
+      window.open(`${apiBaseUrl}${result.view_url}`, '_blank');
     } else if (result.pdf_path) {
-      // Fall back to local path
       window.open(`${apiBaseUrl}/view-pdf/?path=${result.pdf_path}`, '_blank');
     }
   };
@@ -61,6 +61,8 @@ export interface CustomizeResumeResponse {
   success: boolean;
   customized_resume?: ParsedResume;
   pdf_path?: string;
+  view_url?: string;
+  download_url?: string;
   s3_pdf_url?: string;
   json_path?: string;
   s3_json_url?: string;